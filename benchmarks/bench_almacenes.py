@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los almacenes del inventario (memoria y SQLite).
+
+Carga N muebles en cada almacén y mide la carga, los filtros por nombre,
+precio y material y, para SQLite, el reinicio de la tienda sobre la base.
+
+Uso:
+    python benchmarks/bench_almacenes.py --muebles 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src"), os.path.dirname(os.path.abspath(__file__))]
+
+from bench_instantanea import crear_mueble  # noqa: E402
+from services.almacenes import AlmacenMemoria, AlmacenSQLite  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def medir(descripcion: str, funcion):
+    """Ejecuta la función, imprime el tiempo y retorna su resultado."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    print(f"  {descripcion:<28} {time.perf_counter() - inicio:8.3f} s")
+    return resultado
+
+
+def probar(nombre: str, almacen, muebles: int) -> None:
+    """Mide carga y filtros sobre un almacén."""
+    print(nombre)
+    tienda = TiendaMuebles(almacen=almacen)
+    medir("carga en lote", lambda: tienda.agregar_muebles_lote([crear_mueble(i) for i in range(muebles)]))
+    medir("buscar 'silla 123'", lambda: tienda.buscar_muebles_por_nombre("silla 123"))
+    medir("filtrar precio 100-101", lambda: tienda.filtrar_por_precio(100, 101))
+    medir("filtrar material vidrio", lambda: tienda.filtrar_por_material("vidrio"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--muebles", type=int, default=200_000)
+    args = parser.parse_args()
+
+    probar("Memoria", AlmacenMemoria(), args.muebles)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "inventario.db")
+        almacen = AlmacenSQLite(ruta)
+        probar("SQLite", almacen, args.muebles)
+        almacen.cerrar()
+        almacen = AlmacenSQLite(ruta)
+        medir("reinicio sobre la base", lambda: TiendaMuebles(almacen=almacen))
+        almacen.cerrar()
+
+
+if __name__ == "__main__":
+    main()
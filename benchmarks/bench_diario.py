@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark de recuperación del diario de ventas.
+
+Escribe un diario con N ventas y mide cuánto tarda TiendaMuebles en
+reproducirlo al iniciar.
+
+Uso:
+    python benchmarks/bench_diario.py --registros 10000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from services.diario import DiarioVentas  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def escribir_diario(ruta: str, registros: int, lote_fsync: int) -> float:
+    """Escribe el diario de prueba y retorna el tiempo empleado."""
+    inicio = time.perf_counter()
+    with DiarioVentas(ruta, lote_fsync=lote_fsync) as diario:
+        for i in range(registros):
+            diario.registrar(
+                {
+                    "mueble": f"Silla {i}",
+                    "cliente": "Cliente Anónimo",
+                    "precio_original": 100.0 + i % 1000,
+                    "descuento": 10.0,
+                    "precio_final": round((100.0 + i % 1000) * 0.9, 2),
+                    "fecha": "2024-01-01 12:00:00",
+                }
+            )
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registros", type=int, default=1_000_000)
+    parser.add_argument("--lote-fsync", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "ventas.diario")
+        escritura = escribir_diario(ruta, args.registros, args.lote_fsync)
+        tamaño = os.path.getsize(ruta)
+
+        inicio = time.perf_counter()
+        tienda = TiendaMuebles(diario=DiarioVentas(ruta))
+        recuperacion = time.perf_counter() - inicio
+
+        stats = tienda.obtener_estadisticas()
+        assert stats["ventas_realizadas"] == args.registros
+
+    print(f"Registros:      {args.registros:,}")
+    print(f"Tamaño:         {tamaño / 1e6:,.1f} MB")
+    print(f"Escritura:      {escritura:.2f} s (fsync cada {args.lote_fsync} registros)")
+    print(f"Recuperación:   {recuperacion:.2f} s")
+    print(f"Por registro:   {recuperacion / args.registros * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga del servicio HTTP de la tienda.
+
+Levanta el servidor en un proceso aparte con N muebles y lanza C clientes,
+cada uno en su propio proceso con una conexión persistente, que piden
+páginas del catálogo (revalidando con ETag), búsquedas y estadísticas.
+Reporta peticiones por segundo y latencias p50/p99.
+
+Uso:
+    python benchmarks/bench_http.py --muebles 10000 --clientes 4 --peticiones 2000
+    python benchmarks/bench_http.py --url http://127.0.0.1:8000   # servidor externo
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src"), os.path.dirname(os.path.abspath(__file__))]
+
+from bench_instantanea import crear_mueble  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+from ui.servidor import ServidorTienda  # noqa: E402
+
+
+def servidor(muebles: int, listo) -> None:
+    """Proceso del servidor: carga la tienda y avisa el puerto elegido."""
+    tienda = TiendaMuebles(concurrente=True)
+    tienda.agregar_muebles_lote([crear_mueble(i) for i in range(muebles)])
+    with ServidorTienda(("127.0.0.1", 0), tienda) as http_servidor:
+        listo.put(http_servidor.server_port)
+        http_servidor.serve_forever()
+
+
+def cliente(argumentos) -> list:
+    """Proceso cliente: hace las peticiones y retorna sus latencias en segundos."""
+    host, puerto, peticiones, semilla = argumentos
+    rutas = [
+        "/muebles?cursor={}",
+        "/muebles?cursor={}",
+        "/muebles?nombre=silla%20{}",
+        "/muebles?precio_min={}&precio_max=200",
+        "/estadisticas",
+    ]
+    etags = {}
+    latencias = []
+    conexion = http.client.HTTPConnection(host, puerto)
+    for i in range(peticiones):
+        ruta = rutas[(i + semilla) % len(rutas)].format((i * 7 + semilla) % 20 + 1)
+        cabeceras = {"If-None-Match": etags[ruta]} if ruta in etags else {}
+        inicio = time.perf_counter()
+        conexion.request("GET", ruta, headers=cabeceras)
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        latencias.append(time.perf_counter() - inicio)
+        if respuesta.status not in (200, 304):
+            raise RuntimeError(f"{ruta}: estado {respuesta.status}")
+        if respuesta.getheader("ETag"):
+            etags[ruta] = respuesta.getheader("ETag")
+    conexion.close()
+    return latencias
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil p (0-100) de una lista ordenada."""
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--muebles", type=int, default=10_000)
+    parser.add_argument("--clientes", type=int, default=4)
+    parser.add_argument("--peticiones", type=int, default=2_000, help="peticiones por cliente")
+    parser.add_argument("--url", help="usar un servidor ya levantado en lugar de crear uno")
+    args = parser.parse_args()
+
+    proceso = None
+    if args.url:
+        partes = urlsplit(args.url)
+        host, puerto = partes.hostname, partes.port or 80
+    else:
+        listo = multiprocessing.Queue()
+        proceso = multiprocessing.Process(target=servidor, args=(args.muebles, listo), daemon=True)
+        proceso.start()
+        host, puerto = "127.0.0.1", listo.get()
+        print(f"Servidor con {args.muebles} muebles en el puerto {puerto}")
+
+    try:
+        with multiprocessing.Pool(args.clientes) as pool:
+            inicio = time.perf_counter()
+            resultados = pool.map(
+                cliente, [(host, puerto, args.peticiones, c) for c in range(args.clientes)]
+            )
+            duracion = time.perf_counter() - inicio
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+
+    latencias = sorted(latencia for lista in resultados for latencia in lista)
+    print(f"Peticiones:     {len(latencias)} con {args.clientes} clientes persistentes")
+    print(f"Peticiones/s:   {len(latencias) / duracion:10.0f}")
+    print(f"Latencia media: {statistics.fmean(latencias) * 1000:10.2f} ms")
+    print(f"Latencia p50:   {percentil(latencias, 50) * 1000:10.2f} ms")
+    print(f"Latencia p99:   {percentil(latencias, 99) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
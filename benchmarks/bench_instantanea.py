@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la instantánea binaria del inventario.
+
+Crea una tienda con N muebles, la guarda en una instantánea y mide cuánto
+tarda en leerse el archivo y en restaurarse la tienda completa.
+
+Uso:
+    python benchmarks/bench_instantanea.py --muebles 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# Algunos modelos importan "src.models..." y otros "models...": se necesitan ambas rutas
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src")]
+
+from models.concretos.armario import Armario  # noqa: E402
+from models.concretos.mesa import Mesa  # noqa: E402
+from models.concretos.silla import Silla  # noqa: E402
+from models.concretos.sofa import Sofa  # noqa: E402
+from services.instantanea import leer_instantanea  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+MATERIALES = ("madera", "metal", "plástico", "vidrio")
+COLORES = ("blanco", "negro", "café", "gris", "rojo")
+
+
+def crear_mueble(i: int):
+    """Crea un mueble de prueba variando clase, material y color."""
+    material = MATERIALES[i % len(MATERIALES)]
+    color = COLORES[i % len(COLORES)]
+    precio = 50.0 + i % 1000
+    clase = i % 4
+    if clase == 0:
+        return Silla(f"Silla {i}", material, color, precio, tiene_ruedas=i % 2 == 0)
+    if clase == 1:
+        return Mesa(f"Mesa {i}", material, color, precio, capacidad_personas=4 + i % 4)
+    if clase == 2:
+        return Sofa(f"Sofá {i}", material, color, precio, capacidad_personas=2 + i % 3)
+    return Armario(f"Armario {i}", material, color, precio, 180, 100, 60, num_puertas=2 + i % 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--muebles", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    tienda = TiendaMuebles("Benchmark")
+    tienda.agregar_muebles_lote([crear_mueble(i) for i in range(args.muebles)])
+    construccion = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "inventario.instantanea")
+        inicio = time.perf_counter()
+        tienda.guardar_instantanea(ruta)
+        escritura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        objetos, _ = leer_instantanea(ruta)
+        lectura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        restaurada = TiendaMuebles.cargar_instantanea(ruta)
+        carga = time.perf_counter() - inicio
+        tamaño = os.path.getsize(ruta)
+
+    assert len(objetos) == args.muebles
+    assert restaurada.calcular_valor_inventario() == tienda.calcular_valor_inventario()
+    print(f"Muebles:        {args.muebles:,}")
+    print(f"Desde código:   {construccion:.2f} s (constructores + agregar_muebles_lote)")
+    print(f"Tamaño:         {tamaño / 1e6:.1f} MB")
+    print(f"Escritura:      {escritura:.2f} s")
+    print(f"Lectura:        {lectura:.2f} s (solo objetos)")
+    print(f"Carga completa: {carga:.2f} s (objetos + índices)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado del reporte de inventario con varios procesos.
+
+Mide generar_reporte_inventario() secuencial y los agregados paralelos con
+1..P procesos sobre un pool ya creado (sin contar el arranque), más el
+reporte completo en modo paralelo creando su propio pool.
+
+Uso:
+    python benchmarks/bench_reporte.py --muebles 1000000 --procesos 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src"), os.path.dirname(os.path.abspath(__file__))]
+
+from bench_instantanea import crear_mueble  # noqa: E402
+from services.reporte_paralelo import agregados_paralelos  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def medir(funcion, repeticiones: int = 3) -> float:
+    """Mejor tiempo de varias ejecuciones, en segundos."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--muebles", type=int, default=500_000)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    tienda = TiendaMuebles()
+    tienda.agregar_muebles_lote([crear_mueble(i) for i in range(args.muebles)])
+    columnar = tienda.instantanea_columnar()
+    limites = TiendaMuebles.LIMITES_PRECIO_REPORTE
+    print(f"{args.muebles} muebles, {os.cpu_count()} núcleos disponibles")
+
+    base = medir(tienda.generar_reporte_inventario)
+    print(f"  reporte secuencial             {base:8.3f} s")
+    print("  agregados paralelos (pool ya creado):")
+    for procesos in range(1, args.procesos + 1):
+        with ProcessPoolExecutor(procesos) as pool:
+            pool.submit(int).result()  # arrancar los procesos antes de medir
+            tiempo = medir(lambda: agregados_paralelos(columnar, limites, procesos, executor=pool))
+        print(f"    {procesos:2d} procesos                  {tiempo:8.3f} s  ({base / tiempo:4.2f}x)")
+    tiempo = medir(lambda: tienda.generar_reporte_inventario(procesos=args.procesos), 1)
+    etiqueta = f"reporte con {args.procesos} procesos (con arranque)"
+    print(f"  {etiqueta:<30} {tiempo:8.3f} s  ({base / tiempo:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ Punto de entrada principal para la aplicación Tienda de Muebles.
 Este archivo inicializa la aplicación y proporciona datos de ejemplo.
 """
 
+import os
+
+from services.diario import DiarioVentas
 from services.tienda import TiendaMuebles
 from ui.menu import MenuTienda
 
@@ -18,6 +21,17 @@ from models.concretos.cajonera import Cajonera
 from models.concretos.sofacama import SofaCama
 from models.composicion.comedor import Comedor
 
+# Versión del catálogo de ejemplo: aumentarla al modificar crear_catalogo_inicial()
+# o crear_comedores_ejemplo() para que no se siga cargando la instantánea anterior
+VERSION_CATALOGO = 1
+# Diario donde se registran las ventas para recuperarlas si el programa se cae
+RUTA_DIARIO_VENTAS = f"ventas-v{VERSION_CATALOGO}.diario"
+# Ventas entre cada fsync del diario (commit en grupo)
+LOTE_FSYNC_DIARIO = 1
+# Instantánea del catálogo: si existe se carga en lugar de crear los datos de
+# ejemplo; se vuelve a guardar al salir y el diario retira lo vendido después
+RUTA_INSTANTANEA_CATALOGO = f"catalogo-v{VERSION_CATALOGO}.instantanea"
+
 
 def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
     """
@@ -340,18 +354,39 @@ def main():
     - Herencia múltiple con el sofá-cama
     - Encapsulación y abstracción en toda la jerarquía
     """
+    diario = None
+    tienda = None
     try:
         print("🏠 Bienvenido a la Tienda de Muebles - Taller OOP 🏠")
         print("=" * 50)
 
-        tienda = TiendaMuebles("Mueblería Moderna OOP")
-        print(f"🏪 Inicializando {tienda.nombre}...")
-
-        crear_catalogo_inicial(tienda)
-
-        crear_comedores_ejemplo(tienda)
-
-        aplicar_descuentos_ejemplo(tienda)
+        existe_instantanea = os.path.exists(RUTA_INSTANTANEA_CATALOGO)
+        if not existe_instantanea and os.path.exists(RUTA_DIARIO_VENTAS):
+            # Ventas de un catálogo que ya no existe: se apartan en vez de reproducirlas
+            os.replace(RUTA_DIARIO_VENTAS, RUTA_DIARIO_VENTAS + ".anterior")
+        diario = DiarioVentas(RUTA_DIARIO_VENTAS, lote_fsync=LOTE_FSYNC_DIARIO)
+        if existe_instantanea:
+            tienda = TiendaMuebles.cargar_instantanea(
+                RUTA_INSTANTANEA_CATALOGO, diario=diario
+            )
+            print(
+                f"🏪 Catálogo de {tienda.nombre} cargado desde {RUTA_INSTANTANEA_CATALOGO}"
+            )
+        else:
+            tienda = TiendaMuebles("Mueblería Moderna OOP", diario=diario)
+            print(f"🏪 Inicializando {tienda.nombre}...")
+        ventas_recuperadas = tienda.obtener_estadisticas().get("ventas_realizadas", 0)
+        if ventas_recuperadas:
+            print(f"🧾 {ventas_recuperadas} ventas recuperadas del diario")
+
+        if not existe_instantanea:
+            crear_catalogo_inicial(tienda)
+
+            crear_comedores_ejemplo(tienda)
+
+            aplicar_descuentos_ejemplo(tienda)
+
+            tienda.guardar_instantanea(RUTA_INSTANTANEA_CATALOGO)
 
         mostrar_estadisticas_iniciales(tienda)
 
@@ -370,6 +405,11 @@ def main():
 
         traceback.print_exc()
     finally:
+        if tienda is not None:
+            # Guardar el inventario actual evita reproducir todas las ventas al iniciar
+            tienda.guardar_instantanea(RUTA_INSTANTANEA_CATALOGO)
+        if diario is not None:
+            diario.cerrar()
         print("\n" + "=" * 50)
         print("✨ Programa finalizado. ¡Gracias por usar la Tienda de Muebles! ✨")
 
@@ -66,6 +66,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("El número de compartimentos debe ser mayor a 0")
         self._num_compartimentos = value
+        self._notificar_cambio("num_compartimentos")
 
     @property
     def altura(self) -> float:
@@ -78,6 +79,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La altura debe ser mayor a 0")
         self._altura = value
+        self._notificar_cambio("altura")
 
     @property
     def ancho(self) -> float:
@@ -90,6 +92,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("El ancho debe ser mayor a 0")
         self._ancho = value
+        self._notificar_cambio("ancho")
 
     @property
     def profundidad(self) -> float:
@@ -102,6 +105,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La profundidad debe ser mayor a 0")
         self._profundidad = value
+        self._notificar_cambio("profundidad")
 
     def calcular_volumen(self) -> float:
         """
@@ -68,6 +68,7 @@ class Asiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._notificar_cambio("capacidad_personas")
 
     @property
     def tiene_respaldo(self) -> bool:
@@ -78,6 +79,7 @@ class Asiento(Mueble, ABC):
     def tiene_respaldo(self, value: bool) -> None:
         """Setter para respaldo."""
         self._tiene_respaldo = value
+        self._notificar_cambio("tiene_respaldo")
 
     @property
     def material_tapizado(self) -> str:
@@ -88,6 +90,7 @@ class Asiento(Mueble, ABC):
     def material_tapizado(self, value: str) -> None:
         """Setter para material de tapizado."""
         self._material_tapizado = value
+        self._notificar_cambio("material_tapizado")
 
     def calcular_factor_comodidad(self) -> float:
         """
@@ -60,6 +60,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El largo debe ser mayor a 0")
         self._largo = value
+        self._notificar_cambio("largo")
 
     @property
     def ancho(self) -> float:
@@ -72,6 +73,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El ancho debe ser mayor a 0")
         self._ancho = value
+        self._notificar_cambio("ancho")
 
     @property
     def altura(self) -> float:
@@ -84,6 +86,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("La altura debe ser mayor a 0")
         self._altura = value
+        self._notificar_cambio("altura")
 
     def calcular_area(self) -> float:
         """
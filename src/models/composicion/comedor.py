@@ -4,7 +4,7 @@ Un comedor está compuesto por una mesa y varias sillas.
 """
 
 # Importar List para anotaciones de tipo
-from typing import List
+from typing import Iterator, List
 # from ..concretos.mesa import Mesa
 # from ..concretos.silla import Silla
 
@@ -119,19 +119,28 @@ class Comedor:
         Returns:
             str: Descripción detallada del comedor
         """
-        descripcion = f"=== COMEDOR {self.nombre.upper()} ===\n\n"
-        descripcion += "MESA:\n"
-        descripcion += self._mesa.obtener_descripcion() + "\n\n"
+        return "".join(self.iterar_descripcion_completa())
+
+    def iterar_descripcion_completa(self) -> Iterator[str]:
+        """
+        Genera la descripción completa del comedor por partes, sin armarla
+        entera en memoria.
+
+        Yields:
+            str: Fragmentos consecutivos de la descripción
+        """
+        yield f"=== COMEDOR {self.nombre.upper()} ===\n\n"
+        yield "MESA:\n"
+        yield self._mesa.obtener_descripcion() + "\n\n"
         if self._sillas:
-            descripcion += f"SILLAS ({len(self._sillas)} unidades):\n"
+            yield f"SILLAS ({len(self._sillas)} unidades):\n"
             for i, silla in enumerate(self._sillas, 1):
-                descripcion += f"{i}. {silla.obtener_descripcion()}\n"
+                yield f"{i}. {silla.obtener_descripcion()}\n"
         else:
-            descripcion += "SILLAS: Ninguna incluida\n"
-        descripcion += f"\n--- PRECIO TOTAL: ${self.calcular_precio_total():.2f} ---"
+            yield "SILLAS: Ninguna incluida\n"
+        yield f"\n--- PRECIO TOTAL: ${self.calcular_precio_total():.2f} ---"
         if len(self._sillas) >= 4:
-            descripcion += "\n(Incluye 5% de descuento por set completo)"
-        return descripcion
+            yield "\n(Incluye 5% de descuento por set completo)"
 
     def obtener_resumen(self) -> dict:
         """
@@ -3,7 +3,8 @@ Clase concreta Armario.
 Representa un armario genérico.
 """
 
-from src.models.categorias.almacenamiento import Almacenamiento
+from ..categorias.almacenamiento import Almacenamiento
+from models.mueble import precio_memoizado
 
 
 class Armario(Almacenamiento):
@@ -59,6 +60,7 @@ class Armario(Almacenamiento):
         if value <= 0:
             raise ValueError("El número de puertas debe ser mayor a 0")
         self._num_puertas = value
+        self._notificar_cambio("num_puertas")
 
     @property
     def tipo_puertas(self) -> str:
@@ -71,7 +73,9 @@ class Armario(Almacenamiento):
         if value not in ["batientes", "corredizas"]:
             raise ValueError("Tipo de puertas debe ser uno de: batientes, corredizas")
         self._tipo_puertas = value
+        self._notificar_cambio("tipo_puertas")
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final del armario."""
         # Usar el factor provisto por la categoría Almacenamiento
@@ -3,7 +3,8 @@ Clase concreta Cajonera.
 Representa una cajonera genérica.
 """
 
-from src.models.categorias.almacenamiento import Almacenamiento
+from ..categorias.almacenamiento import Almacenamiento
+from models.mueble import precio_memoizado
 
 
 class Cajonera(Almacenamiento):
@@ -57,6 +58,7 @@ class Cajonera(Almacenamiento):
         if value <= 0:
             raise ValueError("El número de cajones debe ser mayor a 0")
         self._num_cajones = value
+        self._notificar_cambio("num_cajones")
         
     @property
     def tiene_ruedas(self) -> bool:
@@ -67,7 +69,9 @@ class Cajonera(Almacenamiento):
     def tiene_ruedas(self, value: bool) -> None:
         """Setter para si tiene ruedas."""
         self._tiene_ruedas = value
+        self._notificar_cambio("tiene_ruedas")
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final de la cajonera."""
         # Usar el factor de volumen calculado en la categoría
@@ -3,7 +3,9 @@ Clase concreta Cama.
 Representa una cama genérica.
 """
 
-from ..mueble import Mueble
+from models.mueble import Mueble, precio_memoizado
+
+
 class Cama(Mueble):
     """
     Clase concreta que representa una cama.
@@ -47,6 +49,7 @@ class Cama(Mueble):
         if value not in self.FACTORES_TAMAÑO:
             raise ValueError(f"Tamaño debe ser uno de: {list(self.FACTORES_TAMAÑO.keys())}")
         self._tamaño = value
+        self._notificar_cambio("tamaño")
 
     @property
     def incluye_colchon(self) -> bool:
@@ -56,6 +59,7 @@ class Cama(Mueble):
     def tiene_cabecera(self) -> bool:
         return self._tiene_cabecera
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         precio = self.precio_base
         precio *= self.FACTORES_TAMAÑO[self.tamaño]
@@ -3,7 +3,8 @@ Clase concreta Escritorio.
 Representa un escritorio genérico.
 """
 
-from src.models.categorias.superficies import Superficie
+from ..categorias.superficies import Superficie
+from models.mueble import precio_memoizado
 
 
 class Escritorio(Superficie):
@@ -58,6 +59,7 @@ class Escritorio(Superficie):
         if value not in ["estudiante", "ejecutivo", "esquinero"]:
             raise ValueError("Tipo de escritorio debe ser uno de: estudiante, ejecutivo, esquinero")
         self._tipo = value
+        self._notificar_cambio("tipo")
         
     @property
     def tiene_cajonera(self) -> bool:
@@ -68,6 +70,7 @@ class Escritorio(Superficie):
     def tiene_cajonera(self, value: bool) -> None:
         """Setter para si tiene cajonera."""
         self._tiene_cajonera = value
+        self._notificar_cambio("tiene_cajonera")
         
     @property
     def porta_teclado(self) -> bool:
@@ -78,7 +81,9 @@ class Escritorio(Superficie):
     def porta_teclado(self, value: bool) -> None:
         """Setter para si tiene porta teclado."""
         self._porta_teclado = value
+        self._notificar_cambio("porta_teclado")
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final del escritorio.
@@ -4,6 +4,7 @@ Representa una mesa genérica.
 """
 
 from ..categorias.superficies import Superficie
+from models.mueble import precio_memoizado
 
 
 class Mesa(Superficie):
@@ -48,6 +49,7 @@ class Mesa(Superficie):
         if value not in formas_validas:
             raise ValueError(f"Forma debe ser una de: {formas_validas}")
         self._forma = value
+        self._notificar_cambio("forma")
 
     @property
     def capacidad_personas(self) -> int:
@@ -60,7 +62,9 @@ class Mesa(Superficie):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._notificar_cambio("capacidad_personas")
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final de la mesa.
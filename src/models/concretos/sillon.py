@@ -3,7 +3,8 @@ Clase concreta Sillón.
 Implementa un mueble de asiento para una persona, con brazos y respaldo.
 """
 
-from src.models.categorias.asientos import Asiento
+from ..categorias.asientos import Asiento
+from models.mueble import precio_memoizado
 
 
 class Sillon(Asiento):
@@ -51,6 +52,7 @@ class Sillon(Asiento):
     def es_reclinable(self, value: bool) -> None:
         """Setter para reclinable."""
         self._es_reclinable = value
+        self._notificar_cambio("es_reclinable")
 
     @property
     def tiene_masajeador(self) -> bool:
@@ -61,7 +63,9 @@ class Sillon(Asiento):
     def tiene_masajeador(self, value: bool) -> None:
         """Setter para masajeador."""
         self._tiene_masajeador = value
+        self._notificar_cambio("tiene_masajeador")
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final del sillón."""
         precio = self.precio_base
@@ -4,6 +4,7 @@ Implementa un mueble de asiento para varias personas, sin brazos reclinables.
 """
 
 from ..categorias.asientos import Asiento
+from models.mueble import precio_memoizado
 
 
 class Sofa(Asiento):
@@ -53,6 +54,7 @@ class Sofa(Asiento):
         """Getter para cojines."""
         return self._incluye_cojines
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final del sofá."""
         precio = self.precio_base
@@ -5,6 +5,7 @@ Esta clase hereda tanto de Sofa como de Cama.
 
 from .sofa import Sofa
 from .cama import Cama
+from models.mueble import precio_memoizado
 
 
 class SofaCama(Sofa, Cama):
@@ -79,6 +80,7 @@ class SofaCama(Sofa, Cama):
         self._mecanismo_conversion = mecanismo_conversion
         self._modo_actual = "sofa"
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final del sofá cama combinando las características de ambas clases padre.
@@ -4,6 +4,38 @@ Este es el punto de partida de nuestra jerarquía de clases.
 """
 
 from abc import ABC, abstractmethod
+from functools import wraps
+
+# Contadores globales del caché de precios (compartidos por toda la jerarquía)
+_ESTADISTICAS_CACHE = {"aciertos": 0, "fallos": 0}
+
+
+def precio_memoizado(calcular_precio):
+    """
+    Decorador para calcular_precio() que guarda el resultado en el objeto.
+
+    El precio queda memoizado hasta que un setter lo invalide mediante
+    _notificar_cambio(). Las excepciones no se memoizan.
+
+    Args:
+        calcular_precio: Implementación concreta del cálculo de precio
+
+    Returns:
+        Función que consulta el caché antes de recalcular
+    """
+
+    @wraps(calcular_precio)
+    def envoltura(self):
+        precio = self.__dict__.get("_precio_cache")
+        if precio is not None:
+            _ESTADISTICAS_CACHE["aciertos"] += 1
+            return precio
+        _ESTADISTICAS_CACHE["fallos"] += 1
+        precio = calcular_precio(self)
+        self._precio_cache = precio
+        return precio
+
+    return envoltura
 
 
 class Mueble(ABC):
@@ -32,6 +64,71 @@ class Mueble(ABC):
         self._material = material
         self._color = color
         self._precio_base = precio_base
+        self._observadores = []
+        self._precio_cache = None
+
+    @staticmethod
+    def estadisticas_cache() -> dict:
+        """
+        Retorna los contadores del caché de precios de todos los muebles.
+
+        Returns:
+            dict: Aciertos, fallos y tasa de aciertos (0-1)
+        """
+        aciertos = _ESTADISTICAS_CACHE["aciertos"]
+        fallos = _ESTADISTICAS_CACHE["fallos"]
+        total = aciertos + fallos
+        return {
+            "aciertos": aciertos,
+            "fallos": fallos,
+            "tasa_aciertos": aciertos / total if total else 0.0,
+        }
+
+    @staticmethod
+    def reiniciar_estadisticas_cache() -> None:
+        """Pone en cero los contadores del caché de precios."""
+        _ESTADISTICAS_CACHE["aciertos"] = 0
+        _ESTADISTICAS_CACHE["fallos"] = 0
+
+    def invalidar_precio(self) -> None:
+        """
+        Descarta el precio memoizado para que se recalcule en la próxima consulta.
+        Los setters lo hacen automáticamente; sólo es necesario al modificar
+        atributos internos directamente.
+        """
+        self._precio_cache = None
+
+    def suscribir(self, observador) -> None:
+        """
+        Registra un observador que será notificado cuando cambie un atributo.
+
+        Args:
+            observador: Función que recibe (mueble, atributo)
+        """
+        self._observadores.append(observador)
+
+    def desuscribir(self, observador) -> None:
+        """
+        Elimina un observador previamente registrado.
+
+        Args:
+            observador: Función registrada con suscribir()
+        """
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def _notificar_cambio(self, atributo: str) -> None:
+        """
+        Invalida el precio memoizado y notifica a los observadores que un
+        atributo cambió mediante su setter.
+        Método protegido usado por los setters de toda la jerarquía.
+
+        Args:
+            atributo: Nombre de la propiedad modificada
+        """
+        self._precio_cache = None
+        for observador in list(self._observadores):
+            observador(self, atributo)
 
     @property
     def nombre(self) -> str:
@@ -44,6 +141,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El nombre no puede estar vacío")
         self._nombre = value.strip()
+        self._notificar_cambio("nombre")
 
     @property
     def material(self) -> str:
@@ -56,6 +154,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El material no puede estar vacío")
         self._material = value.strip()
+        self._notificar_cambio("material")
 
     @property
     def color(self) -> str:
@@ -68,6 +167,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El color no puede estar vacío")
         self._color = value.strip()
+        self._notificar_cambio("color")
 
     @property
     def precio_base(self) -> float:
@@ -80,6 +180,7 @@ class Mueble(ABC):
         if value < 0:
             raise ValueError("El precio base no puede ser negativo")
         self._precio_base = value
+        self._notificar_cambio("precio_base")
 
     @abstractmethod
     def calcular_precio(self) -> float:
@@ -0,0 +1,313 @@
+"""
+Acumuladores incrementales usados por TiendaMuebles para sus estadísticas.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class SumaExacta:
+    """
+    Suma de flotantes mantenida de forma incremental y sin error de redondeo.
+
+    Usa el algoritmo de sumas parciales de Shewchuk (el mismo en que se basa
+    math.fsum): los parciales representan la suma exacta, por lo que restar un
+    valor previamente sumado lo anula por completo y el valor final coincide
+    con math.fsum() sobre los elementos vigentes.
+    """
+
+    def __init__(self):
+        """Constructor de la suma vacía."""
+        self._parciales: List[float] = []
+
+    def agregar(self, valor: float) -> None:
+        """
+        Suma un valor finito al acumulador.
+
+        Args:
+            valor: Valor a sumar
+        """
+        parciales = self._parciales
+        i = 0
+        for parcial in parciales:
+            if abs(valor) < abs(parcial):
+                valor, parcial = parcial, valor
+            alto = valor + parcial
+            bajo = parcial - (alto - valor)
+            if bajo:
+                parciales[i] = bajo
+                i += 1
+            valor = alto
+        parciales[i:] = [valor]
+
+    def agregar_lote(self, valores: Iterable[float]) -> None:
+        """
+        Suma varios valores finitos al acumulador.
+
+        Args:
+            valores: Valores a sumar
+        """
+        for valor in valores:
+            self.agregar(valor)
+
+    def combinar(self, otra: "SumaExacta") -> None:
+        """
+        Suma el contenido de otro acumulador sin perder exactitud.
+
+        Args:
+            otra: Acumulador a sumar (por ejemplo, el parcial de otro proceso)
+        """
+        self.agregar_lote(otra._parciales)
+
+    def quitar(self, valor: float) -> None:
+        """
+        Resta un valor previamente sumado.
+
+        Args:
+            valor: Valor a restar
+        """
+        self.agregar(-valor)
+
+    def valor(self) -> float:
+        """
+        Retorna la suma correctamente redondeada.
+
+        Returns:
+            float: Suma de los valores vigentes
+        """
+        return math.fsum(self._parciales)
+
+
+class SerieVentas:
+    """
+    Resumen de ventas por intervalos fijos de tiempo en un búfer circular.
+
+    Cada cubeta cubre `resolucion` segundos y guarda la cantidad de ventas,
+    el monto bruto (antes de descuentos), el descuento otorgado y la cantidad
+    vendida por tipo. Sólo se conservan las últimas `cubetas` cubetas: una
+    venta nueva reutiliza la posición de la cubeta más antigua, de modo que la
+    memoria es fija y consultar una ventana cuesta O(cubetas), no O(ventas).
+
+    Los instantes se reparten tal como llegan, sin zona horaria: si vienen de
+    una hora local con cambio de horario, las cubetas son de hora de reloj y
+    no de tiempo transcurrido (ver ResumenVentas).
+    """
+
+    def __init__(self, resolucion: int, cubetas: int):
+        """
+        Constructor de la serie vacía.
+
+        Args:
+            resolucion: Segundos que cubre cada cubeta
+            cubetas: Número de cubetas conservadas
+
+        Raises:
+            ValueError: Si resolucion o cubetas son menores o iguales a 0
+        """
+        if resolucion <= 0 or cubetas <= 0:
+            raise ValueError("La resolución y el número de cubetas deben ser mayores a 0")
+        self._resolucion = resolucion
+        self._n = cubetas
+        # Número de intervalo que ocupa cada posición (-1 si está vacía)
+        self._intervalos: List[int] = [-1] * cubetas
+        self._ventas: List[int] = [0] * cubetas
+        self._bruto: List[float] = [0.0] * cubetas
+        self._descuento: List[float] = [0.0] * cubetas
+        self._tipos: List[Dict[str, int]] = [{} for _ in range(cubetas)]
+        self._ultimo = -1
+
+    @property
+    def resolucion(self) -> int:
+        """Getter para los segundos que cubre cada cubeta."""
+        return self._resolucion
+
+    @property
+    def cubetas(self) -> int:
+        """Getter para el número de cubetas conservadas."""
+        return self._n
+
+    def agregar(self, instante: float, bruto: float, descuento: float, tipo: str) -> None:
+        """
+        Registra una venta en la cubeta de su instante.
+        Las ventas más antiguas que la ventana conservada se ignoran.
+
+        Args:
+            instante: Segundos desde la época de la venta
+            bruto: Precio antes del descuento
+            descuento: Monto descontado
+            tipo: Tipo del mueble vendido
+        """
+        intervalo = int(instante // self._resolucion)
+        if intervalo <= self._ultimo - self._n:
+            return
+        self._ultimo = max(self._ultimo, intervalo)
+        posicion = intervalo % self._n
+        if self._intervalos[posicion] != intervalo:
+            self._intervalos[posicion] = intervalo
+            self._ventas[posicion] = 0
+            self._bruto[posicion] = 0.0
+            self._descuento[posicion] = 0.0
+            self._tipos[posicion] = {}
+        self._ventas[posicion] += 1
+        self._bruto[posicion] += bruto
+        self._descuento[posicion] += descuento
+        tipos = self._tipos[posicion]
+        tipos[tipo] = tipos.get(tipo, 0) + 1
+
+    def _posiciones(self, cantidad: int, instante: float) -> Iterator[Tuple[int, int]]:
+        """
+        Recorre (intervalo, posición) de las `cantidad` cubetas que terminan
+        en la del instante dado, de la más antigua a la más reciente.
+        Método privado auxiliar.
+        """
+        if cantidad <= 0:
+            raise ValueError("La cantidad de cubetas debe ser mayor a 0")
+        fin = int(instante // self._resolucion)
+        for intervalo in range(fin - min(cantidad, self._n) + 1, fin + 1):
+            yield intervalo, intervalo % self._n
+
+    def ventana(self, cantidad: int, instante: float) -> Dict:
+        """
+        Totales de las últimas `cantidad` cubetas hasta la del instante dado.
+
+        Args:
+            cantidad: Número de cubetas a sumar (como máximo las conservadas)
+            instante: Segundos desde la época del final de la ventana
+
+        Returns:
+            Dict: ventas, bruto, descuento y tipos (cantidad vendida por tipo)
+
+        Raises:
+            ValueError: Si cantidad es menor o igual a 0
+        """
+        resultado = {"ventas": 0, "bruto": 0.0, "descuento": 0.0, "tipos": {}}
+        tipos = resultado["tipos"]
+        for intervalo, posicion in self._posiciones(cantidad, instante):
+            if self._intervalos[posicion] != intervalo:
+                continue
+            resultado["ventas"] += self._ventas[posicion]
+            resultado["bruto"] += self._bruto[posicion]
+            resultado["descuento"] += self._descuento[posicion]
+            for tipo, vendidos in self._tipos[posicion].items():
+                tipos[tipo] = tipos.get(tipo, 0) + vendidos
+        return resultado
+
+    def serie(self, cantidad: int, instante: float) -> List[Dict]:
+        """
+        Valores de cada una de las últimas `cantidad` cubetas, para graficar.
+
+        Args:
+            cantidad: Número de cubetas (como máximo las conservadas)
+            instante: Segundos desde la época del final de la serie
+
+        Returns:
+            List[Dict]: Una entrada por cubeta con inicio (segundos desde la
+                época), ventas, bruto y descuento; las cubetas sin ventas van en 0
+
+        Raises:
+            ValueError: Si cantidad es menor o igual a 0
+        """
+        serie = []
+        for intervalo, posicion in self._posiciones(cantidad, instante):
+            vigente = self._intervalos[posicion] == intervalo
+            serie.append(
+                {
+                    "inicio": intervalo * self._resolucion,
+                    "ventas": self._ventas[posicion] if vigente else 0,
+                    "bruto": self._bruto[posicion] if vigente else 0.0,
+                    "descuento": self._descuento[posicion] if vigente else 0.0,
+                }
+            )
+        return serie
+
+
+class ResumenVentas:
+    """
+    Series de ventas por minuto, hora y día que la tienda actualiza en cada venta.
+
+    Los instantes se cuentan en hora local de reloj (la misma de la `fecha`
+    de las ventas, sin zona horaria), así las cubetas diarias empiezan a
+    medianoche. Por eso, donde hay horario de verano, las cubetas siguen al
+    reloj y no al tiempo transcurrido: al atrasar la hora, las ventas de las
+    dos pasadas por la misma hora quedan juntas en una cubeta, y al
+    adelantarla la hora saltada queda como una cubeta vacía (el día tiene 23
+    o 25 horas de ventas). Los totales no cambian, sólo su reparto.
+    """
+
+    # Granularidad -> (segundos por cubeta, cubetas conservadas)
+    GRANULARIDADES = {
+        "minuto": (60, 24 * 60),
+        "hora": (60 * 60, 24 * 31),
+        "dia": (24 * 60 * 60, 366 * 2),
+    }
+    _EPOCA = datetime(1970, 1, 1)
+
+    def __init__(self):
+        """Constructor del resumen vacío."""
+        self._series = {
+            nombre: SerieVentas(resolucion, cubetas)
+            for nombre, (resolucion, cubetas) in self.GRANULARIDADES.items()
+        }
+
+    @classmethod
+    def instante(cls, fecha: datetime) -> float:
+        """
+        Convierte una fecha local a los segundos que usan las series.
+
+        Args:
+            fecha: Fecha sin zona horaria
+
+        Returns:
+            float: Segundos desde 1970-01-01 00:00 en hora local
+        """
+        return (fecha - cls._EPOCA).total_seconds()
+
+    @classmethod
+    def desde_instante(cls, instante: float) -> datetime:
+        """
+        Convierte los segundos de las series a una fecha local.
+
+        Args:
+            instante: Segundos generados por instante()
+
+        Returns:
+            datetime: Fecha sin zona horaria
+        """
+        return cls._EPOCA + timedelta(seconds=instante)
+
+    def registrar(self, venta: Dict) -> None:
+        """
+        Agrega una venta a todas las series.
+
+        Args:
+            venta: Registro de venta con fecha, precio_original, precio_final
+                y tipo (los registros sin tipo cuentan como "Desconocido")
+        """
+        instante = self.instante(datetime.fromisoformat(venta["fecha"]))
+        bruto = venta["precio_original"]
+        descuento = bruto - venta["precio_final"]
+        tipo = venta.get("tipo", "Desconocido")
+        for serie in self._series.values():
+            serie.agregar(instante, bruto, descuento, tipo)
+
+    def serie(self, granularidad: str) -> SerieVentas:
+        """
+        Obtiene la serie de una granularidad.
+
+        Args:
+            granularidad: "minuto", "hora" o "dia"
+
+        Returns:
+            SerieVentas: Serie correspondiente
+
+        Raises:
+            ValueError: Si la granularidad no existe
+        """
+        try:
+            return self._series[granularidad]
+        except KeyError:
+            raise ValueError(
+                f"Granularidad desconocida: {granularidad}"
+                f" (opciones: {', '.join(self._series)})"
+            ) from None
@@ -0,0 +1,695 @@
+"""
+Almacenes del inventario: dónde guarda TiendaMuebles los muebles indexados.
+
+AlmacenMemoria usa los índices en memoria de services.indices; AlmacenSQLite
+guarda los muebles en tablas tipadas de sqlite3 y resuelve los filtros por
+nombre, precio y material con consultas indexadas. En ambos casos la tienda
+conserva los objetos en memoria: AlmacenSQLite aporta persistencia y reinicio
+sin reconstruir los índices, no un inventario mayor que la RAM.
+"""
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.indices import IndiceAgrupado, IndiceNGramas, IndicePrecios
+from services.instantanea import ATRIBUTOS_TRANSITORIOS, importar_clase, ruta_clase
+
+# (sku, mueble, material normalizado, precio) de cada mueble a guardar
+FilaInventario = Tuple[int, object, Optional[str], Optional[float]]
+# Clave JSON que marca un objeto anidado (ej: la mesa y las sillas de un Comedor)
+_CLAVE_CLASE = "__clase__"
+
+
+def _objeto_a_json(objeto) -> Dict:
+    """
+    Representa un objeto anidado en la columna `extra` (default de json.dumps).
+    Función privada auxiliar.
+
+    Raises:
+        TypeError: Si el objeto no guarda su estado en atributos
+    """
+    if not hasattr(objeto, "__dict__"):
+        raise TypeError(f"No se puede guardar un {type(objeto).__name__} en el almacén")
+    atributos = {
+        k: v for k, v in vars(objeto).items() if k not in ATRIBUTOS_TRANSITORIOS
+    }
+    return {_CLAVE_CLASE: ruta_clase(type(objeto)), "atributos": atributos}
+
+
+def _objeto_desde_json(datos: Dict):
+    """
+    Reconstruye los objetos anidados de la columna `extra` (object_hook de
+    json.loads). Función privada auxiliar.
+    """
+    if _CLAVE_CLASE not in datos:
+        return datos
+    clase = importar_clase(datos[_CLAVE_CLASE])
+    atributos = datos["atributos"]
+    for atributo, crear in ATRIBUTOS_TRANSITORIOS.items():
+        atributos[atributo] = crear()
+    objeto = clase.__new__(clase)
+    objeto.__dict__ = atributos
+    return objeto
+
+
+class AlmacenInventario(ABC):
+    """
+    Interfaz de los almacenes del inventario.
+
+    El almacén guarda cada mueble bajo su SKU junto con su material
+    normalizado y su precio (None si no tiene uno válido) y responde las
+    consultas por nombre, rango de precio y material con SKUs.
+    """
+
+    @abstractmethod
+    def agregar_lote(self, filas: Iterable[FilaInventario]) -> None:
+        """
+        Guarda varios muebles nuevos.
+
+        Args:
+            filas: Tuplas (sku, mueble, material, precio)
+        """
+
+    def agregar(
+        self, sku: int, mueble, material: Optional[str], precio: Optional[float]
+    ) -> None:
+        """
+        Guarda un mueble nuevo.
+
+        Args:
+            sku: SKU del mueble
+            mueble: Mueble a guardar
+            material: Material normalizado (None si no tiene)
+            precio: Precio calculado (None si no es válido)
+        """
+        self.agregar_lote([(sku, mueble, material, precio)])
+
+    @abstractmethod
+    def eliminar(self, sku: int) -> None:
+        """
+        Quita un mueble. No hace nada si el SKU no existe.
+
+        Args:
+            sku: SKU del mueble
+        """
+
+    def eliminar_lote(self, skus: Iterable[int]) -> None:
+        """
+        Quita varios muebles. Los almacenes persistentes los borran todos o
+        ninguno.
+
+        Args:
+            skus: SKUs de los muebles
+        """
+        for sku in skus:
+            self.eliminar(sku)
+
+    @abstractmethod
+    def actualizar(
+        self, sku: int, mueble, material: Optional[str], precio: Optional[float]
+    ) -> None:
+        """
+        Reemplaza los datos guardados de un mueble modificado.
+
+        Args:
+            sku: SKU del mueble
+            mueble: Mueble con sus nuevos valores
+            material: Material normalizado (None si no tiene)
+            precio: Precio calculado (None si no es válido)
+        """
+
+    @abstractmethod
+    def precio(self, sku: int) -> Optional[float]:
+        """
+        Retorna el precio guardado de un mueble.
+
+        Args:
+            sku: SKU del mueble
+
+        Returns:
+            Optional[float]: Precio o None si no tiene uno válido
+        """
+
+    @abstractmethod
+    def buscar_por_nombre(self, texto: str) -> List[int]:
+        """
+        Busca los muebles cuyo nombre contiene el texto (case-insensitive).
+
+        Args:
+            texto: Subcadena a buscar
+
+        Returns:
+            List[int]: SKUs en orden ascendente
+        """
+
+    @abstractmethod
+    def rango_precios(self, precio_min: float, precio_max: float) -> List[int]:
+        """
+        Obtiene los muebles con precio dentro del rango (inclusivo).
+
+        Args:
+            precio_min: Precio mínimo
+            precio_max: Precio máximo
+
+        Returns:
+            List[int]: SKUs ordenados por precio y luego por SKU
+        """
+
+    def extremos_precio(
+        self,
+        k: int,
+        descendente: bool = False,
+        material: Optional[str] = None,
+        filtro: Optional[Callable[[int], bool]] = None,
+    ) -> List[int]:
+        """
+        Obtiene los k muebles más baratos (o más caros) con precio válido.
+
+        Esta implementación recorre rango_precios(); los almacenes con un
+        índice de precios la reemplazan para detenerse tras k resultados.
+
+        Args:
+            k: Número máximo de resultados
+            descendente: Si True, los más caros primero
+            material: Material normalizado al que limitar la consulta
+            filtro: Condición adicional sobre el SKU
+
+        Returns:
+            List[int]: SKUs ordenados por precio y luego por SKU (ambos
+                descendentes si descendente es True)
+        """
+        if k <= 0:
+            return []
+        skus = self.rango_precios(float("-inf"), float("inf"))
+        if descendente:
+            skus.reverse()
+        if material is not None:
+            del_material = set(self.por_material(material))
+            skus = (sku for sku in skus if sku in del_material)
+        if filtro is not None:
+            skus = filter(filtro, skus)
+        return list(islice(skus, k))
+
+    def contar_rango_precios(self, precio_min: float, precio_max: float) -> int:
+        """
+        Cuenta los muebles con precio dentro del rango (inclusivo).
+
+        Args:
+            precio_min: Precio mínimo
+            precio_max: Precio máximo
+
+        Returns:
+            int: Número de muebles en el rango
+        """
+        return len(self.rango_precios(precio_min, precio_max))
+
+    def estimar_nombre(self, texto: str) -> Optional[int]:
+        """
+        Estima cuántos muebles retornaría buscar_por_nombre() sin ejecutarla.
+
+        Args:
+            texto: Texto a buscar, en minúsculas
+
+        Returns:
+            Optional[int]: Cota superior de resultados, o None si el almacén
+                no puede estimarla
+        """
+        return None
+
+    @abstractmethod
+    def por_material(self, material: str) -> List[int]:
+        """
+        Obtiene los muebles de un material normalizado.
+
+        Args:
+            material: Material en minúsculas y sin espacios al borde
+
+        Returns:
+            List[int]: SKUs en orden ascendente
+        """
+
+    @abstractmethod
+    def conteo_materiales(self) -> Dict[str, int]:
+        """
+        Retorna cuántos muebles hay de cada material.
+
+        Returns:
+            Dict[str, int]: Conteo por material normalizado
+        """
+
+    def muebles(self) -> Iterator[Tuple[int, object, Optional[float]]]:
+        """
+        Recorre los muebles guardados de una sesión anterior.
+        Los almacenes que no persisten datos no retornan nada.
+
+        Yields:
+            Tuple[int, object, Optional[float]]: (sku, mueble, precio) en orden de SKU
+        """
+        return iter(())
+
+    def sincronizar(self) -> None:
+        """
+        Escribe las modificaciones que el almacén tenga pendientes.
+        Los almacenes que escriben al momento no hacen nada.
+        """
+
+    def cerrar(self) -> None:
+        """Libera los recursos del almacén."""
+
+
+class AlmacenMemoria(AlmacenInventario):
+    """
+    Almacén en memoria basado en los índices de trigramas, precios y materiales.
+    Los muebles en sí viven en el inventario de la tienda.
+    """
+
+    def __init__(self):
+        """Constructor del almacén vacío."""
+        self._nombres = IndiceNGramas()
+        self._precios = IndicePrecios()
+        self._materiales = IndiceAgrupado()
+
+    def agregar_lote(self, filas: Iterable[FilaInventario]) -> None:
+        filas = list(filas)
+        self._nombres.agregar_lote(
+            (sku, getattr(mueble, "nombre", "")) for sku, mueble, _, _ in filas
+        )
+        self._precios.agregar_lote(
+            (sku, precio) for sku, _, _, precio in filas if precio is not None
+        )
+        self._materiales.agregar_lote(
+            (sku, (material,)) for sku, _, material, _ in filas if material is not None
+        )
+
+    def agregar(
+        self, sku: int, mueble, material: Optional[str], precio: Optional[float]
+    ) -> None:
+        self.actualizar(sku, mueble, material, precio)
+
+    def eliminar(self, sku: int) -> None:
+        self._nombres.eliminar(sku)
+        self._precios.eliminar(sku)
+        self._materiales.eliminar(sku)
+
+    def actualizar(
+        self, sku: int, mueble, material: Optional[str], precio: Optional[float]
+    ) -> None:
+        nombre = getattr(mueble, "nombre", "")
+        if not isinstance(nombre, str) or self._nombres.texto(sku) != nombre.lower():
+            self._nombres.agregar(sku, nombre)
+        if precio is None:
+            self._precios.eliminar(sku)
+        elif self._precios.precio(sku) != precio:
+            self._precios.agregar(sku, precio)
+        if material is None:
+            self._materiales.eliminar(sku)
+        elif not self._materiales.contiene(material, sku):
+            # Sólo un cambio de material mueve el SKU de grupo
+            self._materiales.agregar(sku, (material,))
+
+    def precio(self, sku: int) -> Optional[float]:
+        return self._precios.precio(sku)
+
+    def buscar_por_nombre(self, texto: str) -> List[int]:
+        return sorted(self._nombres.buscar(texto))
+
+    def rango_precios(self, precio_min: float, precio_max: float) -> List[int]:
+        return self._precios.rango(precio_min, precio_max)
+
+    def extremos_precio(
+        self,
+        k: int,
+        descendente: bool = False,
+        material: Optional[str] = None,
+        filtro: Optional[Callable[[int], bool]] = None,
+    ) -> List[int]:
+        if k <= 0:
+            return []
+        skus = self._precios.recorrer(descendente)
+        if material is not None:
+            materiales = self._materiales
+            skus = (sku for sku in skus if materiales.contiene(material, sku))
+        if filtro is not None:
+            skus = filter(filtro, skus)
+        return list(islice(skus, k))
+
+    def contar_rango_precios(self, precio_min: float, precio_max: float) -> int:
+        return self._precios.contar(precio_min, precio_max)
+
+    def estimar_nombre(self, texto: str) -> Optional[int]:
+        return self._nombres.estimar(texto)
+
+    def por_material(self, material: str) -> List[int]:
+        return self._materiales.claves(material)
+
+    def conteo_materiales(self) -> Dict[str, int]:
+        return self._materiales.conteos()
+
+
+class AlmacenSQLite(AlmacenInventario):
+    """
+    Almacén persistente en una base sqlite3.
+
+    La tabla `muebles` guarda los datos comunes a todos los muebles y cada
+    categoría (asientos, superficies, almacenamientos y camas) tiene su propia
+    tabla con columnas tipadas; los atributos propios de cada clase concreta
+    van en la columna JSON `extra`, donde los objetos anidados (la mesa y las
+    sillas de un Comedor) se guardan con su clase. Hay índices sobre precio, material y una
+    tabla FTS5 de trigramas para buscar por subcadena del nombre, así que los
+    filtros se resuelven en la base. Las sentencias son constantes
+    parametrizadas, por lo que sqlite3 las compila una sola vez y las
+    reutiliza desde su caché de sentencias preparadas.
+
+    Los precios se guardan también en un diccionario para que precio() no
+    consulte la base. Las modificaciones de muebles (actualizar()) no se
+    escriben al momento: se acumulan y se escriben juntas en una transacción
+    al llamar a sincronizar() o al cerrar. Las altas y las bajas se escriben
+    de inmediato. Las consultas sólo leen, así que no ven las modificaciones
+    pendientes: quien modifica debe sincronizar antes de consultar (la tienda
+    lo hace con su candado de escritura).
+    """
+
+    # tabla -> (clase de la jerarquía, columnas (nombre, atributo, tipo SQL))
+    CATEGORIAS = {
+        "asientos": (
+            "Asiento",
+            (
+                ("capacidad_personas", "_capacidad_personas", "INTEGER"),
+                ("tiene_respaldo", "_tiene_respaldo", "BOOLEAN"),
+                ("material_tapizado", "_material_tapizado", "TEXT"),
+            ),
+        ),
+        "superficies": (
+            "Superficie",
+            (
+                ("largo", "_largo", "REAL"),
+                ("ancho", "_ancho", "REAL"),
+                ("altura", "_altura", "REAL"),
+            ),
+        ),
+        "almacenamientos": (
+            "Almacenamiento",
+            (
+                ("altura", "_altura", "REAL"),
+                ("ancho", "_ancho", "REAL"),
+                ("profundidad", "_profundidad", "REAL"),
+                ("num_compartimentos", "_num_compartimentos", "INTEGER"),
+            ),
+        ),
+        "camas": (
+            "Cama",
+            (
+                ("tamano", "_tamaño", "TEXT"),
+                ("incluye_colchon", "_incluye_colchon", "BOOLEAN"),
+                ("tiene_cabecera", "_tiene_cabecera", "BOOLEAN"),
+            ),
+        ),
+    }
+    # Columnas de la tabla muebles que corresponden a atributos de Mueble
+    COLUMNAS_BASE = (
+        ("nombre", "_nombre"),
+        ("material", "_material"),
+        ("color", "_color"),
+        ("precio_base", "_precio_base"),
+    )
+
+    def __init__(self, ruta: str = ":memory:"):
+        """
+        Constructor del almacén. Crea las tablas si no existen.
+
+        Args:
+            ruta: Ruta del archivo de la base (":memory:" para una base temporal)
+        """
+        # La tienda concurrente lo usa desde varios hilos, siempre bajo su candado
+        self._conexion = sqlite3.connect(
+            ruta, isolation_level=None, check_same_thread=False
+        )
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._crear_tablas()
+        self._precios: Dict[int, Optional[float]] = dict(
+            self._conexion.execute("SELECT sku, precio FROM muebles")
+        )
+        # SKU -> (mueble, material, precio) modificados y aún no escritos
+        self._pendientes: Dict[int, Tuple[object, Optional[str], Optional[float]]] = {}
+        self._sql_insertar_categoria = {
+            tabla: "INSERT INTO {} (sku, {}) VALUES (?, {})".format(
+                tabla,
+                ", ".join(c for c, _, _ in columnas),
+                ", ".join("?" for _ in columnas),
+            )
+            for tabla, (_, columnas) in self.CATEGORIAS.items()
+        }
+
+    def _crear_tablas(self) -> None:
+        """Crea tablas e índices. Método privado auxiliar."""
+        sentencias = [
+            """CREATE TABLE IF NOT EXISTS muebles (
+                sku INTEGER PRIMARY KEY,
+                clase TEXT NOT NULL,
+                nombre TEXT,
+                material TEXT,
+                color TEXT,
+                precio_base REAL,
+                material_clave TEXT,
+                precio REAL,
+                extra TEXT NOT NULL
+            )""",
+            "CREATE INDEX IF NOT EXISTS muebles_precio ON muebles (precio, sku)",
+            "CREATE INDEX IF NOT EXISTS muebles_material ON muebles (material_clave, sku)",
+            """CREATE VIRTUAL TABLE IF NOT EXISTS muebles_nombres
+                USING fts5(nombre, tokenize='trigram', detail='none')""",
+        ]
+        for tabla, (_, columnas) in self.CATEGORIAS.items():
+            definicion = ", ".join(f"{c} {tipo}" for c, _, tipo in columnas)
+            sentencias.append(
+                f"CREATE TABLE IF NOT EXISTS {tabla} ("
+                f"sku INTEGER PRIMARY KEY REFERENCES muebles (sku), {definicion})"
+            )
+        for sentencia in sentencias:
+            self._conexion.execute(sentencia)
+
+    def _filas_mueble(self, sku: int, mueble, material, precio):
+        """
+        Descompone un mueble en la fila de `muebles` y las de sus categorías.
+        Método privado auxiliar.
+        """
+        atributos = {
+            k: v for k, v in vars(mueble).items() if k not in ATRIBUTOS_TRANSITORIOS
+        }
+        base = [atributos.pop(atributo, None) for _, atributo in self.COLUMNAS_BASE]
+        jerarquia = {c.__name__ for c in type(mueble).__mro__}
+        categorias = []
+        for tabla, (categoria, columnas) in self.CATEGORIAS.items():
+            if categoria in jerarquia:
+                valores = [atributos.get(atributo) for _, atributo, _ in columnas]
+                categorias.append((tabla, (sku, *valores)))
+        for tabla, _ in categorias:
+            for _, atributo, _ in self.CATEGORIAS[tabla][1]:
+                atributos.pop(atributo, None)
+        fila = (
+            sku,
+            ruta_clase(type(mueble)),
+            *base,
+            material,
+            precio,
+            json.dumps(atributos, ensure_ascii=False, default=_objeto_a_json),
+        )
+        return fila, categorias
+
+    def agregar_lote(self, filas: Iterable[FilaInventario]) -> None:
+        with self._transaccion():
+            self._insertar(filas)
+
+    def _insertar(self, filas: Iterable[FilaInventario]) -> None:
+        """Inserta las filas sin abrir transacción. Método privado auxiliar."""
+        muebles = []
+        nombres = []
+        categorias: Dict[str, list] = {tabla: [] for tabla in self.CATEGORIAS}
+        for sku, mueble, material, precio in filas:
+            self._precios[sku] = precio
+            fila, filas_categoria = self._filas_mueble(sku, mueble, material, precio)
+            muebles.append(fila)
+            nombre = getattr(mueble, "nombre", "")
+            nombres.append((sku, nombre.lower() if isinstance(nombre, str) else ""))
+            for tabla, valores in filas_categoria:
+                categorias[tabla].append(valores)
+        self._conexion.executemany(
+            "INSERT INTO muebles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", muebles
+        )
+        self._conexion.executemany(
+            "INSERT INTO muebles_nombres (rowid, nombre) VALUES (?, ?)", nombres
+        )
+        for tabla, valores in categorias.items():
+            if valores:
+                self._conexion.executemany(self._sql_insertar_categoria[tabla], valores)
+
+    def eliminar(self, sku: int) -> None:
+        self.eliminar_lote([sku])
+
+    def eliminar_lote(self, skus: Iterable[int]) -> None:
+        skus = list(skus)
+        with self._transaccion():
+            for sku in skus:
+                self._eliminar(sku)
+        for sku in skus:
+            self._pendientes.pop(sku, None)
+            self._precios.pop(sku, None)
+
+    def _eliminar(self, sku: int) -> None:
+        """Borra las filas de un SKU sin abrir transacción. Método privado auxiliar."""
+        for tabla in self.CATEGORIAS:
+            self._conexion.execute(f"DELETE FROM {tabla} WHERE sku = ?", (sku,))
+        self._conexion.execute("DELETE FROM muebles_nombres WHERE rowid = ?", (sku,))
+        self._conexion.execute("DELETE FROM muebles WHERE sku = ?", (sku,))
+
+    def actualizar(
+        self, sku: int, mueble, material: Optional[str], precio: Optional[float]
+    ) -> None:
+        self._pendientes[sku] = (mueble, material, precio)
+        self._precios[sku] = precio
+
+    def sincronizar(self) -> None:
+        """
+        Escribe en la base las modificaciones pendientes, en una transacción.
+        Varias modificaciones del mismo mueble se escriben una sola vez.
+        Si falla, las modificaciones quedan pendientes para el próximo intento.
+        """
+        if not self._pendientes:
+            return
+        # Reescribir las filas mantiene la tabla FTS y las categorías al día
+        with self._transaccion():
+            for sku in self._pendientes:
+                self._eliminar(sku)
+            self._insertar(
+                (sku, mueble, material, precio)
+                for sku, (mueble, material, precio) in self._pendientes.items()
+            )
+        self._pendientes = {}
+
+    def precio(self, sku: int) -> Optional[float]:
+        return self._precios.get(sku)
+
+    def buscar_por_nombre(self, texto: str) -> List[int]:
+        # GLOB distingue mayúsculas: los nombres se guardan ya en minúsculas
+        patron = "".join(f"[{c}]" if c in "*?[" else c for c in texto.lower())
+        filas = self._conexion.execute(
+            "SELECT rowid FROM muebles_nombres WHERE nombre GLOB ? ORDER BY rowid",
+            (f"*{patron}*",),
+        )
+        return [sku for (sku,) in filas]
+
+    def rango_precios(self, precio_min: float, precio_max: float) -> List[int]:
+        filas = self._conexion.execute(
+            "SELECT sku FROM muebles WHERE precio BETWEEN ? AND ? ORDER BY precio, sku",
+            (precio_min, precio_max),
+        )
+        return [sku for (sku,) in filas]
+
+    def extremos_precio(
+        self,
+        k: int,
+        descendente: bool = False,
+        material: Optional[str] = None,
+        filtro: Optional[Callable[[int], bool]] = None,
+    ) -> List[int]:
+        if k <= 0:
+            return []
+        orden = "DESC" if descendente else "ASC"
+        sql = "SELECT sku FROM muebles WHERE precio IS NOT NULL"
+        parametros: list = []
+        if material is not None:
+            sql += " AND material_clave = ?"
+            parametros.append(material)
+        sql += f" ORDER BY precio {orden}, sku {orden}"
+        if filtro is None:
+            # El índice (precio, sku) permite leer sólo las primeras k filas
+            sql += " LIMIT ?"
+            parametros.append(k)
+        skus = (sku for (sku,) in self._conexion.execute(sql, parametros))
+        if filtro is not None:
+            skus = filter(filtro, skus)
+        return list(islice(skus, k))
+
+    def contar_rango_precios(self, precio_min: float, precio_max: float) -> int:
+        return self._conexion.execute(
+            "SELECT COUNT(*) FROM muebles WHERE precio BETWEEN ? AND ?",
+            (precio_min, precio_max),
+        ).fetchone()[0]
+
+    def por_material(self, material: str) -> List[int]:
+        filas = self._conexion.execute(
+            "SELECT sku FROM muebles WHERE material_clave = ? ORDER BY sku",
+            (material,),
+        )
+        return [sku for (sku,) in filas]
+
+    def conteo_materiales(self) -> Dict[str, int]:
+        filas = self._conexion.execute(
+            "SELECT material_clave, COUNT(*) FROM muebles"
+            " WHERE material_clave IS NOT NULL GROUP BY material_clave"
+        )
+        return dict(filas)
+
+    def muebles(self) -> Iterator[Tuple[int, object, Optional[float]]]:
+        columnas_categoria = {}
+        for tabla, (_, columnas) in self.CATEGORIAS.items():
+            columnas_categoria[tabla] = dict(
+                self._leer_categoria(tabla, columnas)
+            )
+        clases: Dict[str, type] = {}
+        filas = self._conexion.execute(
+            "SELECT sku, clase, nombre, material, color, precio_base, precio, extra"
+            " FROM muebles ORDER BY sku"
+        )
+        for sku, clase, nombre, material, color, precio_base, precio, extra in filas:
+            if clase not in clases:
+                clases[clase] = importar_clase(clase)
+            atributos = dict(
+                zip(
+                    (a for _, a in self.COLUMNAS_BASE),
+                    (nombre, material, color, precio_base),
+                )
+            )
+            for valores in columnas_categoria.values():
+                atributos.update(valores.get(sku, ()))
+            atributos.update(json.loads(extra, object_hook=_objeto_desde_json))
+            for atributo, crear in ATRIBUTOS_TRANSITORIOS.items():
+                atributos[atributo] = crear()
+            mueble = clases[clase].__new__(clases[clase])
+            mueble.__dict__ = atributos
+            yield sku, mueble, precio
+
+    def _leer_categoria(self, tabla: str, columnas) -> Iterator[Tuple[int, list]]:
+        """
+        Lee la tabla de una categoría como pares (sku, [(atributo, valor), ...]).
+        Método privado auxiliar.
+        """
+        sql = "SELECT sku, {} FROM {}".format(", ".join(c for c, _, _ in columnas), tabla)
+        for sku, *valores in self._conexion.execute(sql):
+            yield sku, [
+                (atributo, bool(valor) if tipo == "BOOLEAN" and valor is not None else valor)
+                for (_, atributo, tipo), valor in zip(columnas, valores)
+            ]
+
+    def cerrar(self) -> None:
+        self.sincronizar()
+        self._conexion.close()
+
+    @contextmanager
+    def _transaccion(self) -> Iterator[None]:
+        """
+        Agrupa varias sentencias en una transacción (ROLLBACK ante errores).
+        Método privado auxiliar.
+        """
+        self._conexion.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conexion.execute("ROLLBACK")
+            raise
+        self._conexion.execute("COMMIT")
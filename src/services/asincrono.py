@@ -0,0 +1,161 @@
+"""
+Fachada asyncio de TiendaMuebles para usarla desde un bucle de eventos.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from models.mueble import Mueble
+from services.tienda import TiendaMuebles
+
+
+class AsyncTiendaMuebles:
+    """
+    Expone las operaciones de una tienda como corrutinas.
+
+    El trabajo se ejecuta en un executor para no bloquear el bucle de eventos
+    (los recorridos grandes, el reporte y la espera del candado de la tienda
+    pueden tardar). Las ventas de un mismo SKU se serializan además con un
+    candado de asyncio, de modo que muchos clientes que piden el mismo mueble
+    esperan en el bucle en lugar de ocupar hilos del executor.
+    """
+
+    def __init__(
+        self,
+        tienda: Optional[TiendaMuebles] = None,
+        executor: Optional[Executor] = None,
+        candados_venta: int = 64,
+    ):
+        """
+        Constructor de la fachada.
+
+        Args:
+            tienda: Tienda en modo concurrente (se crea una si no se indica)
+            executor: Executor donde corren las operaciones; si no se indica
+                se crea un ThreadPoolExecutor propio que se cierra en cerrar()
+            candados_venta: Número de candados de asyncio repartidos por SKU
+
+        Raises:
+            ValueError: Si la tienda no es concurrente o candados_venta <= 0
+        """
+        if tienda is None:
+            tienda = TiendaMuebles(concurrente=True)
+        elif not tienda.concurrente:
+            raise ValueError("La tienda debe crearse con concurrente=True")
+        if candados_venta <= 0:
+            raise ValueError("El número de candados debe ser mayor a 0")
+        self._tienda = tienda
+        self._executor_propio = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            thread_name_prefix="tienda-async"
+        )
+        self._candados_venta = [asyncio.Lock() for _ in range(candados_venta)]
+
+    @property
+    def tienda(self) -> TiendaMuebles:
+        """Getter para la tienda envuelta."""
+        return self._tienda
+
+    async def _ejecutar(self, funcion: Callable, *args, **kwargs):
+        """
+        Ejecuta una función de la tienda en el executor.
+        Método privado auxiliar.
+        """
+        bucle = asyncio.get_running_loop()
+        return await bucle.run_in_executor(
+            self._executor, partial(funcion, *args, **kwargs)
+        )
+
+    async def buscar(self, nombre: str) -> List[Mueble]:
+        """
+        Busca muebles por nombre (búsqueda parcial, case-insensitive).
+
+        Args:
+            nombre: Nombre o parte del nombre a buscar
+
+        Returns:
+            List[Mueble]: Muebles que coinciden con la búsqueda
+        """
+        return await self._ejecutar(self._tienda.buscar_muebles_por_nombre, nombre)
+
+    async def filtrar(
+        self,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        material: Optional[str] = None,
+    ) -> List[Mueble]:
+        """
+        Filtra muebles por rango de precios y, opcionalmente, por material.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            material: Material a buscar
+
+        Returns:
+            List[Mueble]: Muebles que cumplen los filtros, de menor a mayor precio
+        """
+        return await self._ejecutar(
+            self._filtrar_sincrono, precio_min, precio_max, material
+        )
+
+    def _filtrar_sincrono(
+        self, precio_min: float, precio_max: float, material: Optional[str]
+    ) -> List[Mueble]:
+        """Implementación de filtrar(). Método privado auxiliar."""
+        resultado = self._tienda.filtrar_por_precio(precio_min, precio_max)
+        if material is None:
+            return resultado
+        del_material = {id(m) for m in self._tienda.filtrar_por_material(material)}
+        return [m for m in resultado if id(m) in del_material]
+
+    async def realizar_venta(
+        self, mueble: Mueble, cliente: str = "Cliente Anónimo"
+    ) -> Dict:
+        """
+        Procesa la venta de un mueble.
+
+        Args:
+            mueble: Mueble a vender
+            cliente: Nombre del cliente
+
+        Returns:
+            Dict: Información de la venta realizada o error
+        """
+        sku = self._tienda.obtener_sku(mueble)
+        if sku is None:
+            return {"error": "El mueble no está disponible en inventario"}
+        candado = self._candados_venta[hash(sku) % len(self._candados_venta)]
+        async with candado:
+            return await self._ejecutar(self._tienda.realizar_venta, mueble, cliente)
+
+    async def estadisticas(self) -> Dict:
+        """
+        Obtiene estadísticas de la tienda.
+
+        Returns:
+            Dict: Estadísticas de la tienda
+        """
+        return await self._ejecutar(self._tienda.obtener_estadisticas)
+
+    async def generar_reporte_inventario(self) -> str:
+        """
+        Genera el reporte completo del inventario sin bloquear el bucle.
+
+        Returns:
+            str: Reporte detallado del inventario
+        """
+        return await self._ejecutar(self._tienda.generar_reporte_inventario)
+
+    def cerrar(self) -> None:
+        """Cierra el executor si la fachada lo creó."""
+        if self._executor_propio:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncTiendaMuebles":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.cerrar)
@@ -0,0 +1,143 @@
+"""
+Caché acotado de resultados de consultas con desalojo LRU.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class CacheConsultas:
+    """
+    Caché de resultados con capacidad fija que desaloja la entrada usada
+    hace más tiempo.
+
+    Cada resultado se guarda junto con la versión del inventario con que se
+    calculó. La primera consulta o guardado con una versión más nueva descarta
+    todas las entradas de versiones anteriores, así el caché nunca retiene
+    resultados viejos (ni los muebles vendidos a los que apuntan). Es seguro
+    usarlo desde varios hilos que tengan el candado de lectura de la tienda.
+    """
+
+    def __init__(self, capacidad: int = 256):
+        """
+        Constructor del caché vacío.
+
+        Args:
+            capacidad: Máximo de resultados guardados (0 desactiva el caché)
+
+        Raises:
+            ValueError: Si capacidad es negativa
+        """
+        if capacidad < 0:
+            raise ValueError("La capacidad del caché no puede ser negativa")
+        self._capacidad = capacidad
+        self._entradas: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._aciertos = 0
+        self._fallos = 0
+        # Versión del inventario de las entradas guardadas
+        self._version = -1
+        self._candado = threading.Lock()
+
+    @property
+    def capacidad(self) -> int:
+        """Getter para el máximo de resultados guardados."""
+        return self._capacidad
+
+    def obtener(self, clave: tuple, version: int) -> Optional[tuple]:
+        """
+        Busca un resultado y lo marca como el usado más recientemente.
+
+        Args:
+            clave: Argumentos de la consulta
+            version: Versión actual del inventario
+
+        Returns:
+            Optional[tuple]: Resultado guardado o None si no está
+        """
+        with self._candado:
+            self._avanzar_version(version)
+            resultado = self._entradas.get(clave) if version == self._version else None
+            if resultado is None:
+                self._fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self._aciertos += 1
+            return resultado
+
+    def guardar(self, clave: tuple, version: int, resultado: tuple) -> None:
+        """
+        Guarda un resultado, desalojando los usados hace más tiempo si hace falta.
+
+        Args:
+            clave: Argumentos de la consulta
+            version: Versión del inventario con que se calculó el resultado
+            resultado: Resultado inmutable a guardar
+        """
+        if not self._capacidad:
+            return
+        with self._candado:
+            self._avanzar_version(version)
+            if version != self._version:
+                # Calculado con una versión ya superada: no sirve a nadie
+                return
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= self._tamano(clave, anterior)
+            self._entradas[clave] = resultado
+            self._bytes += self._tamano(clave, resultado)
+            while len(self._entradas) > self._capacidad:
+                vieja, desalojado = self._entradas.popitem(last=False)
+                self._bytes -= self._tamano(vieja, desalojado)
+
+    def limpiar(self) -> None:
+        """Descarta todos los resultados guardados (conserva los contadores)."""
+        with self._candado:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estadisticas(self) -> dict:
+        """
+        Retorna los contadores y el uso de memoria del caché.
+
+        La memoria cuenta las claves y las tuplas de resultados, no los muebles
+        a los que apuntan, que son los mismos del inventario.
+
+        Returns:
+            dict: Aciertos, fallos, tasa de aciertos (0-1), entradas,
+                capacidad y memoria_bytes
+        """
+        with self._candado:
+            total = self._aciertos + self._fallos
+            return {
+                "aciertos": self._aciertos,
+                "fallos": self._fallos,
+                "tasa_aciertos": self._aciertos / total if total else 0.0,
+                "entradas": len(self._entradas),
+                "capacidad": self._capacidad,
+                "memoria_bytes": self._bytes,
+            }
+
+    def _avanzar_version(self, version: int) -> None:
+        """
+        Descarta las entradas si llega una versión más nueva que la guardada.
+        Se llama con el candado tomado. Método privado auxiliar.
+        """
+        if version > self._version:
+            self._entradas.clear()
+            self._bytes = 0
+            self._version = version
+
+    @staticmethod
+    def _tamano(clave: tuple, resultado: tuple) -> int:
+        """
+        Bytes aproximados de una entrada.
+        Método privado auxiliar.
+        """
+        return (
+            sys.getsizeof(clave)
+            + sum(sys.getsizeof(parte) for parte in clave)
+            + sys.getsizeof(resultado)
+        )
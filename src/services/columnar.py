@@ -0,0 +1,267 @@
+"""
+Instantánea columnar del inventario para cálculos analíticos vectorizados.
+Usa NumPy si está disponible y el módulo array de la biblioteca estándar si no.
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy es opcional
+    np = None
+
+
+class InstantaneaColumnar:
+    """
+    Representación del inventario como columnas paralelas.
+
+    Cada fila corresponde a un mueble y cada columna es un arreglo compacto:
+    SKU, código de tipo, código de material, código de color, precio base y
+    precio calculado. Los textos se codifican como enteros mediante
+    diccionarios por dimensión. Las altas se agregan al final y las bajas
+    mueven la última fila al hueco, de modo que ambas operaciones son O(1).
+
+    Los precios que no se pueden calcular se guardan como NaN y se ignoran en
+    las agregaciones.
+    """
+
+    DIMENSIONES = ("tipo", "material", "color")
+
+    def __init__(self):
+        """Constructor de la instantánea vacía."""
+        self.skus = array("q")
+        self.tipos = array("l")
+        self.materiales = array("l")
+        self.colores = array("l")
+        self.precios_base = array("d")
+        self.precios = array("d")
+        self._filas: Dict[int, int] = {}
+        self._codigos: Dict[str, Dict[str, int]] = {d: {} for d in self.DIMENSIONES}
+        self._valores: Dict[str, List[str]] = {d: [] for d in self.DIMENSIONES}
+
+    def __len__(self) -> int:
+        """Retorna el número de filas."""
+        return len(self.skus)
+
+    def copia(self) -> "InstantaneaColumnar":
+        """
+        Copia independiente de las columnas y los diccionarios de códigos.
+        Copiar los arreglos es una copia de memoria contigua, mucho más barata
+        que agregarlos, así que permite agregar sin retener el candado de la tienda.
+
+        Returns:
+            InstantaneaColumnar: Copia que no cambia con el inventario
+        """
+        copia = InstantaneaColumnar.__new__(InstantaneaColumnar)
+        for columna in ("skus", "tipos", "materiales", "colores", "precios_base", "precios"):
+            setattr(copia, columna, getattr(self, columna)[:])
+        copia._filas = dict(self._filas)
+        copia._codigos = {d: dict(c) for d, c in self._codigos.items()}
+        copia._valores = {d: list(v) for d, v in self._valores.items()}
+        return copia
+
+    def codificar(self, dimension: str, valor: str) -> int:
+        """
+        Obtiene (o asigna) el código entero de un valor de texto.
+
+        Args:
+            dimension: "tipo", "material" o "color"
+            valor: Texto a codificar
+
+        Returns:
+            int: Código asignado al valor
+        """
+        codigos = self._codigos[dimension]
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = len(codigos)
+            codigos[valor] = codigo
+            self._valores[dimension].append(valor)
+        return codigo
+
+    def decodificar(self, dimension: str, codigo: int) -> str:
+        """
+        Obtiene el texto correspondiente a un código.
+
+        Args:
+            dimension: "tipo", "material" o "color"
+            codigo: Código a traducir
+
+        Returns:
+            str: Valor original
+        """
+        return self._valores[dimension][codigo]
+
+    def agregar(
+        self,
+        sku: int,
+        tipo: str,
+        material: str,
+        color: str,
+        precio_base: float,
+        precio: Optional[float],
+    ) -> None:
+        """
+        Agrega una fila al final de la instantánea.
+        Si el SKU ya existía se actualiza su fila.
+
+        Args:
+            sku: SKU del mueble
+            tipo: Nombre de la clase del mueble
+            material: Material normalizado
+            color: Color del mueble
+            precio_base: Precio base del mueble
+            precio: Precio calculado (None si no se pudo calcular)
+        """
+        if sku in self._filas:
+            self.actualizar(sku, tipo, material, color, precio_base, precio)
+            return
+        self._filas[sku] = len(self.skus)
+        self.skus.append(sku)
+        self.tipos.append(self.codificar("tipo", tipo))
+        self.materiales.append(self.codificar("material", material))
+        self.colores.append(self.codificar("color", color))
+        self.precios_base.append(precio_base)
+        self.precios.append(math.nan if precio is None else precio)
+
+    def actualizar(
+        self,
+        sku: int,
+        tipo: str,
+        material: str,
+        color: str,
+        precio_base: float,
+        precio: Optional[float],
+    ) -> None:
+        """
+        Reemplaza los valores de la fila de un SKU existente.
+
+        Args:
+            sku: SKU del mueble
+            tipo: Nombre de la clase del mueble
+            material: Material normalizado
+            color: Color del mueble
+            precio_base: Precio base del mueble
+            precio: Precio calculado (None si no se pudo calcular)
+        """
+        fila = self._filas[sku]
+        self.tipos[fila] = self.codificar("tipo", tipo)
+        self.materiales[fila] = self.codificar("material", material)
+        self.colores[fila] = self.codificar("color", color)
+        self.precios_base[fila] = precio_base
+        self.precios[fila] = math.nan if precio is None else precio
+
+    def eliminar(self, sku: int) -> None:
+        """
+        Quita la fila de un SKU moviendo la última fila a su lugar.
+        No hace nada si el SKU no existe.
+
+        Args:
+            sku: SKU a eliminar
+        """
+        fila = self._filas.pop(sku, None)
+        if fila is None:
+            return
+        ultima = len(self.skus) - 1
+        columnas = (
+            self.skus,
+            self.tipos,
+            self.materiales,
+            self.colores,
+            self.precios_base,
+            self.precios,
+        )
+        if fila != ultima:
+            for columna in columnas:
+                columna[fila] = columna[ultima]
+            self._filas[self.skus[fila]] = fila
+        for columna in columnas:
+            columna.pop()
+
+    def _precios_validos(self):
+        """
+        Retorna precios válidos y códigos de tipo alineados.
+        Método privado auxiliar; con NumPy retorna arreglos, sin NumPy listas.
+        """
+        if np is not None:
+            precios = np.frombuffer(self.precios, dtype=np.float64)
+            tipos = np.frombuffer(self.tipos, dtype=np.dtype(self.tipos.typecode))
+            mascara = ~np.isnan(precios)
+            return precios[mascara], tipos[mascara]
+        pares = [(p, t) for p, t in zip(self.precios, self.tipos) if p == p]
+        return [p for p, _ in pares], [t for _, t in pares]
+
+    def conteo_por(self, dimension: str) -> Dict[str, int]:
+        """
+        Cuenta las filas por valor de una dimensión.
+
+        Args:
+            dimension: "tipo", "material" o "color"
+
+        Returns:
+            Dict[str, int]: Filas por valor, en orden de código
+        """
+        columna = {"tipo": self.tipos, "material": self.materiales, "color": self.colores}[
+            dimension
+        ]
+        if np is not None:
+            codigos = np.frombuffer(columna, dtype=np.dtype(columna.typecode))
+            conteo = enumerate(np.bincount(codigos).tolist())
+        else:
+            conteo = sorted(Counter(columna).items())
+        valores = self._valores[dimension]
+        return {valores[codigo]: n for codigo, n in conteo if n}
+
+    def valor_total(self) -> float:
+        """
+        Suma los precios calculados de todas las filas.
+
+        Returns:
+            float: Valor total correctamente redondeado
+        """
+        precios, _ = self._precios_validos()
+        return math.fsum(precios)
+
+    def suma_por_tipo(self) -> Dict[str, float]:
+        """
+        Suma los precios calculados agrupando por tipo.
+        Cada suma es exacta (math.fsum), igual que en reporte_paralelo.
+
+        Returns:
+            Dict[str, float]: Valor acumulado por nombre de tipo (sin los que suman 0)
+        """
+        precios, tipos = self._precios_validos()
+        por_tipo: Dict[int, List[float]] = {}
+        if np is not None:
+            for codigo in np.unique(tipos):
+                por_tipo[int(codigo)] = precios[tipos == codigo].tolist()
+        else:
+            for precio, tipo in zip(precios, tipos):
+                por_tipo.setdefault(tipo, []).append(precio)
+        sumas = {codigo: math.fsum(lista) for codigo, lista in sorted(por_tipo.items())}
+        return {self._valores["tipo"][codigo]: suma for codigo, suma in sumas.items() if suma}
+
+    def histograma_precios(self, limites: Sequence[float]) -> List[int]:
+        """
+        Cuenta cuántos precios caen en cada intervalo definido por los límites.
+
+        Con límites [a, b] los intervalos son (-inf, a), [a, b) y [b, +inf).
+
+        Args:
+            limites: Límites ordenados de menor a mayor
+
+        Returns:
+            List[int]: Conteo por intervalo (len(limites) + 1 elementos)
+        """
+        precios, _ = self._precios_validos()
+        if np is not None:
+            posiciones = np.searchsorted(np.asarray(limites, dtype=np.float64), precios, side="right")
+            return [int(c) for c in np.bincount(posiciones, minlength=len(limites) + 1)]
+        conteo = [0] * (len(limites) + 1)
+        for precio in precios:
+            conteo[bisect_right(limites, precio)] += 1
+        return conteo
@@ -0,0 +1,198 @@
+"""
+Primitivas de sincronización para el modo concurrente de TiendaMuebles.
+"""
+
+import threading
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Hashable, Iterable, Iterator
+
+
+class CandadoLectoresEscritor:
+    """
+    Candado de lectores y escritor.
+
+    Varios hilos pueden leer a la vez; un escritor espera a que terminen los
+    lectores activos y los nuevos lectores esperan a que no haya escritores
+    pendientes, de modo que las escrituras no quedan postergadas
+    indefinidamente. Es reentrante: un hilo que ya lee puede volver a leer y
+    un escritor puede leer o escribir de nuevo. Un lector no puede pasar a
+    escritor.
+    """
+
+    def __init__(self):
+        """Constructor del candado libre."""
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escritores_esperando = 0
+        self._escritor = None
+        self._local = threading.local()
+
+    @contextmanager
+    def lectura(self) -> Iterator[None]:
+        """Sección de solo lectura compartida con otros lectores."""
+        yo = threading.get_ident()
+        profundidad = getattr(self._local, "lecturas", 0)
+        if self._escritor == yo or profundidad:
+            self._local.lecturas = profundidad + 1
+            try:
+                yield
+            finally:
+                self._local.lecturas = profundidad
+            return
+        with self._condicion:
+            while self._escritor is not None or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+        self._local.lecturas = 1
+        try:
+            yield
+        finally:
+            self._local.lecturas = 0
+            with self._condicion:
+                self._lectores -= 1
+                if not self._lectores:
+                    self._condicion.notify_all()
+
+    @contextmanager
+    def escritura(self) -> Iterator[None]:
+        """
+        Sección exclusiva: no hay otros lectores ni escritores.
+
+        Raises:
+            RuntimeError: Si el hilo ya tiene el candado como lector
+        """
+        yo = threading.get_ident()
+        if self._escritor == yo:
+            yield
+            return
+        if getattr(self._local, "lecturas", 0):
+            raise RuntimeError("Un lector no puede adquirir el candado de escritura")
+        with self._condicion:
+            self._escritores_esperando += 1
+            while self._escritor is not None or self._lectores:
+                self._condicion.wait()
+            self._escritores_esperando -= 1
+            self._escritor = yo
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._escritor = None
+                self._condicion.notify_all()
+
+
+class CandadosPorClave:
+    """
+    Conjunto fijo de candados repartidos por clave (lock striping).
+
+    Cada clave usa el candado `hash(clave) % n`: dos claves distintas pueden
+    compartir candado, pero una misma clave siempre usa el mismo, sin
+    guardar un candado por cada clave existente.
+    """
+
+    def __init__(self, n: int = 64):
+        """
+        Constructor de los candados.
+
+        Args:
+            n: Número de candados
+
+        Raises:
+            ValueError: Si n es menor o igual a 0
+        """
+        if n <= 0:
+            raise ValueError("El número de candados debe ser mayor a 0")
+        self._candados = [threading.Lock() for _ in range(n)]
+
+    def clave(self, clave: Hashable):
+        """
+        Retorna el candado de una clave.
+
+        Args:
+            clave: Clave a proteger
+
+        Returns:
+            threading.Lock: Candado compartido por las claves de su franja
+        """
+        return self._candados[hash(clave) % len(self._candados)]
+
+    @contextmanager
+    def claves(self, claves: Iterable[Hashable]) -> Iterator[None]:
+        """
+        Adquiere los candados de varias claves en orden fijo para evitar
+        interbloqueos entre hilos que piden conjuntos solapados.
+
+        Args:
+            claves: Claves a proteger
+        """
+        n = len(self._candados)
+        candados = [self._candados[i] for i in sorted({hash(c) % n for c in claves})]
+        adquiridos = []
+        try:
+            for candado in candados:
+                candado.acquire()
+                adquiridos.append(candado)
+            yield
+        finally:
+            for candado in reversed(adquiridos):
+                candado.release()
+
+
+class SinCandado:
+    """
+    Sustituto sin sincronización de los candados, usado fuera del modo concurrente.
+    Ofrece la misma interfaz que CandadoLectoresEscritor y CandadosPorClave.
+    """
+
+    _NULO = nullcontext()
+
+    def lectura(self):
+        return self._NULO
+
+    def escritura(self):
+        return self._NULO
+
+    def clave(self, clave: Hashable):
+        return self._NULO
+
+    def claves(self, claves: Iterable[Hashable]):
+        return self._NULO
+
+
+def con_lectura(metodo):
+    """
+    Decorador de métodos de TiendaMuebles que sólo leen el estado.
+
+    Args:
+        metodo: Método a proteger
+
+    Returns:
+        Función que ejecuta el método con el candado de lectura
+    """
+
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        with self._candado.lectura():
+            return metodo(self, *args, **kwargs)
+
+    return envoltura
+
+
+def con_escritura(metodo):
+    """
+    Decorador de métodos de TiendaMuebles que modifican el estado.
+
+    Args:
+        metodo: Método a proteger
+
+    Returns:
+        Función que ejecuta el método con el candado de escritura
+    """
+
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        with self._candado.escritura():
+            return metodo(self, *args, **kwargs)
+
+    return envoltura
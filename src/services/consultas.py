@@ -0,0 +1,117 @@
+"""
+Planificación de consultas con varios criterios sobre los índices de la tienda.
+"""
+
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+
+class Predicado(NamedTuple):
+    """
+    Criterio de una consulta con las dos formas de evaluarlo.
+
+    Attributes:
+        descripcion: Texto del criterio para explicar el plan
+        estimado: Muebles que se espera que cumplan el criterio
+        exacto: Si el estimado es un conteo exacto o una cota
+        candidatos: Obtiene desde un índice los SKUs que cumplen el criterio
+        cumple: Indica si un SKU cumple el criterio
+    """
+
+    descripcion: str
+    estimado: int
+    exacto: bool
+    candidatos: Callable[[], Iterable[int]]
+    cumple: Callable[[int], bool]
+
+
+class PlanConsulta:
+    """
+    Plan de una consulta: el predicado más selectivo se resuelve con su
+    índice y los demás se comprueban uno a uno sobre esos candidatos,
+    empezando también por los más selectivos.
+    """
+
+    def __init__(self, predicados: List[Predicado], recorrido: Predicado):
+        """
+        Constructor del plan.
+
+        Args:
+            predicados: Criterios de la consulta
+            recorrido: Predicado que recorre todo el inventario, usado
+                cuando la consulta no tiene criterios
+        """
+        ordenados = sorted(predicados, key=lambda predicado: predicado.estimado)
+        self._inicio = ordenados[0] if ordenados else recorrido
+        self._filtros = ordenados[1:]
+
+    @property
+    def inicio(self) -> Predicado:
+        """Getter para el predicado que genera los candidatos."""
+        return self._inicio
+
+    @property
+    def filtros(self) -> List[Predicado]:
+        """Getter para los predicados que se comprueban sobre los candidatos."""
+        return list(self._filtros)
+
+    def candidatos(self) -> List[int]:
+        """
+        Obtiene los SKUs candidatos desde el índice del predicado inicial.
+
+        Returns:
+            List[int]: SKUs en orden ascendente
+        """
+        return sorted(self._inicio.candidatos())
+
+    def cumple(self, sku: int) -> bool:
+        """
+        Comprueba los predicados restantes sobre un candidato.
+
+        Args:
+            sku: SKU candidato
+
+        Returns:
+            bool: True si cumple todos los filtros
+        """
+        return all(predicado.cumple(sku) for predicado in self._filtros)
+
+    def explicar(self) -> str:
+        """
+        Describe el plan elegido, un paso por línea.
+
+        Returns:
+            str: Texto del plan
+        """
+        lineas = [f"1. Inicio: {self._describir(self._inicio)}"]
+        for i, predicado in enumerate(self._filtros, 2):
+            lineas.append(f"{i}. Filtro: {self._describir(predicado)}")
+        return "\n".join(lineas)
+
+    @staticmethod
+    def _describir(predicado: Predicado) -> str:
+        """
+        Texto de un paso del plan.
+        Método privado auxiliar.
+        """
+        precision = "exacto" if predicado.exacto else "estimado"
+        return f"{predicado.descripcion} ~ {predicado.estimado} muebles ({precision})"
+
+
+def rango_texto(precio_min: Optional[float], precio_max: Optional[float]) -> str:
+    """
+    Texto de un rango de precios para explicar un plan.
+
+    Args:
+        precio_min: Precio mínimo o None
+        precio_max: Precio máximo o None
+
+    Returns:
+        str: Por ejemplo "100 <= precio <= 200" o "precio <= 200"
+    """
+    partes = []
+    if precio_min is not None:
+        partes.append(f"{precio_min:g} <=")
+    partes.append("precio")
+    if precio_max is not None:
+        partes.append(f"<= {precio_max:g}")
+    return " ".join(partes)
@@ -0,0 +1,140 @@
+"""
+Motor de descuentos por categoría de mueble.
+Resuelve los nombres de categoría a clases reales y compila una tabla clase -> tasa.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+
+def normalizar_categoria(texto: str) -> str:
+    """
+    Normaliza un nombre de categoría o de clase para compararlos.
+    Quita tildes, espacios, guiones y mayúsculas: "Sofá-Cama" -> "sofacama".
+
+    Args:
+        texto: Texto a normalizar
+
+    Returns:
+        str: Texto normalizado
+    """
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if c.isalnum()).lower()
+
+
+def clases_de(base: type) -> List[type]:
+    """
+    Obtiene la clase base y todas sus subclases conocidas (ya importadas).
+
+    Args:
+        base: Clase raíz de la jerarquía
+
+    Returns:
+        List[type]: Clases de la jerarquía, empezando por la base
+    """
+    clases = [base]
+    pendientes = [base]
+    while pendientes:
+        for subclase in pendientes.pop().__subclasses__():
+            if subclase not in clases:
+                clases.append(subclase)
+                pendientes.append(subclase)
+    return clases
+
+
+class MotorDescuentos:
+    """
+    Administra los descuentos activos y la tasa efectiva de cada clase.
+
+    Los descuentos se registran por nombre normalizado de clase, por lo que
+    aplican también a categorías abstractas como Asiento. La tasa efectiva de
+    una clase es la del primer descuento encontrado recorriendo su MRO: un
+    descuento sobre Sofa tiene prioridad sobre uno sobre Asiento para un sofá.
+    Las tasas se compilan en una tabla indexada por el objeto clase, de modo
+    que cotizar una venta es una sola consulta de diccionario.
+    """
+
+    def __init__(self):
+        """Constructor del motor sin descuentos."""
+        self._tasas: Dict[str, float] = {}
+        self._tabla: Dict[type, float] = {}
+
+    def __bool__(self) -> bool:
+        """Indica si hay algún descuento activo."""
+        return bool(self._tasas)
+
+    @staticmethod
+    def resolver_categoria(categoria: str, clases: Iterable[type]) -> Optional[type]:
+        """
+        Busca la clase que corresponde a un nombre de categoría en singular o plural.
+        Acepta variantes como "silla", "sillas", "sillones" o "sofás".
+
+        Args:
+            categoria: Nombre de la categoría ingresado por el usuario
+            clases: Clases candidatas
+
+        Returns:
+            Optional[type]: Clase encontrada o None
+        """
+        normalizada = normalizar_categoria(categoria)
+        candidatos = [normalizada]
+        if normalizada.endswith("es"):
+            candidatos.append(normalizada[:-2])
+        if normalizada.endswith("s"):
+            candidatos.append(normalizada[:-1])
+        por_nombre = {normalizar_categoria(clase.__name__): clase for clase in clases}
+        for candidato in candidatos:
+            if candidato in por_nombre:
+                return por_nombre[candidato]
+        return None
+
+    def registrar(self, nombre_clase: str, tasa: float) -> None:
+        """
+        Activa (o reemplaza) el descuento de una clase y recompila la tabla.
+
+        Args:
+            nombre_clase: Nombre de la clase a la que aplica el descuento
+            tasa: Tasa de descuento entre 0 y 1
+        """
+        self._tasas[normalizar_categoria(nombre_clase)] = tasa
+        self._tabla.clear()
+
+    def tasa(self, clase: type) -> float:
+        """
+        Retorna la tasa efectiva de descuento para una clase.
+
+        Args:
+            clase: Clase del mueble
+
+        Returns:
+            float: Tasa de descuento (0 si no aplica ninguno)
+        """
+        tasa = self._tabla.get(clase)
+        if tasa is None:
+            tasa = self._compilar(clase)
+        return tasa
+
+    def compilar(self, clases: Iterable[type]) -> None:
+        """
+        Precalcula la tasa efectiva de varias clases.
+
+        Args:
+            clases: Clases a incluir en la tabla
+        """
+        for clase in clases:
+            self._compilar(clase)
+
+    def _compilar(self, clase: type) -> float:
+        """
+        Calcula y guarda la tasa efectiva de una clase recorriendo su MRO.
+        Método privado auxiliar.
+        """
+        tasa = 0.0
+        if self._tasas:
+            for ancestro in clase.__mro__:
+                tasa_ancestro = self._tasas.get(normalizar_categoria(ancestro.__name__))
+                if tasa_ancestro is not None:
+                    tasa = tasa_ancestro
+                    break
+        self._tabla[clase] = tasa
+        return tasa
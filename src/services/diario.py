@@ -0,0 +1,193 @@
+"""
+Diario de ventas de solo anexado para recuperar las ventas tras una caída.
+
+Formato del archivo:
+    MAGIA (8 bytes) seguido de registros [longitud u32][crc32 u32][JSON utf-8]
+Cada registro es una venta (objeto JSON) o una venta en lote (lista de
+ventas), que se reproduce completa o no se reproduce.
+Un registro incompleto o con checksum inválido marca el final del diario:
+todo lo que esté después se descarta al reabrirlo para escribir.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+
+class DiarioVentas:
+    """
+    Diario de ventas con registros de longitud prefijada y checksum CRC32.
+
+    Las escrituras se agrupan: el archivo se sincroniza con fsync cada
+    `lote_fsync` registros (commit en grupo) y siempre al llamar a
+    sincronizar() o cerrar(). Con lote_fsync=1 cada venta queda en disco antes
+    de retornar.
+    """
+
+    MAGIA = b"TMDV0001"
+    _CABECERA = struct.Struct("<II")
+    # raw_decode evita la detección de codificación y de espacios de json.loads
+    _DECODIFICADOR = json.JSONDecoder()
+
+    def __init__(self, ruta: str, lote_fsync: int = 1):
+        """
+        Constructor del diario. El archivo se crea al escribir la primera venta.
+
+        Args:
+            ruta: Ruta del archivo del diario
+            lote_fsync: Número de registros entre cada fsync
+
+        Raises:
+            ValueError: Si lote_fsync es menor o igual a 0
+        """
+        if lote_fsync <= 0:
+            raise ValueError("El tamaño del lote de fsync debe ser mayor a 0")
+        self._ruta = ruta
+        self._lote_fsync = lote_fsync
+        self._archivo = None
+        self._pendientes = 0
+        self._fin_valido: Optional[int] = None
+        # Posición donde empieza el último registro anexado (para descartarlo)
+        self._inicio_ultimo: Optional[int] = None
+
+    @property
+    def ruta(self) -> str:
+        """Getter para la ruta del diario."""
+        return self._ruta
+
+    def reproducir(self) -> Iterator[Dict]:
+        """
+        Lee las ventas registradas, en orden, hasta el primer registro inválido.
+
+        Yields:
+            Dict: Cada venta registrada
+
+        Raises:
+            ValueError: Si el archivo existe pero no es un diario de ventas
+        """
+        if not os.path.exists(self._ruta) or os.path.getsize(self._ruta) == 0:
+            self._fin_valido = 0
+            return
+        cabecera = self._CABECERA
+        decodificar = self._DECODIFICADOR.raw_decode
+        with open(self._ruta, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as datos:
+            if datos[: len(self.MAGIA)] != self.MAGIA:
+                raise ValueError(f"{self._ruta} no es un diario de ventas")
+            posicion = len(self.MAGIA)
+            total = len(datos)
+            while posicion + cabecera.size <= total:
+                longitud, crc = cabecera.unpack_from(datos, posicion)
+                inicio = posicion + cabecera.size
+                fin = inicio + longitud
+                if fin > total:
+                    break
+                carga = datos[inicio:fin]
+                if zlib.crc32(carga) != crc:
+                    break
+                posicion = fin
+                registro = decodificar(carga.decode("utf-8"))[0]
+                if isinstance(registro, list):
+                    yield from registro
+                else:
+                    yield registro
+            self._fin_valido = posicion
+
+    def _abrir(self) -> None:
+        """
+        Abre el archivo para anexar, descartando una cola corrupta si existe.
+        Método privado auxiliar.
+        """
+        if self._fin_valido is None:
+            for _ in self.reproducir():
+                pass
+        self._archivo = open(self._ruta, "ab")
+        # truncate() no mueve la posición: se reubica para que tell() sea el final
+        if self._fin_valido == 0:
+            self._archivo.truncate(0)
+            self._archivo.seek(0)
+            self._archivo.write(self.MAGIA)
+        elif self._archivo.tell() != self._fin_valido:
+            self._archivo.truncate(self._fin_valido)
+            self._archivo.seek(self._fin_valido)
+        self._archivo.flush()
+
+    def registrar(self, venta: Dict) -> None:
+        """
+        Anexa una venta al diario.
+
+        Args:
+            venta: Registro de la venta (serializable como JSON)
+        """
+        self._escribir(venta)
+
+    def registrar_lote(self, ventas: List[Dict]) -> None:
+        """
+        Anexa varias ventas como un solo registro: tras una caída se
+        reproducen todas o ninguna.
+
+        Args:
+            ventas: Registros de las ventas (serializables como JSON)
+        """
+        self._escribir(list(ventas))
+
+    def _escribir(self, registro) -> None:
+        """
+        Anexa un registro y sincroniza si se completó el lote de fsync.
+        Método privado auxiliar.
+        """
+        if self._archivo is None:
+            self._abrir()
+        carga = json.dumps(registro, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        self._inicio_ultimo = self._archivo.tell()
+        self._archivo.write(self._CABECERA.pack(len(carga), zlib.crc32(carga)))
+        self._archivo.write(carga)
+        self._pendientes += 1
+        if self._pendientes >= self._lote_fsync:
+            self.sincronizar()
+
+    def descartar_ultimo(self) -> None:
+        """
+        Quita del archivo el último registro anexado y sincroniza el cambio.
+        Sirve para deshacer una venta que no se pudo aplicar tras registrarla.
+
+        Raises:
+            ValueError: Si no hay un registro recién anexado que descartar
+        """
+        if self._archivo is None or self._inicio_ultimo is None:
+            raise ValueError("No hay un registro que descartar")
+        self._archivo.flush()
+        self._archivo.truncate(self._inicio_ultimo)
+        self._archivo.seek(self._inicio_ultimo)
+        os.fsync(self._archivo.fileno())
+        self._inicio_ultimo = None
+        self._pendientes = 0
+
+    def sincronizar(self) -> None:
+        """Fuerza a disco los registros pendientes (flush + fsync)."""
+        if self._archivo is None or not self._pendientes:
+            return
+        self._archivo.flush()
+        os.fsync(self._archivo.fileno())
+        self._pendientes = 0
+
+    def cerrar(self) -> None:
+        """Sincroniza los registros pendientes y cierra el archivo."""
+        if self._archivo is None:
+            return
+        self.sincronizar()
+        self._archivo.close()
+        self._archivo = None
+        self._inicio_ultimo = None
+
+    def __enter__(self) -> "DiarioVentas":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
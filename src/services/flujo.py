@@ -0,0 +1,60 @@
+"""
+Escritura de texto generado por partes (reportes) a archivos o sockets.
+"""
+
+import io
+from typing import Iterable
+
+TAMANO_BLOQUE = 64 * 1024
+
+
+def escribir_fragmentos(
+    fragmentos: Iterable[str], destino, tamano_bloque: int = TAMANO_BLOQUE
+) -> int:
+    """
+    Escribe fragmentos de texto agrupándolos en bloques de tamaño acotado.
+
+    Nunca se arma el texto completo en memoria: los fragmentos se acumulan
+    hasta juntar `tamano_bloque` caracteres y el bloque se escribe de una vez,
+    lo que evita una llamada al sistema por línea.
+
+    Args:
+        fragmentos: Texto a escribir, en partes
+        destino: Ruta de archivo, archivo de texto, archivo binario o socket
+            (los dos últimos reciben el texto codificado en UTF-8)
+        tamano_bloque: Caracteres aproximados por escritura
+
+    Returns:
+        int: Caracteres escritos
+
+    Raises:
+        ValueError: Si tamano_bloque es menor o igual a 0
+    """
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño del bloque debe ser mayor a 0")
+    if isinstance(destino, str):
+        with open(destino, "w", encoding="utf-8") as archivo:
+            return escribir_fragmentos(fragmentos, archivo, tamano_bloque)
+
+    if hasattr(destino, "sendall"):
+        escribir = lambda texto: destino.sendall(texto.encode("utf-8"))  # noqa: E731
+    elif isinstance(destino, io.TextIOBase):
+        escribir = destino.write
+    else:
+        escribir = lambda texto: destino.write(texto.encode("utf-8"))  # noqa: E731
+
+    total = 0
+    pendientes = []
+    acumulado = 0
+    for fragmento in fragmentos:
+        pendientes.append(fragmento)
+        acumulado += len(fragmento)
+        if acumulado >= tamano_bloque:
+            escribir("".join(pendientes))
+            total += acumulado
+            pendientes.clear()
+            acumulado = 0
+    if pendientes:
+        escribir("".join(pendientes))
+        total += acumulado
+    return total
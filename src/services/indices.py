@@ -0,0 +1,475 @@
+"""
+Índices en memoria usados por TiendaMuebles para evitar recorrer el inventario.
+Cada índice trabaja con claves enteras; la tienda se encarga de traducirlas a muebles.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class IndiceNGramas:
+    """
+    Índice invertido de n-gramas para búsquedas parciales de texto.
+
+    Cada texto se normaliza a minúsculas y se descompone en todos sus n-gramas
+    (trigramas por defecto). Para cada n-grama se guarda el conjunto de claves
+    cuyo texto lo contiene, de modo que una búsqueda por subcadena se resuelve
+    intersectando listas de ocurrencias en lugar de recorrer todos los textos.
+
+    Las cargas masivas (agregar_lote) sólo guardan el texto: sus n-gramas se
+    indexan en la primera búsqueda que los necesite, para que restaurar un
+    inventario grande no pague el índice completo por adelantado. Esa
+    indexación diferida está protegida por un candado propio, ya que la
+    tienda concurrente permite varias búsquedas a la vez.
+    """
+
+    def __init__(self, n: int = 3):
+        """
+        Constructor del índice.
+
+        Args:
+            n: Tamaño de los n-gramas a indexar
+        """
+        if n <= 0:
+            raise ValueError("El tamaño de los n-gramas debe ser mayor a 0")
+        self._n = n
+        self._ocurrencias: Dict[str, Set[int]] = {}
+        self._textos: Dict[int, str] = {}
+        # Claves cargadas en lote cuyos n-gramas todavía no se indexaron
+        self._pendientes: Dict[int, None] = {}
+        self._candado_pendientes = threading.Lock()
+
+    def __len__(self) -> int:
+        """Retorna el número de textos indexados."""
+        return len(self._textos)
+
+    def texto(self, clave: int) -> Optional[str]:
+        """
+        Retorna el texto normalizado indexado bajo una clave.
+
+        Args:
+            clave: Clave a consultar
+
+        Returns:
+            Optional[str]: Texto en minúsculas o None si la clave no está
+        """
+        return self._textos.get(clave)
+
+    def _ngramas(self, texto: str) -> Set[str]:
+        """
+        Obtiene los n-gramas distintos de un texto ya normalizado.
+        Método privado auxiliar.
+        """
+        n = self._n
+        return {texto[i : i + n] for i in range(len(texto) - n + 1)}
+
+    def agregar(self, clave: int, texto: str) -> None:
+        """
+        Indexa un texto bajo una clave. Si la clave ya existía se reindexa.
+
+        Args:
+            clave: Clave entera que identifica el texto
+            texto: Texto a indexar
+        """
+        if clave in self._textos:
+            self.eliminar(clave)
+        normalizado = texto.lower() if isinstance(texto, str) else ""
+        self._textos[clave] = normalizado
+        for ngrama in self._ngramas(normalizado):
+            self._ocurrencias.setdefault(ngrama, set()).add(clave)
+
+    def agregar_lote(self, pares: Iterable[Tuple[int, str]]) -> None:
+        """
+        Guarda varios textos de una sola vez; sus n-gramas se indexan en la
+        próxima búsqueda.
+
+        Args:
+            pares: Iterable de tuplas (clave, texto)
+        """
+        textos = self._textos
+        pendientes = self._pendientes
+        for clave, texto in pares:
+            if clave in textos:
+                self.eliminar(clave)
+            textos[clave] = texto.lower() if isinstance(texto, str) else ""
+            pendientes[clave] = None
+
+    def _indexar_pendientes(self) -> None:
+        """
+        Indexa los n-gramas de los textos cargados en lote.
+        Método privado auxiliar.
+        """
+        textos = self._textos
+        ocurrencias = self._ocurrencias
+        for clave in self._pendientes:
+            for ngrama in self._ngramas(textos[clave]):
+                claves = ocurrencias.get(ngrama)
+                if claves is None:
+                    ocurrencias[ngrama] = {clave}
+                else:
+                    claves.add(clave)
+        self._pendientes.clear()
+
+    def eliminar(self, clave: int) -> None:
+        """
+        Quita una clave del índice. No hace nada si la clave no existe.
+
+        Args:
+            clave: Clave a eliminar
+        """
+        normalizado = self._textos.pop(clave, None)
+        if normalizado is None:
+            return
+        if clave in self._pendientes:
+            del self._pendientes[clave]
+            return
+        for ngrama in self._ngramas(normalizado):
+            claves = self._ocurrencias.get(ngrama)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._ocurrencias[ngrama]
+
+    def estimar(self, consulta: str) -> int:
+        """
+        Cota superior del número de claves que retornaría buscar().
+
+        Es el tamaño de la lista de ocurrencias más corta entre los n-gramas
+        de la consulta, sin intersectar nada.
+
+        Args:
+            consulta: Texto a buscar como subcadena
+
+        Returns:
+            int: Máximo de claves que pueden contener la consulta
+        """
+        consulta = consulta.lower()
+        if len(consulta) < self._n:
+            return len(self._textos)
+        if self._pendientes:
+            with self._candado_pendientes:
+                if self._pendientes:
+                    self._indexar_pendientes()
+        return min(len(self._ocurrencias.get(g, ())) for g in self._ngramas(consulta))
+
+    def buscar(self, consulta: str) -> Set[int]:
+        """
+        Busca las claves cuyo texto contiene la consulta (case-insensitive).
+
+        Las consultas más cortas que un n-grama no pueden resolverse con el
+        índice y se comparan directamente contra los textos ya normalizados.
+
+        Args:
+            consulta: Texto a buscar como subcadena
+
+        Returns:
+            Set[int]: Claves de los textos que contienen la consulta
+        """
+        consulta = consulta.lower()
+        if len(consulta) < self._n:
+            return {c for c, texto in self._textos.items() if consulta in texto}
+
+        if self._pendientes:
+            with self._candado_pendientes:
+                if self._pendientes:
+                    self._indexar_pendientes()
+        listas = []
+        for ngrama in self._ngramas(consulta):
+            claves = self._ocurrencias.get(ngrama)
+            if not claves:
+                return set()
+            listas.append(claves)
+        listas.sort(key=len)
+
+        candidatos = set(listas[0])
+        for claves in listas[1:]:
+            candidatos &= claves
+            if not candidatos:
+                return candidatos
+
+        # Los n-gramas no garantizan el orden: verificar la subcadena completa
+        textos = self._textos
+        return {c for c in candidatos if consulta in textos[c]}
+
+
+class IndicePrecios:
+    """
+    Índice ordenado por precio para consultas por rango.
+
+    Mantiene una lista ordenada de pares (precio, clave); las consultas por
+    rango se resuelven con búsqueda binaria en O(log n + k) y devuelven las
+    claves ya ordenadas por precio. A igual precio se respeta el orden de las
+    claves, que coincide con el orden de llegada al inventario.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._orden: List[Tuple[float, int]] = []
+        self._precios: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        """Retorna el número de claves indexadas."""
+        return len(self._precios)
+
+    def precio(self, clave: int) -> Optional[float]:
+        """
+        Retorna el precio indexado para una clave.
+
+        Args:
+            clave: Clave a consultar
+
+        Returns:
+            Optional[float]: Precio indexado o None si la clave no está
+        """
+        return self._precios.get(clave)
+
+    def agregar(self, clave: int, precio: float) -> None:
+        """
+        Indexa una clave con su precio. Si la clave ya existía se actualiza.
+
+        Args:
+            clave: Clave del mueble
+            precio: Precio calculado del mueble
+        """
+        if clave in self._precios:
+            self.eliminar(clave)
+        self._precios[clave] = precio
+        insort(self._orden, (precio, clave))
+
+    def agregar_lote(self, pares: Iterable[Tuple[int, float]]) -> None:
+        """
+        Indexa varias claves de una sola vez con un único reordenamiento.
+
+        Args:
+            pares: Iterable de tuplas (clave, precio)
+        """
+        nuevos = []
+        for clave, precio in pares:
+            if clave in self._precios:
+                self.eliminar(clave)
+            self._precios[clave] = precio
+            nuevos.append((precio, clave))
+        nuevos.sort()
+        # Timsort detecta las dos secuencias ya ordenadas y las mezcla en tiempo lineal
+        self._orden.extend(nuevos)
+        self._orden.sort()
+
+    def eliminar(self, clave: int) -> None:
+        """
+        Quita una clave del índice. No hace nada si la clave no existe.
+
+        Args:
+            clave: Clave a eliminar
+        """
+        precio = self._precios.pop(clave, None)
+        if precio is None:
+            return
+        posicion = bisect_left(self._orden, (precio, clave))
+        del self._orden[posicion]
+
+    def recorrer(self, descendente: bool = False) -> Iterator[int]:
+        """
+        Recorre las claves en orden de precio sin copiar el índice.
+        El índice no debe modificarse mientras dura el recorrido.
+
+        Args:
+            descendente: Si True, del precio más alto al más bajo (y, a igual
+                precio, de la clave mayor a la menor)
+
+        Yields:
+            int: Claves en orden de precio
+        """
+        pares = reversed(self._orden) if descendente else iter(self._orden)
+        for _, clave in pares:
+            yield clave
+
+    def rango(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List[int]:
+        """
+        Obtiene las claves con precio dentro del rango, ordenadas por precio.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+
+        Returns:
+            List[int]: Claves ordenadas de menor a mayor precio
+        """
+        inicio = bisect_left(self._orden, (precio_min,))
+        fin = bisect_right(self._orden, (precio_max, float("inf")))
+        return [clave for _, clave in self._orden[inicio:fin]]
+
+    def contar(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> int:
+        """
+        Cuenta las claves con precio dentro del rango en O(log n).
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+
+        Returns:
+            int: Número de claves en el rango
+        """
+        inicio = bisect_left(self._orden, (precio_min,))
+        fin = bisect_right(self._orden, (precio_max, float("inf")))
+        return max(0, fin - inicio)
+
+
+class IndiceAgrupado:
+    """
+    Índice hash que agrupa claves bajo uno o varios grupos.
+
+    Cada grupo conserva sus claves en orden ascendente (orden de inventario),
+    por lo que una consulta cuesta O(1) más el tamaño del resultado y el número
+    de elementos por grupo se obtiene sin recorrer nada. El orden se mantiene
+    al escribir: las consultas sólo leen, así que pueden ejecutarse en paralelo
+    bajo un candado de lectura compartido.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._grupos: Dict[Hashable, Dict[int, None]] = {}
+        self._grupos_de: Dict[int, Tuple[Hashable, ...]] = {}
+
+    def __len__(self) -> int:
+        """Retorna el número de claves indexadas."""
+        return len(self._grupos_de)
+
+    def agregar(self, clave: int, grupos: Iterable[Hashable]) -> None:
+        """
+        Indexa una clave bajo los grupos indicados. Si la clave ya existía
+        se reemplazan sus grupos anteriores.
+
+        Args:
+            clave: Clave del mueble
+            grupos: Grupos a los que pertenece la clave
+        """
+        if clave in self._grupos_de:
+            self.eliminar(clave)
+        grupos = tuple(grupos)
+        self._grupos_de[clave] = grupos
+        for grupo in grupos:
+            claves = self._grupos.setdefault(grupo, {})
+            if claves and clave < next(reversed(claves)):
+                # Una clave antigua que llega tarde (ej: cambio de material):
+                # se inserta en su posición reconstruyendo el grupo, O(m)
+                orden = list(claves)
+                insort(orden, clave)
+                self._grupos[grupo] = dict.fromkeys(orden)
+            else:
+                claves[clave] = None
+
+    def agregar_lote(self, pares: Iterable[Tuple[int, Iterable[Hashable]]]) -> None:
+        """
+        Indexa varias claves de una sola vez.
+
+        Las claves se agrupan primero por combinación de grupos, de modo que
+        cada grupo se extiende con una sola operación por combinación.
+
+        Args:
+            pares: Iterable de tuplas (clave, grupos)
+        """
+        grupos_de = self._grupos_de
+        por_grupos: Dict[Tuple[Hashable, ...], List[int]] = {}
+        for clave, grupos in pares:
+            if clave in grupos_de:
+                self.eliminar(clave)
+            grupos = tuple(grupos)
+            grupos_de[clave] = grupos
+            claves = por_grupos.get(grupos)
+            if claves is None:
+                por_grupos[grupos] = [clave]
+            else:
+                claves.append(clave)
+        for grupos, claves in por_grupos.items():
+            if any(a > b for a, b in zip(claves, claves[1:])):
+                claves.sort()
+            for grupo in grupos:
+                actuales = self._grupos.get(grupo)
+                if actuales is None:
+                    self._grupos[grupo] = dict.fromkeys(claves)
+                elif claves[0] > next(reversed(actuales)):
+                    actuales.update(dict.fromkeys(claves))
+                else:
+                    # Dos tramos ordenados: timsort los mezcla en tiempo lineal
+                    self._grupos[grupo] = dict.fromkeys(sorted([*actuales, *claves]))
+
+    def eliminar(self, clave: int) -> None:
+        """
+        Quita una clave de todos sus grupos. No hace nada si no existe.
+
+        Args:
+            clave: Clave a eliminar
+        """
+        for grupo in self._grupos_de.pop(clave, ()):
+            claves = self._grupos[grupo]
+            del claves[clave]
+            if not claves:
+                del self._grupos[grupo]
+
+    def claves(self, grupo: Hashable) -> List[int]:
+        """
+        Obtiene las claves de un grupo en orden ascendente.
+
+        Args:
+            grupo: Grupo a consultar
+
+        Returns:
+            List[int]: Claves del grupo (vacía si el grupo no existe)
+        """
+        return list(self._grupos.get(grupo, ()))
+
+    def primeras(self, grupo: Hashable, cantidad: int) -> List[int]:
+        """
+        Obtiene las claves menores de un grupo sin copiar el grupo completo.
+
+        Args:
+            grupo: Grupo a consultar
+            cantidad: Máximo de claves a retornar
+
+        Returns:
+            List[int]: Hasta `cantidad` claves del grupo en orden ascendente
+        """
+        if cantidad <= 0:
+            return []
+        return list(islice(self._grupos.get(grupo, ()), cantidad))
+
+    def contiene(self, grupo: Hashable, clave: int) -> bool:
+        """
+        Indica si una clave pertenece a un grupo, en O(1).
+
+        Args:
+            grupo: Grupo a consultar
+            clave: Clave a buscar
+
+        Returns:
+            bool: True si la clave está en el grupo
+        """
+        claves = self._grupos.get(grupo)
+        return claves is not None and clave in claves
+
+    def conteo(self, grupo: Hashable) -> int:
+        """
+        Retorna cuántas claves pertenecen a un grupo.
+
+        Args:
+            grupo: Grupo a consultar
+
+        Returns:
+            int: Número de claves del grupo
+        """
+        return len(self._grupos.get(grupo, ()))
+
+    def conteos(self) -> Dict[Hashable, int]:
+        """
+        Retorna el número de claves de cada grupo.
+
+        Returns:
+            Dict[Hashable, int]: Conteo por grupo
+        """
+        return {grupo: len(claves) for grupo, claves in self._grupos.items()}
@@ -0,0 +1,242 @@
+"""
+Instantánea binaria del estado de la tienda para guardarlo y cargarlo rápido.
+
+Formato del archivo (versión 1):
+    MAGIA (8 bytes) + longitud u64 de la cabecera + cabecera JSON utf-8,
+    seguida de un bloque de registros binarios por cada disposición de clase.
+La cabecera contiene la tabla de cadenas, la disposición de cada bloque
+(clase, campos, formato struct, cantidad y desplazamiento) y el estado
+adicional que guarda la tienda (comedores, descuentos, ventas, etc.).
+"""
+
+import gc
+import importlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Tuple
+
+MAGIA = b"TMIN0001"
+_CABECERA = struct.Struct("<8sQ")
+
+# Atributos que no se guardan: se reconstruyen vacíos al cargar
+ATRIBUTOS_TRANSITORIOS = {"_observadores": list, "_precio_cache": lambda: None}
+
+# Tipos de columna. Los tres primeros son códigos struct; las cadenas y los
+# valores JSON se guardan como índice ("I") en la tabla de cadenas
+_BOOL, _ENTERO, _REAL, _CADENA, _JSON = "?", "q", "d", "s", "j"
+_ENTERO_MIN, _ENTERO_MAX = -(2**63), 2**63 - 1
+
+
+def _tipo_columna(valores: List) -> str:
+    """
+    Elige el tipo de una columna según los valores que contiene.
+    Las columnas mixtas (ej: int y float) o con otros tipos se guardan como JSON.
+    Función privada auxiliar.
+    """
+    tipos = {type(v) for v in valores}
+    if tipos == {bool}:
+        return _BOOL
+    if tipos == {int} and all(_ENTERO_MIN <= v <= _ENTERO_MAX for v in valores):
+        return _ENTERO
+    if tipos == {float}:
+        return _REAL
+    if tipos <= {str, type(None)}:
+        return _CADENA
+    return _JSON
+
+
+def ruta_clase(clase: type) -> str:
+    """Nombre importable de una clase ("modulo:Clase")."""
+    return f"{clase.__module__}:{clase.__qualname__}"
+
+
+def importar_clase(ruta: str) -> type:
+    """
+    Importa una clase a partir de su nombre "modulo:Clase".
+
+    Args:
+        ruta: Nombre generado por ruta_clase()
+
+    Returns:
+        type: Clase importada
+    """
+    modulo, _, nombre = ruta.partition(":")
+    objeto = importlib.import_module(modulo)
+    for parte in nombre.split("."):
+        objeto = getattr(objeto, parte)
+    return objeto
+
+
+def escribir_instantanea(ruta: str, objetos: List, estado: Dict) -> None:
+    """
+    Guarda una lista de objetos y un estado JSON en una instantánea binaria.
+
+    Los objetos se agrupan por clase y atributos; cada grupo se guarda como
+    registros de tamaño fijo con una columna por atributo. El archivo se
+    escribe en uno temporal y luego se renombra, de modo que una caída a
+    mitad de la escritura no deja una instantánea corrupta.
+
+    Args:
+        ruta: Ruta del archivo a escribir
+        objetos: Objetos a guardar; su posición en la lista los identifica al cargar
+        estado: Datos adicionales serializables como JSON
+
+    Raises:
+        ValueError: Si un atributo no se puede serializar
+    """
+    grupos: Dict[Tuple[type, Tuple[str, ...]], List[int]] = {}
+    for posicion, objeto in enumerate(objetos):
+        campos = tuple(vars(objeto))
+        grupos.setdefault((type(objeto), campos), []).append(posicion)
+
+    cadenas: List = [None]
+    codigos: Dict[str, int] = {}
+
+    def codigo_cadena(valor) -> int:
+        if valor is None:
+            return 0
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(cadenas)
+            cadenas.append(valor)
+        return codigo
+
+    bloques = []
+    datos = []
+    desplazamiento = 0
+    for (clase, atributos), posiciones in grupos.items():
+        campos = [c for c in atributos if c not in ATRIBUTOS_TRANSITORIOS]
+        columnas = [posiciones]
+        tipos = ""
+        for campo in campos:
+            valores = [vars(objetos[p])[campo] for p in posiciones]
+            tipo = _tipo_columna(valores)
+            if tipo == _JSON:
+                try:
+                    valores = [json.dumps(v, ensure_ascii=False) for v in valores]
+                except TypeError as e:
+                    raise ValueError(
+                        f"No se puede guardar {clase.__name__}.{campo}: {e}"
+                    ) from e
+            if tipo in (_CADENA, _JSON):
+                valores = [codigo_cadena(v) for v in valores]
+            columnas.append(valores)
+            tipos += tipo
+        formato = "q" + "".join("I" if t in (_CADENA, _JSON) else t for t in tipos)
+        registro = struct.Struct("<" + formato)
+        bloque = b"".join(registro.pack(*fila) for fila in zip(*columnas))
+        bloques.append(
+            {
+                "clase": ruta_clase(clase),
+                "campos": campos,
+                "tipos": tipos,
+                "formato": formato,
+                "transitorios": [c for c in atributos if c in ATRIBUTOS_TRANSITORIOS],
+                "cantidad": len(posiciones),
+                "desplazamiento": desplazamiento,
+            }
+        )
+        datos.append(bloque)
+        desplazamiento += len(bloque)
+
+    cabecera = json.dumps(
+        {
+            "objetos": len(objetos),
+            "cadenas": cadenas,
+            "bloques": bloques,
+            "estado": estado,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, len(cabecera)))
+        archivo.write(cabecera)
+        for bloque in datos:
+            archivo.write(bloque)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+def leer_instantanea(ruta: str) -> Tuple[List, Dict]:
+    """
+    Carga los objetos y el estado guardados con escribir_instantanea().
+
+    El archivo se mapea en memoria y cada bloque se decodifica por columnas;
+    los objetos se crean sin llamar a __init__ y reciben sus atributos
+    directamente.
+
+    Args:
+        ruta: Ruta de la instantánea
+
+    Returns:
+        Tuple[List, Dict]: Objetos en su posición original y estado adicional
+
+    Raises:
+        ValueError: Si el archivo no es una instantánea válida de esta versión
+    """
+    # Crear millones de objetos dispara el recolector cíclico sin necesidad
+    recolector_activo = gc.isenabled()
+    gc.disable()
+    try:
+        return _leer_instantanea(ruta)
+    finally:
+        if recolector_activo:
+            gc.enable()
+
+
+def _leer_instantanea(ruta: str) -> Tuple[List, Dict]:
+    """Implementación de leer_instantanea(). Función privada auxiliar."""
+    with open(ruta, "rb") as archivo:
+        if os.fstat(archivo.fileno()).st_size < _CABECERA.size:
+            raise ValueError(f"{ruta} no es una instantánea de la tienda")
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            magia, longitud = _CABECERA.unpack_from(datos, 0)
+            if magia != MAGIA:
+                raise ValueError(
+                    f"{ruta} no es una instantánea de la tienda (o es de otra versión)"
+                )
+            inicio = _CABECERA.size + longitud
+            cabecera = json.loads(datos[_CABECERA.size : inicio].decode("utf-8"))
+            cadenas = cabecera["cadenas"]
+            objetos: List = [None] * cabecera["objetos"]
+            for bloque in cabecera["bloques"]:
+                registro = struct.Struct("<" + bloque["formato"])
+                desde = inicio + bloque["desplazamiento"]
+                hasta = desde + registro.size * bloque["cantidad"]
+                if hasta > len(datos):
+                    raise ValueError(f"La instantánea {ruta} está incompleta")
+                columnas = list(zip(*registro.iter_unpack(datos[desde:hasta])))
+                _crear_objetos(bloque, columnas, cadenas, objetos)
+    return objetos, cabecera["estado"]
+
+
+def _crear_objetos(bloque: Dict, columnas: List, cadenas: List, objetos: List) -> None:
+    """
+    Reconstruye los objetos de un bloque a partir de sus columnas.
+    Función privada auxiliar.
+    """
+    posiciones, columnas = columnas[0], columnas[1:]
+    for i, tipo in enumerate(bloque["tipos"]):
+        if tipo == _CADENA:
+            columnas[i] = map(cadenas.__getitem__, columnas[i])
+        elif tipo == _JSON:
+            columnas[i] = [json.loads(cadenas[c]) for c in columnas[i]]
+    filas = zip(*columnas) if columnas else [()] * len(posiciones)
+
+    clase = importar_clase(bloque["clase"])
+    nuevo = clase.__new__
+    campos = bloque["campos"]
+    transitorios = [(c, ATRIBUTOS_TRANSITORIOS[c]) for c in bloque["transitorios"]]
+    for posicion, fila in zip(posiciones, filas):
+        objeto = nuevo(clase)
+        atributos = dict(zip(campos, fila))
+        for campo, crear in transitorios:
+            atributos[campo] = crear()
+        objeto.__dict__ = atributos
+        objetos[posicion] = objeto
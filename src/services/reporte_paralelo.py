@@ -0,0 +1,196 @@
+"""
+Agregados del reporte de inventario calculados en paralelo con varios procesos.
+"""
+
+import math
+import multiprocessing
+import os
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from services.agregados import SumaExacta
+from services.columnar import InstantaneaColumnar
+
+
+class AgregadosInventario(NamedTuple):
+    """
+    Agregados del inventario usados por el reporte.
+
+    Attributes:
+        conteo_tipos: Cantidad de muebles por tipo
+        conteo_materiales: Cantidad de muebles por material normalizado
+        valor_tipos: Suma exacta de precios por tipo
+        valor_total: Suma exacta de todos los precios
+        histograma: Conteo de precios por intervalo de los límites dados
+    """
+
+    conteo_tipos: Dict[str, int]
+    conteo_materiales: Dict[str, int]
+    valor_tipos: Dict[str, float]
+    valor_total: float
+    histograma: List[int]
+
+
+def _agregar_bloque(
+    tipos: Sequence[int],
+    materiales: Sequence[int],
+    precios: Sequence[float],
+    limites: Sequence[float],
+) -> Tuple[Counter, Counter, Dict[int, SumaExacta], List[int]]:
+    """
+    Agregados parciales de un bloque de filas columnares, por código.
+    Se ejecuta en los procesos de trabajo. Función privada auxiliar.
+    """
+    precios_tipo: Dict[int, List[float]] = {}
+    histograma = [0] * (len(limites) + 1)
+    for tipo, precio in zip(tipos, precios):
+        if precio == precio:
+            lista = precios_tipo.get(tipo)
+            if lista is None:
+                lista = precios_tipo[tipo] = []
+            lista.append(precio)
+            histograma[bisect_right(limites, precio)] += 1
+    sumas = {}
+    for tipo, lista in precios_tipo.items():
+        suma = sumas[tipo] = SumaExacta()
+        suma.agregar_lote(lista)
+    return Counter(tipos), Counter(materiales), sumas, histograma
+
+
+def agregados_paralelos(
+    columnar: InstantaneaColumnar,
+    limites: Sequence[float],
+    procesos: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> AgregadosInventario:
+    """
+    Calcula los agregados del inventario repartiendo las filas en bloques.
+
+    Cada proceso recibe sólo las columnas de su bloque (arreglos compactos,
+    baratos de serializar) y retorna conteos, sumas exactas por tipo e
+    histograma; los parciales se combinan sin error de redondeo, así que el
+    resultado no depende del número de procesos. Con un solo proceso y sin
+    executor se usan los agregados vectorizados de la instantánea
+    (agregados_columnares()), que también son exactos.
+
+    Args:
+        columnar: Instantánea columnar del inventario
+        limites: Límites ordenados del histograma de precios
+        procesos: Número de bloques y de procesos (por defecto, los núcleos)
+        executor: Executor a reutilizar; si no se indica se crea un
+            ProcessPoolExecutor para esta llamada
+
+    Returns:
+        AgregadosInventario: Agregados combinados
+
+    Raises:
+        ValueError: Si procesos es menor o igual a 0
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if procesos <= 0:
+        raise ValueError("El número de procesos debe ser mayor a 0")
+    limites = list(limites)
+    if executor is None and procesos == 1:
+        return agregados_columnares(columnar, limites)
+    total = len(columnar)
+    tamano = max(1, math.ceil(total / procesos))
+    cortes = [(i, i + tamano) for i in range(0, total, tamano)]
+    argumentos = (
+        [columnar.tipos[a:b] for a, b in cortes],
+        [columnar.materiales[a:b] for a, b in cortes],
+        [columnar.precios[a:b] for a, b in cortes],
+        [limites] * len(cortes),
+    )
+    if executor is not None:
+        parciales = list(executor.map(_agregar_bloque, *argumentos))
+    elif cortes:
+        with ProcessPoolExecutor(
+            min(procesos, len(cortes)), mp_context=_contexto_procesos()
+        ) as pool:
+            parciales = list(pool.map(_agregar_bloque, *argumentos))
+    else:
+        parciales = []
+    return _combinar(columnar, parciales, len(limites))
+
+
+def agregados_columnares(
+    columnar: InstantaneaColumnar, limites: Sequence[float]
+) -> AgregadosInventario:
+    """
+    Calcula los agregados en el proceso actual con los métodos de la
+    instantánea (vectorizados con NumPy si está disponible).
+
+    Args:
+        columnar: Instantánea columnar del inventario
+        limites: Límites ordenados del histograma de precios
+
+    Returns:
+        AgregadosInventario: Los mismos agregados que agregados_paralelos()
+    """
+    return AgregadosInventario(
+        conteo_tipos=columnar.conteo_por("tipo"),
+        conteo_materiales={
+            material: n for material, n in columnar.conteo_por("material").items() if material
+        },
+        valor_tipos=columnar.suma_por_tipo(),
+        valor_total=columnar.valor_total(),
+        histograma=columnar.histograma_precios(limites),
+    )
+
+
+def _contexto_procesos():
+    """
+    Contexto de multiprocessing para los procesos de trabajo.
+    Evita fork: la tienda puede estar atendiendo peticiones en otros hilos
+    (ui.servidor) y un proceso hijo heredaría sus candados tomados.
+    Función privada auxiliar.
+    """
+    metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(metodo)
+
+
+def _combinar(
+    columnar: InstantaneaColumnar, parciales: List, intervalos: int
+) -> AgregadosInventario:
+    """
+    Combina los agregados parciales y traduce los códigos a texto.
+    Función privada auxiliar.
+    """
+    conteo_tipos: Counter = Counter()
+    conteo_materiales: Counter = Counter()
+    sumas: Dict[int, SumaExacta] = {}
+    histograma = [0] * (intervalos + 1)
+    for tipos, materiales, sumas_bloque, histograma_bloque in parciales:
+        conteo_tipos.update(tipos)
+        conteo_materiales.update(materiales)
+        for tipo, suma in sumas_bloque.items():
+            if tipo in sumas:
+                sumas[tipo].combinar(suma)
+            else:
+                sumas[tipo] = suma
+        histograma = [a + b for a, b in zip(histograma, histograma_bloque)]
+
+    total = SumaExacta()
+    for suma in sumas.values():
+        total.combinar(suma)
+    # Se recorren los códigos en orden para que el resultado sea estable
+    return AgregadosInventario(
+        conteo_tipos={
+            columnar.decodificar("tipo", c): n for c, n in sorted(conteo_tipos.items())
+        },
+        conteo_materiales={
+            columnar.decodificar("material", c): n
+            for c, n in sorted(conteo_materiales.items())
+            if columnar.decodificar("material", c)
+        },
+        valor_tipos={
+            columnar.decodificar("tipo", c): s.valor()
+            for c, s in sorted(sumas.items())
+            if s.valor()
+        },
+        valor_total=total.valor(),
+        histograma=histograma,
+    )
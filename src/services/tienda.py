@@ -3,15 +3,73 @@ Servicio de la tienda que maneja la lógica de negocio.
 Esta clase implementa el patrón de servicio para separar la lógica de negocio de la UI.
 """
 
-from typing import List, Dict, Optional, Union
+import gc
+import heapq
+from bisect import bisect_right
+import math
+from abc import ABC
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 # Corrección de imports para ejecución directa
 from models.mueble import Mueble
 from models.composicion.comedor import Comedor
+from services.agregados import ResumenVentas, SumaExacta
+from services.almacenes import AlmacenInventario, AlmacenMemoria
+from services.cache_consultas import CacheConsultas
+from services.columnar import InstantaneaColumnar
+from services.descuentos import MotorDescuentos, clases_de
+from services.consultas import PlanConsulta, Predicado, rango_texto
+from services.concurrencia import (
+    CandadoLectoresEscritor,
+    CandadosPorClave,
+    SinCandado,
+    con_escritura,
+    con_lectura,
+)
+from services.diario import DiarioVentas
+from services.flujo import escribir_fragmentos
+from services.indices import IndiceAgrupado
+from services.instantanea import escribir_instantanea, leer_instantanea
+from services.reporte_paralelo import agregados_paralelos
 # TODO: Importar las clases necesarias
 
 
+class ResultadoCargaLote(NamedTuple):
+    """
+    Resultado de una carga masiva de muebles.
+
+    Attributes:
+        agregados: Número de muebles agregados al inventario
+        rechazados: Tuplas (posición, mueble, motivo) de los muebles rechazados
+    """
+
+    agregados: int
+    rechazados: List[Tuple[int, object, str]]
+
+
+class PaginaInventario(NamedTuple):
+    """
+    Página del inventario obtenida con TiendaMuebles.pagina_inventario().
+
+    Attributes:
+        muebles: Muebles de la página, en orden de SKU
+        siguiente: Cursor para pedir la página siguiente (None si es la última)
+        total: Muebles en inventario al momento de la consulta
+    """
+
+    muebles: List[Mueble]
+    siguiente: Optional[str]
+    total: int
+
+
 class TiendaMuebles:
+    # Límites de los intervalos de precio usados en el reporte de inventario
+    LIMITES_PRECIO_REPORTE = (100, 250, 500, 1000, 2500)
+    # Candidatos que consultar() comprueba en cada toma del candado de lectura
+    _BLOQUE_CONSULTA = 256
+
     def __init__(self):
         """
         Inicializa una nueva instancia de TiendaMuebles.
@@ -24,15 +82,17 @@ class TiendaMuebles:
         self._valor_total_ventas = 0.0
 
     @property
+    @con_lectura
     def inventario(self) -> List[Mueble]:
         """
-        Propiedad que expone el inventario de la tienda.
+        Propiedad que expone el inventario de la tienda en orden de llegada.
         
         Returns:
             List[Mueble]: Lista de productos en el inventario
         """
-        return self._inventario
+        return list(self._inventario.values())
 
+    @con_escritura
     def agregar_producto(self, producto: Mueble) -> None:
         """
         Agrega un producto al inventario de la tienda.
@@ -40,7 +100,9 @@ class TiendaMuebles:
         Args:
             producto (Mueble): El producto a agregar al inventario
         """
-        self._inventario.append(producto)
+        if id(producto) in self._skus:
+            return
+        self._registrar(producto)
         if isinstance(producto, Comedor):
             self._comedores.append(producto)
 
@@ -54,54 +116,94 @@ class TiendaMuebles:
         Returns:
             bool: True si se vendió el producto, False si no se encontró
         """
-        for i, producto in enumerate(self._inventario):
-            if producto.nombre == nombre_producto:
-                vendido = self._inventario.pop(i)
-                if isinstance(vendido, Comedor):
-                    self._comedores.remove(vendido)
-                self._ventas_realizadas.append(vendido)
-                self._total_muebles_vendidos += 1
-                self._valor_total_ventas += vendido.calcular_precio()
-                print(f"Producto {nombre_producto} vendido")
-                return True
-        return False
+        while True:
+            with self._candado.lectura():
+                skus = self._indice_nombres.primeras(nombre_producto, 1)
+                if not skus:
+                    return False
+                sku = skus[0]
+                vendido = self._inventario[sku]
+            with self._candados_sku.clave(sku):
+                if self._skus.get(id(vendido)) != sku:
+                    # Otro hilo lo vendió mientras se esperaba: se suelta el
+                    # candado del SKU y se busca otro con ese nombre
+                    continue
+                precio = vendido.calcular_precio()
+                with self._candado.escritura():
+                    self._anotar_venta(
+                        {
+                            "mueble": nombre_producto,
+                            "sku": sku,
+                            "tipo": type(vendido).__name__,
+                            "cliente": "Cliente Anónimo",
+                            "precio_original": precio,
+                            "descuento": 0,
+                            "precio_final": precio,
+                            "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        },
+                        vendido,
+                    )
+                    if isinstance(vendido, Comedor):
+                        self._comedores.remove(vendido)
+            break
+        print(f"Producto {nombre_producto} vendido")
+        return True
 
+    def vender_unidades(
+        self, nombre_producto: str, cantidad: int, cliente: str = "Cliente Anónimo"
+    ) -> Dict:
+        """
+        Vende varias unidades de un producto por su nombre exacto.
+
+        Se venden las unidades más antiguas del inventario como una sola venta
+        en lote (ver realizar_ventas_lote): si no hay unidades suficientes no
+        se vende ninguna.
+
+        Args:
+            nombre_producto: Nombre exacto del producto
+            cantidad: Unidades a vender
+            cliente: Nombre del cliente
+
+        Returns:
+            Dict: Comprobante combinado de la venta, o error
+        """
+        if cantidad <= 0:
+            return {"error": "La cantidad debe ser mayor a 0"}
+        while True:
+            with self._candado.lectura():
+                skus = self._indice_nombres.primeras(nombre_producto, cantidad)
+                muebles = [self._inventario[sku] for sku in skus]
+            if len(muebles) < cantidad:
+                return {
+                    "error": f"Sólo hay {len(muebles)} unidades de {nombre_producto} en inventario"
+                }
+            resultado = self.realizar_ventas_lote(muebles, cliente)
+            if "error" in resultado and any(id(m) not in self._skus for m in muebles):
+                # Otro hilo vendió alguna de las unidades elegidas: elegir de nuevo
+                continue
+            return resultado
+
+    @con_lectura
     def obtener_estadisticas(self) -> dict:
         """
         Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Los valores salen de acumuladores incrementales, sin recorrer el inventario.
         Returns:
             dict: Diccionario con estadísticas
         """
+        if self._verificar_agregados:
+            self.verificar_agregados()
         try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
-            # Acumulativos
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
             return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
+                "total_muebles": len(self._inventario),
+                "total_comedores": len(self._comedores),
+                "valor_inventario": self._valor_inventario.valor(),
+                "tipos_muebles": self._contar_tipos_muebles(),
+                "materiales": self._almacen.conteo_materiales(),
                 "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
+                "ventas_realizadas": len(self._ventas_realizadas),
+                "total_muebles_vendidos": self._total_muebles_vendidos,
+                "valor_total_ventas": self._valor_total_ventas,
             }
         except Exception:
             return {
@@ -109,59 +211,56 @@ class TiendaMuebles:
                 "total_comedores": 0,
                 "valor_inventario": 0.0,
                 "tipos_muebles": {},
+                "materiales": {},
                 "descuentos_activos": {},
                 "ventas_realizadas": 0,
                 "total_muebles_vendidos": 0,
                 "valor_total_ventas": 0.0,
             }
 
+    @con_lectura
     def estadisticas(self) -> dict:
         """
-        Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Alias de obtener_estadisticas() conservado por compatibilidad con la UI.
         Returns:
             dict: Diccionario con estadísticas
         """
-        try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
+        return self.obtener_estadisticas()
+
+    @con_lectura
+    def verificar_agregados(self) -> None:
+        """
+        Recalcula desde cero los acumuladores y los compara con los incrementales.
+        Se ejecuta automáticamente en cada consulta de estadísticas cuando la
+        tienda se crea con verificar_agregados=True.
+
+        Raises:
+            RuntimeError: Si algún acumulador no coincide con el recálculo
+        """
+        precios = []
+        tipos: Dict[str, int] = {}
+        for mueble in self._inventario.values():
+            # Descartar el precio memoizado para recalcular realmente desde cero
+            invalidar = getattr(mueble, "invalidar_precio", None)
+            if callable(invalidar):
+                invalidar()
+            try:
+                precio = mueble.calcular_precio()
+            except Exception:
+                precio = None
+            if self._es_precio_valido(precio):
+                precios.append(precio)
+            tipo = type(mueble).__name__
+            tipos[tipo] = tipos.get(tipo, 0) + 1
+        valor = math.fsum(precios)
+        if valor != self._valor_inventario.valor():
+            raise RuntimeError(
+                f"Valor de inventario inconsistente: {self._valor_inventario.valor()} != {valor}"
+            )
+        if tipos != self._conteo_tipos:
+            raise RuntimeError(
+                f"Conteo por tipos inconsistente: {self._conteo_tipos} != {tipos}"
             )
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
-            return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
-            }
-        except Exception:
-            return {
-                "total_muebles": 0,
-                "total_comedores": 0,
-                "valor_inventario": 0.0,
-                "tipos_muebles": {},
-                "descuentos_activos": {},
-                "ventas_realizadas": 0,
-                "total_muebles_vendidos": 0,
-                "valor_total_ventas": 0.0,
-            }
 
     """
     Clase que maneja toda la lógica de negocio de la tienda de muebles.
@@ -178,21 +277,79 @@ class TiendaMuebles:
     - Composición: Contiene colecciones de muebles
     """
 
-    def __init__(self, nombre_tienda: str = "Mueblería OOP"):
+    def __init__(
+        self,
+        nombre_tienda: str = "Mueblería OOP",
+        verificar_agregados: bool = False,
+        diario: Optional[DiarioVentas] = None,
+        almacen: Optional[AlmacenInventario] = None,
+        concurrente: bool = False,
+        cache_consultas: int = 256,
+    ):
         """
         Constructor de la tienda.
 
         Args:
             nombre_tienda: Nombre de la tienda
+            verificar_agregados: Si True, cada consulta de estadísticas recalcula
+                los acumuladores desde cero y falla ante cualquier diferencia
+            diario: Diario de ventas donde se registra cada venta; si se indica,
+                las ventas ya registradas se reproducen al crear la tienda
+            almacen: Dónde se guardan e indexan los muebles (en memoria por
+                defecto); si el almacén ya tiene muebles se cargan al inventario
+            concurrente: Si True, la tienda puede usarse desde varios hilos: las
+                consultas comparten un candado de lectura, las modificaciones lo
+                toman en exclusiva y cada venta bloquea además el SKU vendido
+            cache_consultas: Máximo de resultados de búsquedas y filtros que se
+                guardan para repetirlos sin consultar los índices (0 lo desactiva)
         """
         self._nombre = nombre_tienda
-        self._inventario: List[Mueble] = []
+        self._concurrente = concurrente
+        if concurrente:
+            self._candado = CandadoLectoresEscritor()
+            self._candados_sku = CandadosPorClave()
+        else:
+            self._candado = self._candados_sku = SinCandado()
+        # Inventario por SKU; el dict conserva el orden de llegada
+        self._inventario: Dict[int, Mueble] = {}
         self._comedores: List[Comedor] = []
         self._ventas_realizadas: List[Dict] = []
         self._descuentos_activos: Dict[str, float] = {}
         # Campos acumulativos
         self._total_muebles_vendidos: int = 0
         self._valor_total_ventas: float = 0.0
+        # Ventas por minuto, hora y día en búferes circulares de tamaño fijo
+        self._resumen_ventas = ResumenVentas()
+        # SKUs estables: id(mueble) -> sku; los índices trabajan con SKUs
+        self._ultimo_sku: int = 0
+        self._skus: Dict[int, int] = {}
+        # SKUs en orden ascendente para paginar con cursor; las bajas se
+        # descartan al compactar, cuando superan a los SKUs vigentes
+        self._orden_skus: List[int] = []
+        self._bajas_orden_skus = 0
+        # Nombres, precios y materiales se indexan en el almacén
+        self._almacen = almacen if almacen is not None else AlmacenMemoria()
+        # Bloques modificaciones_en_lote() abiertos: mientras haya alguno, los
+        # cambios de los setters se escriben en el almacén al cerrarlo
+        self._lotes_modificacion = 0
+        self._indice_tipos = IndiceAgrupado()
+        # Nombre exacto -> SKUs, para vender por nombre sin recorrer el inventario
+        self._indice_nombres = IndiceAgrupado()
+        self._grupos_tipo: Dict[type, Tuple[type, ...]] = {}
+        self._conteo_tipos: Dict[str, int] = {}
+        self._valor_inventario = SumaExacta()
+        self._verificar_agregados = verificar_agregados
+        # Instantánea columnar: se construye en el primer uso y luego es incremental
+        self._columnar: Optional[InstantaneaColumnar] = None
+        self._motor_descuentos = MotorDescuentos()
+        self._diario = diario
+        # Versión del inventario: aumenta con cada modificación; el caché
+        # descarta los resultados de versiones anteriores al verla cambiar
+        self._version = 0
+        self._cache_consultas = CacheConsultas(cache_consultas)
+        self._restaurar_almacen()
+        if diario is not None:
+            self._reproducir_diario()
         pass
 
     @property
@@ -200,11 +357,358 @@ class TiendaMuebles:
         """Getter para el nombre de la tienda."""
         return self._nombre
 
+    @property
+    def concurrente(self) -> bool:
+        """Indica si la tienda puede usarse desde varios hilos."""
+        return self._concurrente
+
+    @property
+    def version(self) -> int:
+        """Getter para la versión del inventario, que aumenta con cada modificación."""
+        return self._version
+
+    def estadisticas_cache_consultas(self) -> dict:
+        """
+        Retorna los contadores y el uso de memoria del caché de consultas.
+
+        Returns:
+            dict: Aciertos, fallos, tasa de aciertos (0-1), entradas,
+                capacidad y memoria_bytes
+        """
+        return self._cache_consultas.estadisticas()
+
+    def obtener_sku(self, mueble: "Mueble") -> Optional[int]:
+        """
+        Obtiene el SKU asignado a un mueble del inventario.
+
+        Args:
+            mueble: Mueble a consultar
+
+        Returns:
+            Optional[int]: SKU del mueble o None si no está en inventario
+        """
+        return self._skus.get(id(mueble))
+
+    def obtener_por_sku(self, sku: int) -> Optional["Mueble"]:
+        """
+        Obtiene un mueble del inventario a partir de su SKU.
+
+        Args:
+            sku: SKU del mueble
+
+        Returns:
+            Optional[Mueble]: El mueble o None si el SKU no está en inventario
+        """
+        return self._inventario.get(sku)
+
+    def _registrar(self, mueble: "Mueble") -> None:
+        """
+        Asigna un SKU al mueble, lo agrega al inventario y a los índices.
+        Método privado auxiliar.
+
+        Args:
+            mueble: Mueble que acaba de entrar al inventario
+        """
+        sku = self._asignar_sku(mueble)
+        precio = self._precio_indexable(mueble)
+        self._almacen.agregar(sku, mueble, self._material_normalizado(mueble), precio)
+        if precio is not None:
+            self._valor_inventario.agregar(precio)
+        self._completar_registro(sku, mueble)
+
+    def _registrar_lote(
+        self,
+        muebles: List["Mueble"],
+        precios: List[float],
+        skus: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Registra varios muebles ya validados actualizando cada índice una sola vez.
+        Método privado auxiliar.
+
+        Args:
+            muebles: Muebles que entran al inventario
+            precios: Precio ya calculado de cada mueble (None si no tiene precio
+                válido y debe quedar fuera del índice de precios)
+            skus: SKUs a conservar, en orden ascendente (None asigna SKUs nuevos)
+        """
+        if skus is None:
+            skus = [self._asignar_sku(mueble) for mueble in muebles]
+        else:
+            skus = [self._asignar_sku(mueble, sku) for mueble, sku in zip(muebles, skus)]
+        materiales = [self._material_normalizado(mueble) for mueble in muebles]
+        self._almacen.agregar_lote(zip(skus, muebles, materiales, precios))
+        self._valor_inventario.agregar_lote(p for p in precios if p is not None)
+        self._indice_tipos.agregar_lote(
+            (sku, self._grupos_de_tipo(mueble.__class__))
+            for sku, mueble in zip(skus, muebles)
+        )
+        self._indice_nombres.agregar_lote(
+            (sku, self._grupos_de_nombre(mueble)) for sku, mueble in zip(skus, muebles)
+        )
+        conteo_tipos = self._conteo_tipos
+        for mueble in muebles:
+            tipo = type(mueble).__name__
+            conteo_tipos[tipo] = conteo_tipos.get(tipo, 0) + 1
+        if self._columnar is not None:
+            for sku, mueble in zip(skus, muebles):
+                self._columnar.agregar(sku, *self._fila_columnar(sku, mueble))
+        for mueble in muebles:
+            suscribir = getattr(mueble, "suscribir", None)
+            if callable(suscribir):
+                suscribir(self._al_cambiar_mueble)
+
+    def _asignar_sku(self, mueble: "Mueble", sku: Optional[int] = None) -> int:
+        """
+        Asigna el siguiente SKU (o el indicado) al mueble y lo agrega al inventario.
+        Método privado auxiliar.
+        """
+        self._version += 1
+        if sku is None:
+            sku = self._ultimo_sku + 1
+        self._ultimo_sku = max(self._ultimo_sku, sku)
+        self._skus[id(mueble)] = sku
+        self._inventario[sku] = mueble
+        self._orden_skus.append(sku)
+        return sku
+
+    def _restaurar_almacen(self) -> None:
+        """
+        Carga al inventario los muebles que el almacén ya tenía guardados,
+        conservando sus SKUs y sin volver a escribirlos en el almacén.
+        Método privado auxiliar.
+        """
+        for sku, mueble, precio in self._almacen.muebles():
+            self._skus[id(mueble)] = sku
+            self._inventario[sku] = mueble
+            self._orden_skus.append(sku)
+            self._ultimo_sku = max(self._ultimo_sku, sku)
+            if precio is not None:
+                self._valor_inventario.agregar(precio)
+            self._completar_registro(sku, mueble)
+            if isinstance(mueble, Comedor):
+                self._comedores.append(mueble)
+
+    def _completar_registro(self, sku: int, mueble: "Mueble") -> None:
+        """
+        Indexa los tipos del mueble y se suscribe a sus cambios.
+        Método privado auxiliar.
+        """
+        # Se indexa bajo cada clase del MRO para consultas por categoría abstracta
+        self._indice_tipos.agregar(sku, self._grupos_de_tipo(mueble.__class__))
+        self._indice_nombres.agregar(sku, self._grupos_de_nombre(mueble))
+        tipo = type(mueble).__name__
+        self._conteo_tipos[tipo] = self._conteo_tipos.get(tipo, 0) + 1
+        if self._columnar is not None:
+            self._columnar.agregar(sku, *self._fila_columnar(sku, mueble))
+        suscribir = getattr(mueble, "suscribir", None)
+        if callable(suscribir):
+            suscribir(self._al_cambiar_mueble)
+
+    def _grupos_de_tipo(self, clase: type) -> Tuple[type, ...]:
+        """
+        Retorna las clases del MRO bajo las que se indexa un tipo (sin object ni ABC).
+        Método privado auxiliar.
+        """
+        grupos = self._grupos_tipo.get(clase)
+        if grupos is None:
+            grupos = tuple(c for c in clase.__mro__ if c not in (object, ABC))
+            self._grupos_tipo[clase] = grupos
+        return grupos
+
+    @staticmethod
+    def _grupos_de_nombre(mueble: "Mueble") -> Tuple[str, ...]:
+        """
+        Retorna el nombre exacto bajo el que se indexa un mueble (ninguno si no tiene).
+        Método privado auxiliar.
+        """
+        nombre = getattr(mueble, "nombre", None)
+        return (nombre,) if isinstance(nombre, str) else ()
+
+    def _desregistrar(self, mueble: "Mueble") -> None:
+        """
+        Quita el mueble del inventario y de los índices en O(1) por índice hash.
+        Método privado auxiliar.
+
+        Args:
+            mueble: Mueble que acaba de salir del inventario
+        """
+        self._desregistrar_lote([mueble])
+
+    def _desregistrar_lote(self, muebles: List["Mueble"]) -> None:
+        """
+        Quita varios muebles del inventario y de los índices.
+        El almacén los borra primero y todos juntos: si falla, la tienda
+        queda sin cambios.
+        Método privado auxiliar.
+
+        Args:
+            muebles: Muebles que acaban de salir del inventario
+        """
+        skus = [self._skus.get(id(mueble)) for mueble in muebles]
+        precios = [None if sku is None else self._almacen.precio(sku) for sku in skus]
+        self._almacen.eliminar_lote(sku for sku in skus if sku is not None)
+        for mueble, sku, precio in zip(muebles, skus, precios):
+            if sku is None or self._skus.pop(id(mueble), None) is None:
+                continue
+            self._version += 1
+            del self._inventario[sku]
+            self._bajas_orden_skus += 1
+            if self._bajas_orden_skus > len(self._inventario):
+                # Los SKUs crecen siempre, así que el inventario ya está en orden de SKU
+                self._orden_skus = list(self._inventario)
+                self._bajas_orden_skus = 0
+            if precio is not None:
+                self._valor_inventario.quitar(precio)
+            self._indice_tipos.eliminar(sku)
+            self._indice_nombres.eliminar(sku)
+            if self._columnar is not None:
+                self._columnar.eliminar(sku)
+            tipo = type(mueble).__name__
+            self._conteo_tipos[tipo] -= 1
+            if not self._conteo_tipos[tipo]:
+                del self._conteo_tipos[tipo]
+            desuscribir = getattr(mueble, "desuscribir", None)
+            if callable(desuscribir):
+                desuscribir(self._al_cambiar_mueble)
+
+    def _precio_indexable(self, mueble: "Mueble") -> Optional[float]:
+        """
+        Calcula el precio del mueble para indexarlo.
+        Los muebles cuyo precio no se puede calcular quedan fuera del índice.
+        Método privado auxiliar.
+
+        Returns:
+            Optional[float]: Precio válido o None
+        """
+        try:
+            precio = mueble.calcular_precio()
+        except Exception:
+            return None
+        return precio if self._es_precio_valido(precio) else None
+
+    @staticmethod
+    def _es_precio_valido(precio) -> bool:
+        """
+        Indica si un precio calculado puede indexarse y sumarse al inventario.
+        Método privado auxiliar.
+        """
+        return (
+            isinstance(precio, (int, float))
+            and not isinstance(precio, bool)
+            and math.isfinite(precio)
+        )
+
+    @staticmethod
+    def _material_normalizado(mueble: "Mueble") -> Optional[str]:
+        """
+        Retorna el material en minúsculas y sin espacios, o None si no tiene.
+        Método privado auxiliar.
+        """
+        material = getattr(mueble, "material", None)
+        if isinstance(material, str) and material.strip():
+            return material.lower().strip()
+        return None
+
+    @con_escritura
+    def _al_cambiar_mueble(self, mueble: "Mueble", atributo: str) -> None:
+        """
+        Observador registrado en cada mueble del inventario.
+        Mantiene los índices al día cuando un setter modifica el mueble y
+        escribe el cambio en el almacén con el candado de escritura, salvo
+        dentro de modificaciones_en_lote().
+        Método privado auxiliar.
+
+        Args:
+            mueble: Mueble modificado
+            atributo: Nombre de la propiedad que cambió
+        """
+        sku = self._skus.get(id(mueble))
+        if sku is None:
+            return
+        self._version += 1
+        if atributo == "nombre":
+            self._indice_nombres.agregar(sku, self._grupos_de_nombre(mueble))
+        # Un cambio de material también puede cambiar el precio: se reindexan ambos
+        precio = self._precio_indexable(mueble)
+        anterior = self._almacen.precio(sku)
+        if anterior is not None:
+            self._valor_inventario.quitar(anterior)
+        if precio is not None:
+            self._valor_inventario.agregar(precio)
+        self._almacen.actualizar(sku, mueble, self._material_normalizado(mueble), precio)
+        if self._columnar is not None:
+            self._columnar.actualizar(sku, *self._fila_columnar(sku, mueble))
+        if not self._lotes_modificacion:
+            self._almacen.sincronizar()
+
+    @contextmanager
+    def modificaciones_en_lote(self) -> Iterator[None]:
+        """
+        Agrupa las modificaciones hechas con los setters de los muebles.
+
+        Durante el bloque el hilo tiene el candado de escritura y el almacén
+        escribe todos los cambios juntos al salir, en lugar de uno por
+        setter. Las consultas hechas dentro del bloque no ven en el almacén
+        los cambios aún no escritos.
+
+        Ejemplo:
+            with tienda.modificaciones_en_lote():
+                for mueble in muebles:
+                    mueble.precio_base *= 1.1
+        """
+        with self._candado.escritura():
+            self._lotes_modificacion += 1
+            try:
+                yield
+            finally:
+                self._lotes_modificacion -= 1
+                if not self._lotes_modificacion:
+                    self._almacen.sincronizar()
+
+    def _fila_columnar(self, sku: int, mueble: "Mueble") -> tuple:
+        """
+        Arma los valores de la fila columnar de un mueble ya indexado.
+        Método privado auxiliar.
+
+        Returns:
+            tuple: (tipo, material, color, precio_base, precio)
+        """
+        material = getattr(mueble, "material", None)
+        color = getattr(mueble, "color", None)
+        precio_base = getattr(mueble, "precio_base", None)
+        return (
+            type(mueble).__name__,
+            material.lower().strip() if isinstance(material, str) else "",
+            color if isinstance(color, str) else "",
+            precio_base if self._es_precio_valido(precio_base) else math.nan,
+            self._almacen.precio(sku),
+        )
+
+    @con_lectura
+    def instantanea_columnar(self) -> InstantaneaColumnar:
+        """
+        Retorna la instantánea columnar del inventario.
+
+        La primera llamada la construye a partir del inventario; desde entonces
+        la tienda la mantiene al día con cada alta, venta o cambio de atributos.
+
+        Returns:
+            InstantaneaColumnar: Columnas paralelas con los datos del inventario
+        """
+        if self._columnar is None:
+            columnar = InstantaneaColumnar()
+            for sku, mueble in self._inventario.items():
+                columnar.agregar(sku, *self._fila_columnar(sku, mueble))
+            self._columnar = columnar
+        return self._columnar
+
     # @property
     # def total_muebles(self) -> int:
     #     """Retorna el total de muebles en inventario."""
     #     return len(self._inventario)
 
+    @con_escritura
     def agregar_mueble(self, mueble: "Mueble") -> str:
         """
         Agrega un mueble al inventario de la tienda.
@@ -221,9 +725,52 @@ class TiendaMuebles:
                 return "Error: El mueble debe tener un precio válido mayor a 0"
         except Exception as e:
             return f"Error al calcular precio del mueble: {str(e)}"
-        self._inventario.append(mueble)
+        if id(mueble) in self._skus:
+            return "Error: El mueble ya está en el inventario"
+        self._registrar(mueble)
         return f"Mueble {getattr(mueble, 'nombre', str(mueble))} agregado exitosamente al inventario"
 
+    @con_escritura
+    def agregar_muebles_lote(self, muebles: List["Mueble"]) -> ResultadoCargaLote:
+        """
+        Agrega muchos muebles al inventario en una sola operación.
+
+        Aplica las mismas validaciones que agregar_mueble() pero sin construir
+        un mensaje por mueble: los rechazados se reportan con su posición y un
+        motivo ("nulo", "duplicado", "error_precio" o "precio_invalido").
+
+        Args:
+            muebles: Muebles a agregar
+
+        Returns:
+            ResultadoCargaLote: Cantidad agregada y lista de rechazados
+        """
+        validos = []
+        precios = []
+        rechazados = []
+        vistos = set()
+        for posicion, mueble in enumerate(muebles):
+            if mueble is None:
+                rechazados.append((posicion, mueble, "nulo"))
+                continue
+            if id(mueble) in self._skus or id(mueble) in vistos:
+                rechazados.append((posicion, mueble, "duplicado"))
+                continue
+            try:
+                precio = mueble.calcular_precio()
+            except Exception:
+                rechazados.append((posicion, mueble, "error_precio"))
+                continue
+            if not self._es_precio_valido(precio) or precio <= 0:
+                rechazados.append((posicion, mueble, "precio_invalido"))
+                continue
+            vistos.add(id(mueble))
+            validos.append(mueble)
+            precios.append(precio)
+        self._registrar_lote(validos, precios)
+        return ResultadoCargaLote(len(validos), rechazados)
+
+    @con_escritura
     def agregar_comedor(self, comedor: "Comedor") -> str:
         """
         Agrega un comedor completo a la tienda.
@@ -235,13 +782,167 @@ class TiendaMuebles:
         if comedor is None:
             return "Error: El comedor no puede ser None"
         self._comedores.append(comedor)
+        self._version += 1
         return (
             f"Comedor {getattr(comedor, 'nombre', str(comedor))} agregado exitosamente"
         )
 
+    @con_lectura
+    def guardar_instantanea(self, ruta: str) -> None:
+        """
+        Guarda inventario, comedores, descuentos y ventas en una instantánea binaria.
+
+        Args:
+            ruta: Ruta del archivo de la instantánea
+
+        Raises:
+            ValueError: Si algún mueble tiene atributos que no se pueden guardar
+        """
+        objetos = list(self._inventario.values())
+        posiciones = {id(mueble): i for i, mueble in enumerate(objetos)}
+
+        def posicion(mueble) -> int:
+            # Los muebles del comedor que no están en el inventario van al final
+            if id(mueble) not in posiciones:
+                posiciones[id(mueble)] = len(objetos)
+                objetos.append(mueble)
+            return posiciones[id(mueble)]
+
+        comedores = [
+            {
+                "nombre": comedor.nombre,
+                "mesa": None if comedor.mesa is None else posicion(comedor.mesa),
+                "sillas": [posicion(silla) for silla in comedor.sillas],
+            }
+            for comedor in self._comedores
+        ]
+        estado = {
+            "nombre": self._nombre,
+            "inventario": len(self._inventario),
+            "precios": [self._almacen.precio(sku) for sku in self._inventario],
+            # Los SKUs se conservan para que el diario pueda retirar lo vendido
+            "skus": list(self._inventario),
+            "ultimo_sku": self._ultimo_sku,
+            "comedores": comedores,
+            "descuentos": self._descuentos_activos,
+            "ventas": self._ventas_realizadas,
+            "total_muebles_vendidos": self._total_muebles_vendidos,
+            "valor_total_ventas": self._valor_total_ventas,
+        }
+        escribir_instantanea(ruta, objetos, estado)
+
+    @classmethod
+    def cargar_instantanea(
+        cls,
+        ruta: str,
+        verificar_agregados: bool = False,
+        diario: Optional[DiarioVentas] = None,
+    ) -> "TiendaMuebles":
+        """
+        Crea una tienda a partir de una instantánea guardada con guardar_instantanea().
+
+        Los muebles no se validan ni se recalculan sus precios: el índice de
+        precios se restaura con los valores guardados. Una instantánea creada
+        con otras reglas de precio debe regenerarse.
+
+        Args:
+            ruta: Ruta del archivo de la instantánea
+            verificar_agregados: Igual que en el constructor
+            diario: Diario de ventas; si se indica, las ventas se toman del
+                diario y se ignoran las guardadas en la instantánea, y los
+                muebles vendidos después de guardarla se retiran del inventario
+
+        Returns:
+            TiendaMuebles: Tienda con el estado restaurado
+
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida
+        """
+        objetos, estado = leer_instantanea(ruta)
+        tienda = cls(estado["nombre"], verificar_agregados)
+        # Los índices crean millones de contenedores sin ciclos: pausar el recolector
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            # Los precios indexados se restauran tal como se guardaron, sin recalcularlos
+            tienda._registrar_lote(
+                objetos[: estado["inventario"]], estado["precios"], estado.get("skus")
+            )
+            tienda._ultimo_sku = max(tienda._ultimo_sku, estado.get("ultimo_sku", 0))
+        finally:
+            if recolector_activo:
+                gc.enable()
+        for comedor in estado["comedores"]:
+            mesa = None if comedor["mesa"] is None else objetos[comedor["mesa"]]
+            sillas = [objetos[i] for i in comedor["sillas"]]
+            tienda._comedores.append(Comedor(comedor["nombre"], mesa, sillas))
+        for categoria_clase, tasa in estado["descuentos"].items():
+            tienda._motor_descuentos.registrar(categoria_clase, tasa)
+            tienda._descuentos_activos[categoria_clase] = tasa
+        if diario is None:
+            tienda._ventas_realizadas = estado["ventas"]
+            tienda._total_muebles_vendidos = estado["total_muebles_vendidos"]
+            tienda._valor_total_ventas = estado["valor_total_ventas"]
+            for venta in tienda._ventas_realizadas:
+                tienda._resumen_ventas.registrar(venta)
+        else:
+            tienda._diario = diario
+            tienda._reproducir_diario()
+        return tienda
+
+    @con_lectura
+    def pagina_inventario(
+        self, tamano: int = 50, cursor: Optional[str] = None
+    ) -> PaginaInventario:
+        """
+        Obtiene una página del inventario en orden de SKU.
+
+        El cursor guarda el último SKU entregado, así que las páginas siguen
+        siendo consistentes aunque haya ventas o altas entre una consulta y
+        otra: los muebles vendidos simplemente no aparecen, ninguno se repite
+        ni se salta, y los nuevos aparecen al final. Cada página cuesta
+        O(log n + tamano), sin copiar el inventario.
+
+        Args:
+            tamano: Muebles por página
+            cursor: Valor `siguiente` de la página anterior (None para la primera)
+
+        Returns:
+            PaginaInventario: Muebles, cursor de la página siguiente y total
+
+        Raises:
+            ValueError: Si tamano <= 0 o el cursor no es válido
+        """
+        if tamano <= 0:
+            raise ValueError("El tamaño de página debe ser mayor a 0")
+        posicion = 0
+        if cursor is not None:
+            try:
+                posicion = bisect_right(self._orden_skus, int(cursor))
+            except (TypeError, ValueError):
+                raise ValueError(f"Cursor de inventario inválido: {cursor!r}") from None
+        orden = self._orden_skus
+        inventario = self._inventario
+        muebles = []
+        ultimo = None
+        while posicion < len(orden) and len(muebles) < tamano:
+            sku = orden[posicion]
+            posicion += 1
+            mueble = inventario.get(sku)
+            if mueble is not None:
+                muebles.append(mueble)
+                ultimo = sku
+        # Sólo hay página siguiente si queda algún SKU vigente
+        while posicion < len(orden) and orden[posicion] not in inventario:
+            posicion += 1
+        siguiente = str(ultimo) if posicion < len(orden) else None
+        return PaginaInventario(muebles, siguiente, len(inventario))
+
+    @con_lectura
     def buscar_muebles_por_nombre(self, nombre: str) -> List["Mueble"]:
         """
         Busca muebles por nombre (búsqueda parcial, case-insensitive).
+        Usa el índice de nombres del almacén y retorna los muebles en orden de inventario.
         Args:
             nombre: Nombre o parte del nombre a buscar
         Returns:
@@ -250,17 +951,17 @@ class TiendaMuebles:
         if not nombre or not nombre.strip():
             return []
         nombre_lower = nombre.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if nombre_lower in mueble.nombre.lower():
-                resultados.append(mueble)
-        return resultados
+        return self._consulta_en_cache(
+            ("nombre", nombre_lower), lambda: self._almacen.buscar_por_nombre(nombre_lower)
+        )
 
+    @con_lectura
     def filtrar_por_precio(
         self, precio_min: float = 0, precio_max: float = float("inf")
     ) -> List["Mueble"]:
         """
-        Filtra muebles por rango de precios.
+        Filtra muebles por rango de precios usando el índice ordenado.
+        Los resultados se retornan ordenados de menor a mayor precio.
 
         Args:
             precio_min: Precio mínimo (inclusivo)
@@ -270,19 +971,15 @@ class TiendaMuebles:
         """
         if precio_min < 0:
             precio_min = 0
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                precio = mueble.calcular_precio()
-                if precio_min <= precio <= precio_max:
-                    resultados.append(mueble)
-            except Exception:
-                continue  # Saltar muebles con errores de precio
-        return resultados
+        return self._consulta_en_cache(
+            ("precio", precio_min, precio_max),
+            lambda: self._almacen.rango_precios(precio_min, precio_max),
+        )
 
+    @con_lectura
     def filtrar_por_material(self, material: str) -> List["Mueble"]:
         """
-        Filtra muebles por material.
+        Filtra muebles por material usando el índice de materiales.
 
         Args:
             material: Material a buscar
@@ -292,22 +989,32 @@ class TiendaMuebles:
         if not material or not material.strip():
             return []
         material_lower = material.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                if (
-                    hasattr(mueble, "material")
-                    and mueble.material
-                    and mueble.material.lower().strip() == material_lower
-                ):
-                    resultados.append(mueble)
-            except Exception:
-                continue
-        return resultados
+        return self._consulta_en_cache(
+            ("material", material_lower), lambda: self._almacen.por_material(material_lower)
+        )
+
+    def _consulta_en_cache(
+        self, argumentos: tuple, calcular_skus: Callable[[], List[int]]
+    ) -> List["Mueble"]:
+        """
+        Resuelve una consulta desde el caché o, si no está, desde los índices.
+        Método privado auxiliar.
+
+        Args:
+            argumentos: Nombre de la consulta y sus argumentos normalizados
+            calcular_skus: Obtiene los SKUs del resultado desde los índices
+        """
+        resultado = self._cache_consultas.obtener(argumentos, self._version)
+        if resultado is None:
+            resultado = tuple(self._inventario[sku] for sku in calcular_skus())
+            self._cache_consultas.guardar(argumentos, self._version, resultado)
+        return list(resultado)
 
+    @con_lectura
     def obtener_muebles_por_tipo(self, tipo_clase: type) -> List["Mueble"]:
         """
         Obtiene todos los muebles de un tipo específico.
+        Incluye subclases: pedir Asiento retorna sillas, sillones, sofás, etc.
 
         Args:
             tipo_clase: Clase del tipo de mueble (ej: Silla, Mesa, etc.)
@@ -315,14 +1022,266 @@ class TiendaMuebles:
         Returns:
             List[Mueble]: Lista de muebles del tipo especificado
         """
-        # TODO: Implementar filtro por tipo
-        # resultados = []
-        # for mueble in self._inventario:
-        #     if isinstance(mueble, tipo_clase):
-        #         resultados.append(mueble)
-        # return resultados
-        pass
+        skus = self._indice_tipos.claves(tipo_clase)
+        return [self._inventario[sku] for sku in skus]
+
+    @con_lectura
+    def contar_muebles_por_tipo(self, tipo_clase: type) -> int:
+        """
+        Cuenta los muebles de un tipo específico, incluyendo subclases.
+
+        Args:
+            tipo_clase: Clase del tipo de mueble (ej: Asiento, Sofa, etc.)
+
+        Returns:
+            int: Número de muebles del tipo especificado
+        """
+        return self._indice_tipos.conteo(tipo_clase)
+
+    @con_lectura
+    def mas_baratos(
+        self,
+        k: int,
+        tipo_clase: Optional[type] = None,
+        material: Optional[str] = None,
+    ) -> List["Mueble"]:
+        """
+        Obtiene los k muebles más baratos, opcionalmente de un tipo o material.
+
+        Args:
+            k: Número máximo de muebles
+            tipo_clase: Clase a la que limitar la consulta (incluye subclases)
+            material: Material a buscar
+
+        Returns:
+            List[Mueble]: Muebles de menor a mayor precio
+        """
+        return self._extremos_precio(k, False, tipo_clase, material)
+
+    @con_lectura
+    def mas_caros(
+        self,
+        k: int,
+        tipo_clase: Optional[type] = None,
+        material: Optional[str] = None,
+    ) -> List["Mueble"]:
+        """
+        Obtiene los k muebles más caros, opcionalmente de un tipo o material.
+
+        Args:
+            k: Número máximo de muebles
+            tipo_clase: Clase a la que limitar la consulta (incluye subclases)
+            material: Material a buscar
+
+        Returns:
+            List[Mueble]: Muebles de mayor a menor precio
+        """
+        return self._extremos_precio(k, True, tipo_clase, material)
+
+    def _extremos_precio(
+        self,
+        k: int,
+        descendente: bool,
+        tipo_clase: Optional[type],
+        material: Optional[str],
+    ) -> List["Mueble"]:
+        """
+        Resuelve mas_baratos() y mas_caros().
+        Método privado auxiliar.
+
+        Sin filtro de tipo se recorre el índice de precios del almacén y se
+        corta a los k resultados. Con filtro de tipo se elige lo más barato:
+        recorrer el índice de precios cuesta del orden de k·n/m pasos (m
+        muebles del tipo entre n), seleccionar con un montículo entre los m
+        del tipo cuesta m·log k.
+        """
+        if k <= 0:
+            return []
+        if material is not None:
+            if not material.strip():
+                return []
+            material = material.lower().strip()
+        if tipo_clase is None:
+            skus = self._almacen.extremos_precio(k, descendente, material)
+            return [self._inventario[sku] for sku in skus]
+
+        del_tipo = self._indice_tipos.conteo(tipo_clase)
+        if not del_tipo:
+            return []
+        if del_tipo * del_tipo >= k * len(self._inventario):
+            tipos = self._indice_tipos
+            skus = self._almacen.extremos_precio(
+                k, descendente, material, lambda sku: tipos.contiene(tipo_clase, sku)
+            )
+            return [self._inventario[sku] for sku in skus]
+
+        precio = self._almacen.precio
+        pares = []
+        for sku in self._indice_tipos.claves(tipo_clase):
+            mueble = self._inventario[sku]
+            if material is not None and self._material_normalizado(mueble) != material:
+                continue
+            valor = precio(sku)
+            if valor is not None:
+                pares.append((valor, sku))
+        seleccion = heapq.nlargest(k, pares) if descendente else heapq.nsmallest(k, pares)
+        return [self._inventario[sku] for _, sku in seleccion]
+
+    def consultar(
+        self,
+        nombre: Optional[str] = None,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+        tipo_clase: Optional[type] = None,
+    ) -> Iterator["Mueble"]:
+        """
+        Busca muebles que cumplan todos los criterios indicados.
+
+        Se estima cuántos muebles cumple cada criterio y se parte del índice
+        del más selectivo; los demás se comprueban sobre esos candidatos a
+        medida que se recorren, así que cortar la iteración no evalúa el resto.
+        El plan elegido se puede ver con explicar_consulta().
+
+        Args:
+            nombre: Nombre o parte del nombre (case-insensitive)
+            material: Material a buscar
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            tipo_clase: Clase del tipo de mueble (incluye subclases)
+
+        Yields:
+            Mueble: Muebles que cumplen los criterios, en orden de SKU
+        """
+        with self._candado.lectura():
+            plan = self._planificar_consulta(nombre, material, precio_min, precio_max, tipo_clase)
+            if plan is None:
+                return
+            candidatos = plan.candidatos()
+        # Los candidatos se comprueban por bloques para no retener el candado
+        # mientras el consumidor procesa cada mueble
+        for inicio in range(0, len(candidatos), self._BLOQUE_CONSULTA):
+            with self._candado.lectura():
+                bloque = [
+                    self._inventario[sku]
+                    for sku in candidatos[inicio : inicio + self._BLOQUE_CONSULTA]
+                    if sku in self._inventario and plan.cumple(sku)
+                ]
+            yield from bloque
+
+    @con_lectura
+    def explicar_consulta(
+        self,
+        nombre: Optional[str] = None,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+        tipo_clase: Optional[type] = None,
+    ) -> str:
+        """
+        Describe el plan que usaría consultar() con los mismos criterios.
+
+        Args:
+            nombre: Nombre o parte del nombre (case-insensitive)
+            material: Material a buscar
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            tipo_clase: Clase del tipo de mueble (incluye subclases)
+
+        Returns:
+            str: Índice de partida y filtros en orden, con sus estimados
+        """
+        plan = self._planificar_consulta(nombre, material, precio_min, precio_max, tipo_clase)
+        if plan is None:
+            return "Consulta vacía: nombre o material en blanco"
+        return plan.explicar()
+
+    def _planificar_consulta(
+        self,
+        nombre: Optional[str],
+        material: Optional[str],
+        precio_min: Optional[float],
+        precio_max: Optional[float],
+        tipo_clase: Optional[type],
+    ) -> Optional[PlanConsulta]:
+        """
+        Arma el plan de consultar(), o None si ningún mueble puede cumplirlo.
+        Método privado auxiliar.
+        """
+        inventario = self._inventario
+        total = len(inventario)
+        predicados = []
+
+        if tipo_clase is not None:
+            tipos = self._indice_tipos
+            predicados.append(
+                Predicado(
+                    f"índice de tipos (tipo = {tipo_clase.__name__})",
+                    tipos.conteo(tipo_clase),
+                    True,
+                    lambda: tipos.claves(tipo_clase),
+                    lambda sku: tipos.contiene(tipo_clase, sku),
+                )
+            )
+
+        if material is not None:
+            if not material.strip():
+                return None
+            material = material.lower().strip()
+            predicados.append(
+                Predicado(
+                    f"índice de materiales (material = {material})",
+                    self._almacen.conteo_materiales().get(material, 0),
+                    True,
+                    lambda: self._almacen.por_material(material),
+                    lambda sku: self._material_normalizado(inventario[sku]) == material,
+                )
+            )
+
+        if precio_min is not None or precio_max is not None:
+            minimo = max(precio_min or 0, 0)
+            maximo = float("inf") if precio_max is None else precio_max
+            precio = self._almacen.precio
+
+            def en_rango(sku: int) -> bool:
+                valor = precio(sku)
+                return valor is not None and minimo <= valor <= maximo
+
+            predicados.append(
+                Predicado(
+                    f"índice de precios ({rango_texto(precio_min, precio_max)})",
+                    self._almacen.contar_rango_precios(minimo, maximo),
+                    True,
+                    lambda: self._almacen.rango_precios(minimo, maximo),
+                    en_rango,
+                )
+            )
+
+        if nombre is not None:
+            if not nombre.strip():
+                return None
+            texto = nombre.lower().strip()
+            estimado = self._almacen.estimar_nombre(texto)
+            predicados.append(
+                Predicado(
+                    f"índice de nombres (nombre contiene '{texto}')",
+                    total if estimado is None else estimado,
+                    False,
+                    lambda: self._almacen.buscar_por_nombre(texto),
+                    lambda sku: texto in inventario[sku].nombre.lower(),
+                )
+            )
+
+        recorrido = Predicado(
+            "recorrido completo del inventario",
+            total,
+            True,
+            lambda: list(inventario),
+            lambda sku: True,
+        )
+        return PlanConsulta(predicados, recorrido)
 
+    @con_lectura
     def calcular_valor_inventario(self) -> float:
         """
         Calcula el valor total del inventario.
@@ -330,27 +1289,24 @@ class TiendaMuebles:
         Returns:
             float: Valor total de todos los muebles en inventario
         """
-        # TODO: Implementar cálculo de valor total
-        # valor_total = 0
-        # for mueble in self._inventario:
-        #     try:
-        #         valor_total += mueble.calcular_precio()
-        #     except Exception:
-        #         continue  # Saltar muebles con errores
-
-        # for comedor in self._comedores:
-        #     try:
-        #         valor_total += comedor.calcular_precio_total()
-        #     except Exception:
-        #         continue
-
-        # return round(valor_total, 2)
-        pass
+        valor_total = self._valor_inventario.valor()
+        for comedor in self._comedores:
+            if id(comedor) in self._skus:
+                continue  # Ya sumado como parte del inventario
+            try:
+                valor_total += comedor.calcular_precio_total()
+            except Exception:
+                continue
+        return round(valor_total, 2)
 
+    @con_escritura
     def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
         """
         Aplica un descuento a una categoría de muebles.
 
+        La categoría se resuelve a una clase de la jerarquía (ej: "sillones" ->
+        Sillon, "asientos" -> Asiento) y el descuento aplica a sus subclases.
+
         Args:
             categoria: Nombre de la categoría (ej: "sillas", "mesas")
             porcentaje: Porcentaje de descuento (0-100)
@@ -359,19 +1315,185 @@ class TiendaMuebles:
         """
         if not 0 < porcentaje <= 100:
             return "Error: El porcentaje debe estar entre 1 y 100"
-        categoria_lower = categoria.lower().strip()
-        # Normalizar nombres de clase (Silla, Mesa, etc.)
-        # El sistema usa el nombre de la clase, por ejemplo 'Silla', 'Mesa', etc.
-        # Si el usuario ingresa 'sillas', 'mesas', etc., quitamos la 's' final si existe
-        if categoria_lower.endswith("s"):
-            categoria_lower = categoria_lower[:-1]
-        # Capitalizar para coincidir con el nombre de clase
-        categoria_clase = categoria_lower.capitalize()
+        clases = clases_de(Mueble)
+        clase = MotorDescuentos.resolver_categoria(categoria, clases)
+        if clase is not None:
+            categoria_clase = clase.__name__
+        else:
+            # Categoría sin clase conocida: se conserva el nombre en singular
+            categoria_lower = categoria.lower().strip()
+            if categoria_lower.endswith("s"):
+                categoria_lower = categoria_lower[:-1]
+            categoria_clase = categoria_lower.capitalize()
+        self._motor_descuentos.registrar(categoria_clase, porcentaje / 100)
+        self._motor_descuentos.compilar(clases)
         self._descuentos_activos[categoria_clase] = porcentaje / 100
+        self._version += 1
         return (
             f"Descuento del {porcentaje}% aplicado a la categoría '{categoria_clase}'"
         )
 
+    @con_lectura
+    def cotizar_catalogo(self) -> Dict[int, float]:
+        """
+        Calcula el precio final con descuento de todo el inventario.
+
+        Returns:
+            Dict[int, float]: Precio final por SKU, en orden de inventario
+        """
+        cotizacion = {}
+        tasa = self._motor_descuentos.tasa
+        precio_indexado = self._almacen.precio
+        for sku, mueble in self._inventario.items():
+            precio = precio_indexado(sku)
+            if precio is not None:
+                cotizacion[sku] = round(precio * (1 - tasa(type(mueble))), 2)
+        return cotizacion
+
+    def _crear_venta(self, mueble: "Mueble", cliente: str, fecha: str) -> Dict:
+        """
+        Calcula precio y descuento de un mueble y arma el registro de venta.
+        No modifica el estado de la tienda.
+        Método privado auxiliar.
+
+        Args:
+            mueble: Mueble a vender
+            cliente: Nombre del cliente
+            fecha: Fecha de la venta ya formateada
+
+        Returns:
+            Dict: Registro de la venta
+        """
+        precio_original = mueble.calcular_precio()
+        tipo_mueble = type(mueble).__name__
+        descuento_aplicado = self._motor_descuentos.tasa(type(mueble))
+        precio_final = precio_original * (1 - descuento_aplicado)
+        # Ensure mueble.nombre is always a string
+        nombre_mueble = getattr(mueble, "nombre", None)
+        if not nombre_mueble:
+            nombre_mueble = tipo_mueble
+        return {
+            "mueble": nombre_mueble,
+            "sku": self._skus.get(id(mueble)),
+            "tipo": tipo_mueble,
+            "cliente": cliente,
+            "precio_original": precio_original,
+            "descuento": descuento_aplicado * 100,
+            "precio_final": round(precio_final, 2),
+            "fecha": fecha,
+        }
+
+    def _anotar_venta(self, venta: Dict, mueble: "Mueble") -> None:
+        """
+        Escribe la venta en el diario (si hay uno), retira el mueble vendido
+        y aplica la venta. Si no se puede retirar el mueble, el registro se
+        descarta del diario y la tienda queda sin cambios.
+        Método privado auxiliar.
+        """
+        self._anotar_ventas_lote([venta], [mueble])
+
+    def _anotar_ventas_lote(self, ventas: List[Dict], muebles: List["Mueble"]) -> None:
+        """
+        Escribe las ventas en el diario como un solo registro (sincronizado
+        si es un lote) y, sólo si la escritura tuvo éxito, retira los muebles y aplica las
+        ventas. Si no se pueden retirar los muebles, el registro se descarta
+        del diario y la tienda queda sin cambios.
+        Método privado auxiliar.
+        """
+        if self._diario is not None:
+            if len(ventas) == 1:
+                # Una venta sola sigue el commit en grupo del diario (lote_fsync)
+                self._diario.registrar(ventas[0])
+            else:
+                self._diario.registrar_lote(ventas)
+                self._diario.sincronizar()
+        try:
+            self._desregistrar_lote(muebles)
+        except BaseException:
+            if self._diario is not None:
+                self._diario.descartar_ultimo()
+            raise
+        for venta in ventas:
+            self._aplicar_venta(venta)
+
+    def _reproducir_diario(self) -> None:
+        """
+        Aplica las ventas del diario y retira del inventario los muebles
+        vendidos que todavía estén en él (por ejemplo, los de una instantánea
+        guardada antes de esas ventas).
+        Método privado auxiliar.
+        """
+        for venta in self._diario.reproducir():
+            self._aplicar_venta(venta)
+            mueble = self._inventario.get(venta.get("sku"))
+            if mueble is not None:
+                self._desregistrar(mueble)
+                if mueble in self._comedores:
+                    self._comedores.remove(mueble)
+
+    def _aplicar_venta(self, venta: Dict) -> None:
+        """
+        Agrega la venta al historial y actualiza los acumulativos.
+        Se usa tanto al vender como al reproducir el diario.
+        Método privado auxiliar.
+        """
+        self._ventas_realizadas.append(venta)
+        self._total_muebles_vendidos += 1
+        self._valor_total_ventas += venta["precio_final"]
+        self._resumen_ventas.registrar(venta)
+
+    @con_lectura
+    def resumen_ventas(
+        self,
+        granularidad: str = "hora",
+        cubetas: int = 24,
+        hasta: Optional[datetime] = None,
+    ) -> Dict:
+        """
+        Totales de ventas de una ventana reciente, sin recorrer el historial.
+
+        Args:
+            granularidad: "minuto", "hora" o "dia"
+            cubetas: Número de intervalos de la ventana (ej: 24 horas)
+            hasta: Fin de la ventana (por defecto, ahora)
+
+        Returns:
+            Dict: ventas, bruto, descuento y tipos (cantidad vendida por tipo)
+
+        Raises:
+            ValueError: Si la granularidad no existe o cubetas <= 0
+        """
+        instante = ResumenVentas.instante(hasta or datetime.now())
+        return self._resumen_ventas.serie(granularidad).ventana(cubetas, instante)
+
+    @con_lectura
+    def serie_ventas(
+        self,
+        granularidad: str = "hora",
+        cubetas: int = 24,
+        hasta: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """
+        Ventas de cada intervalo de una ventana reciente, para graficar.
+
+        Args:
+            granularidad: "minuto", "hora" o "dia"
+            cubetas: Número de intervalos de la serie
+            hasta: Fin de la serie (por defecto, ahora)
+
+        Returns:
+            List[Dict]: Un elemento por intervalo, del más antiguo al más
+                reciente, con inicio (datetime), ventas, bruto y descuento
+
+        Raises:
+            ValueError: Si la granularidad no existe o cubetas <= 0
+        """
+        instante = ResumenVentas.instante(hasta or datetime.now())
+        serie = self._resumen_ventas.serie(granularidad).serie(cubetas, instante)
+        for intervalo in serie:
+            intervalo["inicio"] = ResumenVentas.desde_instante(intervalo["inicio"])
+        return serie
+
     def realizar_venta(
         self, mueble: "Mueble", cliente: str = "Cliente Anónimo"
     ) -> Dict:
@@ -383,38 +1505,90 @@ class TiendaMuebles:
         Returns:
             Dict: Información de la venta realizada o error
         """
-        if mueble not in self._inventario:
-            return {"error": "El mueble no está disponible en inventario"}
-        try:
-            precio_original = mueble.calcular_precio()
-            descuento_aplicado = 0
-            # Use the class name as key, matching how discounts are registered
-            tipo_mueble = type(mueble).__name__
-            if self._descuentos_activos and tipo_mueble in self._descuentos_activos:
-                descuento_aplicado = self._descuentos_activos[tipo_mueble]
-            precio_final = precio_original * (1 - descuento_aplicado)
-            from datetime import datetime
-
-            # Ensure mueble.nombre is always a string
-            nombre_mueble = getattr(mueble, "nombre", None)
-            if not nombre_mueble:
-                nombre_mueble = tipo_mueble
-            venta = {
-                "mueble": nombre_mueble,
-                "cliente": cliente,
-                "precio_original": precio_original,
-                "descuento": descuento_aplicado * 100,
-                "precio_final": round(precio_final, 2),
-                "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-            self._ventas_realizadas.append(venta)
-            self._inventario.remove(mueble)
-            # Acumulativos
-            self._total_muebles_vendidos += 1
-            self._valor_total_ventas += venta["precio_final"]
-            return venta
-        except Exception as e:
-            return {"error": f"Error al procesar la venta: {str(e)}"}
+        while True:
+            sku = self._skus.get(id(mueble))
+            if sku is None:
+                return {"error": "El mueble no está disponible en inventario"}
+            with self._candados_sku.clave(sku):
+                # Otro hilo pudo venderlo, o venderlo y volver a agregarlo con
+                # otro SKU (de otra franja), mientras se esperaba el candado
+                if self._skus.get(id(mueble)) != sku:
+                    continue
+                try:
+                    fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    with self._candado.lectura():
+                        venta = self._crear_venta(mueble, cliente, fecha)
+                    with self._candado.escritura():
+                        self._anotar_venta(venta, mueble)
+                    return venta
+                except Exception as e:
+                    return {"error": f"Error al procesar la venta: {str(e)}"}
+
+    def realizar_ventas_lote(
+        self, muebles: List["Mueble"], cliente: str = "Cliente Anónimo"
+    ) -> Dict:
+        """
+        Procesa la venta de varios muebles como una sola operación.
+
+        Todos los muebles se validan y se cotizan antes de modificar la tienda:
+        si alguno no está disponible o falla su precio, no se vende ninguno.
+        Todas las ventas comparten la misma fecha.
+
+        Args:
+            muebles: Muebles a vender
+            cliente: Nombre del cliente
+
+        Returns:
+            Dict: Comprobante combinado con las ventas y los totales, o error
+        """
+        if not muebles:
+            return {"error": "La venta debe incluir al menos un mueble"}
+        while True:
+            skus = [self._skus.get(id(mueble)) for mueble in muebles]
+            with self._candados_sku.claves(sku for sku in skus if sku is not None):
+                if any(
+                    self._skus.get(id(mueble)) not in (sku, None)
+                    for mueble, sku in zip(muebles, skus)
+                ):
+                    # Algún mueble se vendió y volvió con otro SKU: se toman
+                    # de nuevo los candados de los SKUs vigentes
+                    continue
+                vistos = set()
+                for mueble in muebles:
+                    if id(mueble) not in self._skus:
+                        return {
+                            "error": f"El mueble {getattr(mueble, 'nombre', mueble)} no está disponible en inventario"
+                        }
+                    if id(mueble) in vistos:
+                        return {
+                            "error": f"El mueble {getattr(mueble, 'nombre', mueble)} está repetido en la venta"
+                        }
+                    vistos.add(id(mueble))
+
+                fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                try:
+                    with self._candado.lectura():
+                        ventas = [self._crear_venta(mueble, cliente, fecha) for mueble in muebles]
+                except Exception as e:
+                    return {"error": f"Error al procesar la venta: {str(e)}"}
+
+                with self._candado.escritura():
+                    try:
+                        self._anotar_ventas_lote(ventas, muebles)
+                    except Exception as e:
+                        return {"error": f"Error al registrar la venta: {str(e)}"}
+            break
+        total_original = math.fsum(venta["precio_original"] for venta in ventas)
+        total_final = round(math.fsum(venta["precio_final"] for venta in ventas), 2)
+        return {
+            "cliente": cliente,
+            "fecha": fecha,
+            "ventas": ventas,
+            "cantidad": len(ventas),
+            "precio_original": total_original,
+            "descuento_total": round(total_original - total_final, 2),
+            "precio_final": total_final,
+        }
 
     def _contar_tipos_muebles(self) -> Dict[str, int]:
         """
@@ -424,35 +1598,136 @@ class TiendaMuebles:
         Returns:
             Dict[str, int]: Diccionario con el conteo por tipo
         """
-        # TODO: Implementar conteo por tipos
-        # conteo = {}
-        # for mueble in self._inventario:
-        #     tipo = type(mueble).__name__
-        #     conteo[tipo] = conteo.get(tipo, 0) + 1
-        # return conteo
-        pass
+        return self._conteo_tipos.copy()
 
-    def generar_reporte_inventario(self) -> str:
+    def generar_reporte_inventario(self, procesos: int = 1) -> str:
         """
         Genera un reporte completo del inventario.
+
+        Args:
+            procesos: Con más de 1, los agregados por tipo, material y precio
+                se calculan repartiendo el inventario entre ese número de
+                procesos (conviene en inventarios grandes)
         Returns:
             str: Reporte detallado del inventario
         """
-        estadisticas = self.obtener_estadisticas() or {}
+        return "".join(self.iterar_reporte_inventario(procesos))
+
+    def iterar_reporte_inventario(
+        self, procesos: int = 1, detalle: bool = False
+    ) -> Iterator[str]:
+        """
+        Genera el reporte del inventario línea por línea.
+
+        El resumen se calcula de una vez con el candado de lectura; el detalle
+        recorre una copia de la lista de muebles y describe cada uno a medida
+        que se consume, por lo que el reporte completo nunca está en memoria.
+
+        Args:
+            procesos: Procesos para los agregados (ver generar_reporte_inventario)
+            detalle: Si True, agrega la descripción de cada mueble y comedor
+
+        Yields:
+            str: Líneas del reporte, cada una terminada en salto de línea
+        """
+        with self._candado.lectura():
+            estadisticas = self.obtener_estadisticas() or {}
+            # Copiar las columnas es barato; agregarlas (y crear procesos) se
+            # hace sin retener el candado para no bloquear a los escritores
+            columnar = self.instantanea_columnar().copia()
+            if detalle:
+                muebles = list(self._inventario.items())
+                comedores = list(self._comedores)
+        yield from self._lineas_resumen_reporte(estadisticas, columnar, procesos)
+        if not detalle:
+            return
+        if muebles:
+            yield "\nDETALLE DE MUEBLES:\n"
+            for sku, mueble in muebles:
+                yield f"\n[SKU {sku}] {self._describir_mueble(mueble)}\n"
+        if comedores:
+            yield "\nDETALLE DE COMEDORES:\n"
+            for comedor in comedores:
+                yield f"\n{self._describir_mueble(comedor)}\n"
+
+    @staticmethod
+    def _describir_mueble(mueble) -> str:
+        """
+        Descripción de un elemento del inventario para el detalle del reporte.
+        Los comedores agregados con agregar_producto() no tienen
+        obtener_descripcion() y se describen completos.
+        Método privado auxiliar.
+        """
+        iterar = getattr(mueble, "iterar_descripcion_completa", None)
+        if callable(iterar):
+            return "".join(iterar())
+        return mueble.obtener_descripcion() or str(mueble)
+
+    def escribir_reporte_inventario(
+        self, destino, procesos: int = 1, detalle: bool = False
+    ) -> int:
+        """
+        Escribe el reporte del inventario en un archivo o socket a medida que
+        se genera.
+
+        Args:
+            destino: Ruta de archivo, archivo de texto o binario, o socket
+            procesos: Procesos para los agregados (ver generar_reporte_inventario)
+            detalle: Si True, incluye la descripción de cada mueble y comedor
+
+        Returns:
+            int: Caracteres escritos
+        """
+        return escribir_fragmentos(
+            self.iterar_reporte_inventario(procesos, detalle), destino
+        )
+
+    def _lineas_resumen_reporte(
+        self, estadisticas: dict, columnar: InstantaneaColumnar, procesos: int
+    ) -> List[str]:
+        """
+        Arma las líneas del resumen del reporte (totales y distribuciones)
+        a partir de estadísticas y columnas ya copiadas.
+        Método privado auxiliar.
+
+        Con un proceso se usan los agregados vectorizados de la instantánea y
+        con varios se reparten por bloques; ambos usan sumas exactas, así que
+        el reporte no depende de `procesos`.
+        """
+        lineas = []
         nombre_tienda = getattr(self, "_nombre", "Tienda")
         if not isinstance(estadisticas, dict):
             estadisticas = {}
-        reporte = f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n"
-        reporte += f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n"
-        reporte += f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n"
-        reporte += f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n"
-        reporte += "DISTRIBUCIÓN POR TIPOS:\n"
-        tipos = estadisticas.get("tipos_muebles", {}) or {}
+        limites = self.LIMITES_PRECIO_REPORTE
+        agregados = agregados_paralelos(columnar, limites, max(procesos, 1))
+        tipos = agregados.conteo_tipos
+        materiales = agregados.conteo_materiales
+        valor_tipos = agregados.valor_tipos
+        conteo = agregados.histograma
+        lineas.append(f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n")
+        lineas.append(f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n")
+        lineas.append(f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n")
+        lineas.append(f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n")
+        lineas.append("DISTRIBUCIÓN POR TIPOS:\n")
         for tipo, cantidad in tipos.items():
-            reporte += f"- {tipo}: {cantidad} unidades\n"
+            lineas.append(f"- {tipo}: {cantidad} unidades\n")
+        if materiales:
+            lineas.append("\nDISTRIBUCIÓN POR MATERIALES:\n")
+            for material, cantidad in sorted(materiales.items()):
+                lineas.append(f"- {material}: {cantidad} unidades\n")
+        if valor_tipos:
+            lineas.append("\nVALOR POR TIPOS:\n")
+            for tipo, valor in valor_tipos.items():
+                lineas.append(f"- {tipo}: ${valor:.2f}\n")
+            lineas.append("\nDISTRIBUCIÓN POR PRECIOS:\n")
+            etiquetas = [f"menos de ${limites[0]}"]
+            etiquetas += [f"${a} - ${b}" for a, b in zip(limites, limites[1:])]
+            etiquetas.append(f"${limites[-1]} o más")
+            for etiqueta, cantidad in zip(etiquetas, conteo):
+                lineas.append(f"- {etiqueta}: {cantidad} unidades\n")
         descuentos = estadisticas.get("descuentos_activos", {}) or {}
         if descuentos:
-            reporte += "\nDESCUENTOS ACTIVOS:\n"
+            lineas.append("\nDESCUENTOS ACTIVOS:\n")
             for categoria, descuento in descuentos.items():
-                reporte += f"- {categoria}: {descuento * 100:.1f}%\n"
-        return reporte
+                lineas.append(f"- {categoria}: {descuento * 100:.1f}%\n")
+        return lineas
@@ -36,6 +36,9 @@ class MenuTienda:
     - Composición: Usa una instancia de TiendaMuebles para las operaciones
     """
 
+    # Muebles por página en el catálogo y en la selección de ventas
+    TAMANO_PAGINA = 20
+
     def __init__(self, tienda: "TiendaMuebles"):
         """
         Constructor del menú.
@@ -49,34 +52,47 @@ class MenuTienda:
         self.running = True
 
     def mostrar_catalogo_completo(self):
-        """Muestra todos los muebles disponibles en una tabla."""
-
-        # Implementar visualización del catálogo
-        muebles = self.tienda._inventario  # Acceso directo para el ejemplo
-
-        if not muebles:
-            self.console.print("[yellow]No hay muebles en el inventario.[/yellow]")
-            return
+        """Muestra el catálogo en páginas, pidiendo sólo la página visible a la tienda."""
 
-        table = Table(title="📋 Catálogo de Muebles")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Color", style="blue")
-        table.add_column("Precio", style="red", justify="right")
+        cursor = None
+        numero_pagina = 1
+        while True:
+            pagina = self.tienda.pagina_inventario(self.TAMANO_PAGINA, cursor)
 
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-                table.add_row(
-                    str(i), mueble.nombre, tipo, mueble.material, mueble.color, precio
-                )
-            except Exception as e:
-                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error")
+            if not pagina.muebles:
+                if numero_pagina == 1:
+                    self.console.print("[yellow]No hay muebles en el inventario.[/yellow]")
+                return
 
-        self.console.print(table)
+            table = Table(
+                title=f"📋 Catálogo de Muebles (página {numero_pagina}, {pagina.total} en total)"
+            )
+            table.add_column("SKU", style="cyan", no_wrap=True)
+            table.add_column("Nombre", style="magenta")
+            table.add_column("Tipo", style="green")
+            table.add_column("Material", style="yellow")
+            table.add_column("Color", style="blue")
+            table.add_column("Precio", style="red", justify="right")
+
+            for mueble in pagina.muebles:
+                sku = str(self.tienda.obtener_sku(mueble))
+                try:
+                    precio = f"${mueble.calcular_precio():.2f}"
+                    tipo = type(mueble).__name__
+                    table.add_row(
+                        sku, mueble.nombre, tipo, mueble.material, mueble.color, precio
+                    )
+                except Exception as e:
+                    table.add_row(sku, mueble.nombre, "Error", "-", "-", "Error")
+
+            self.console.print(table)
+
+            if pagina.siguiente is None:
+                return
+            if not Confirm.ask("¿Ver la página siguiente?", default=True):
+                return
+            cursor = pagina.siguiente
+            numero_pagina += 1
 
     def buscar_muebles_interactivo(self):
         """Interfaz interactiva para buscar muebles."""
@@ -180,22 +196,34 @@ class MenuTienda:
     def realizar_venta_interactiva(self):
         """Interfaz interactiva para realizar ventas."""
 
-        muebles = self.tienda._inventario
+        pagina = self.tienda.pagina_inventario(self.TAMANO_PAGINA)
 
-        if not muebles:
+        if not pagina.muebles:
             self.console.print("[red]No hay muebles disponibles para venta.[/red]")
             return
 
-        self.console.print("[cyan]Selecciona un mueble para vender:[/cyan]")
-        self._mostrar_lista_muebles(muebles, numerada=True)
-
         try:
-            indice = IntPrompt.ask(
-                "Número del mueble",
-                choices=[str(i) for i in range(1, len(muebles) + 1)],
-            )
+            while True:
+                muebles = pagina.muebles
+                self.console.print("[cyan]Selecciona un mueble para vender:[/cyan]")
+                self._mostrar_lista_muebles(muebles, numerada=True)
+
+                opciones = [str(i) for i in range(1, len(muebles) + 1)]
+                mensaje = "Número del mueble"
+                if pagina.siguiente is not None:
+                    opciones.append("s")
+                    mensaje += " ('s' para la página siguiente)"
+                eleccion = Prompt.ask(mensaje, choices=opciones, show_choices=False)
+                if eleccion != "s":
+                    break
+                pagina = self.tienda.pagina_inventario(
+                    self.TAMANO_PAGINA, pagina.siguiente
+                )
+                if not pagina.muebles:
+                    self.console.print("[red]No quedan más muebles disponibles.[/red]")
+                    return
 
-            mueble_seleccionado = muebles[indice - 1]
+            mueble_seleccionado = muebles[int(eleccion) - 1]
 
             # Mostrar detalles del mueble
             self.console.print(f"\n[green]Mueble seleccionado:[/green]")
@@ -251,6 +279,11 @@ class MenuTienda:
             self.console.print("\n[cyan]Distribución por tipos:[/cyan]")
             for tipo, cantidad in tipos.items():
                 self.console.print(f"  • {tipo}: {cantidad} unidades")
+        materiales = stats.get("materiales", {})
+        if materiales:
+            self.console.print("\n[cyan]Distribución por materiales:[/cyan]")
+            for material, cantidad in materiales.items():
+                self.console.print(f"  • {material}: {cantidad} unidades")
 
     def generar_reporte_interactivo(self):
         """Genera y muestra el reporte de inventario."""
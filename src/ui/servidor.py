@@ -0,0 +1,366 @@
+"""
+Servicio HTTP/JSON sobre TiendaMuebles usando solo la biblioteca estándar.
+
+Rutas:
+    GET  /muebles           Catálogo paginado con por_pagina. Sin filtros se
+                            pagina con cursor (omitido o vacío para la primera
+                            página) y la respuesta trae el cursor "siguiente";
+                            con filtros (nombre, material, precio_min,
+                            precio_max) se pagina con pagina
+    GET  /muebles/<sku>     Un mueble del inventario
+    GET  /estadisticas      Estadísticas de la tienda
+    POST /ventas            {"sku": 1} o {"skus": [1, 2]}, con "cliente" opcional
+    POST /descuentos        {"categoria": "sillas", "porcentaje": 10}
+
+Las conexiones son persistentes (HTTP/1.1 con Content-Length en todas las
+respuestas) y las respuestas GET llevan un ETag: si el cliente envía el
+mismo valor en If-None-Match se responde 304 sin cuerpo. Los cuerpos POST
+deben declarar su Content-Length y no superar CUERPO_MAXIMO bytes.
+"""
+
+import hashlib
+import json
+import math
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from models.mueble import Mueble
+from services.tienda import TiendaMuebles
+
+POR_PAGINA_DEFECTO = 50
+POR_PAGINA_MAXIMO = 500
+CUERPO_MAXIMO = 1 << 20
+
+
+class ErrorPeticion(Exception):
+    """Error de una petición que se responde al cliente con un estado HTTP."""
+
+    def __init__(self, estado: HTTPStatus, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+class ServidorTienda(ThreadingHTTPServer):
+    """
+    Servidor HTTP multihilo que atiende las peticiones sobre una tienda.
+    Cada conexión se atiende en su propio hilo, por lo que la tienda debe
+    ser concurrente.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        direccion: Tuple[str, int],
+        tienda: TiendaMuebles,
+        registrar_peticiones: bool = False,
+    ):
+        """
+        Constructor del servidor.
+
+        Args:
+            direccion: (host, puerto) donde escuchar; puerto 0 elige uno libre
+            tienda: Tienda creada con concurrente=True
+            registrar_peticiones: Si True, escribe cada petición en stderr
+
+        Raises:
+            ValueError: Si la tienda no es concurrente
+        """
+        if not tienda.concurrente:
+            raise ValueError("La tienda debe crearse con concurrente=True")
+        self.tienda = tienda
+        self.registrar_peticiones = registrar_peticiones
+        super().__init__(direccion, ManejadorTienda)
+
+
+class ManejadorTienda(BaseHTTPRequestHandler):
+    """Traduce las peticiones HTTP a operaciones de la tienda."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "TiendaMuebles/1.0"
+    # Respuestas pequeñas: enviarlas sin esperar a juntar más datos
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Atiende las consultas."""
+        self._atender(self._consultar)
+
+    def do_POST(self) -> None:
+        """Atiende las operaciones que modifican la tienda."""
+        self._atender(self._modificar)
+
+    def log_message(self, formato: str, *args) -> None:
+        if self.server.registrar_peticiones:
+            super().log_message(formato, *args)
+
+    def _atender(self, operacion) -> None:
+        """
+        Ejecuta la operación y envía su resultado o el error como JSON.
+        Método privado auxiliar.
+        """
+        url = urlsplit(self.path)
+        try:
+            estado, datos = operacion(url.path.rstrip("/") or "/", parse_qs(url.query, keep_blank_values=True))
+        except ErrorPeticion as e:
+            estado, datos = e.estado, {"error": str(e)}
+        except Exception as e:
+            # Cualquier otro fallo se responde igual, sin dejar al cliente
+            # esperando; se registra siempre, aunque no se registren peticiones
+            BaseHTTPRequestHandler.log_message(
+                self, "Error al atender %s %s: %r", self.command, self.path, e
+            )
+            estado, datos = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Error interno del servidor"}
+        cuerpo = json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        etag = None
+        if self.command == "GET" and estado == HTTPStatus.OK:
+            etag = '"' + hashlib.blake2b(cuerpo, digest_size=12).hexdigest() + '"'
+            if self._coincide_etag(etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        self.send_response(estado)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _coincide_etag(self, etag: str) -> bool:
+        """Indica si el cliente ya tiene esta versión. Método privado auxiliar."""
+        cabecera = self.headers.get("If-None-Match")
+        if not cabecera:
+            return False
+        candidatos = {c.strip().removeprefix("W/") for c in cabecera.split(",")}
+        return etag in candidatos or "*" in candidatos
+
+    def _consultar(self, ruta: str, parametros: Dict) -> Tuple[HTTPStatus, object]:
+        """Resuelve las rutas GET. Método privado auxiliar."""
+        tienda = self.server.tienda
+        if ruta == "/muebles":
+            return HTTPStatus.OK, self._catalogo(parametros)
+        if ruta.startswith("/muebles/"):
+            mueble = tienda.obtener_por_sku(_entero(ruta[len("/muebles/") :], "sku"))
+            if mueble is None:
+                raise ErrorPeticion(HTTPStatus.NOT_FOUND, "Mueble no encontrado")
+            return HTTPStatus.OK, mueble_a_dict(mueble, tienda)
+        if ruta == "/estadisticas":
+            return HTTPStatus.OK, tienda.obtener_estadisticas()
+        raise ErrorPeticion(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {ruta}")
+
+    def _catalogo(self, parametros: Dict) -> Dict:
+        """
+        Página del catálogo con los filtros pedidos.
+        Método privado auxiliar.
+        """
+        tienda = self.server.tienda
+        pagina = _entero(_parametro(parametros, "pagina", "1"), "pagina")
+        por_pagina = _entero(
+            _parametro(parametros, "por_pagina", str(POR_PAGINA_DEFECTO)), "por_pagina"
+        )
+        if pagina < 1 or not 1 <= por_pagina <= POR_PAGINA_MAXIMO:
+            raise ErrorPeticion(
+                HTTPStatus.BAD_REQUEST,
+                f"pagina debe ser >= 1 y por_pagina estar entre 1 y {POR_PAGINA_MAXIMO}",
+            )
+
+        candidatos = []
+        nombre = _parametro(parametros, "nombre")
+        if nombre is not None:
+            candidatos.append(tienda.buscar_muebles_por_nombre(nombre))
+        material = _parametro(parametros, "material")
+        if material is not None:
+            candidatos.append(tienda.filtrar_por_material(material))
+        precio_min = _parametro(parametros, "precio_min")
+        precio_max = _parametro(parametros, "precio_max")
+        if precio_min is not None or precio_max is not None:
+            candidatos.append(
+                tienda.filtrar_por_precio(
+                    _real(precio_min or "0", "precio_min"),
+                    _real(precio_max or "inf", "precio_max"),
+                )
+            )
+        cursor = _parametro(parametros, "cursor")
+        if not candidatos:
+            # Sin filtros se pagina con cursor para no copiar todo el inventario
+            if pagina != 1:
+                raise ErrorPeticion(
+                    HTTPStatus.BAD_REQUEST, "Sin filtros se pagina con cursor, no con pagina"
+                )
+            try:
+                pagina_cursor = tienda.pagina_inventario(por_pagina, cursor or None)
+            except ValueError as e:
+                raise ErrorPeticion(HTTPStatus.BAD_REQUEST, str(e))
+            return {
+                "por_pagina": por_pagina,
+                "total": pagina_cursor.total,
+                "muebles": [mueble_a_dict(m, tienda) for m in pagina_cursor.muebles],
+                "siguiente": pagina_cursor.siguiente,
+            }
+        if cursor is not None:
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "cursor sólo se admite sin filtros")
+
+        # Se conserva el orden del primer filtro aplicado
+        muebles = candidatos[0]
+        for otros in candidatos[1:]:
+            presentes = {id(m) for m in otros}
+            muebles = [m for m in muebles if id(m) in presentes]
+
+        inicio = (pagina - 1) * por_pagina
+        return {
+            "pagina": pagina,
+            "por_pagina": por_pagina,
+            "total": len(muebles),
+            "muebles": [
+                mueble_a_dict(m, tienda) for m in muebles[inicio : inicio + por_pagina]
+            ],
+        }
+
+    def _modificar(self, ruta: str, parametros: Dict) -> Tuple[HTTPStatus, object]:
+        """Resuelve las rutas POST. Método privado auxiliar."""
+        tienda = self.server.tienda
+        datos = self._leer_json()
+        if ruta == "/ventas":
+            cliente = datos.get("cliente", "Cliente Anónimo")
+            if not isinstance(cliente, str):
+                raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "cliente debe ser texto")
+            if "skus" in datos:
+                skus = datos["skus"]
+                if not isinstance(skus, list):
+                    raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "skus debe ser una lista")
+            elif "sku" in datos:
+                skus = [datos["sku"]]
+            else:
+                raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "Falta sku o skus")
+            muebles = []
+            for sku in skus:
+                mueble = tienda.obtener_por_sku(_entero(sku, "sku"))
+                if mueble is None:
+                    raise ErrorPeticion(HTTPStatus.CONFLICT, f"El SKU {sku} no está disponible")
+                muebles.append(mueble)
+            if "skus" in datos:
+                venta = tienda.realizar_ventas_lote(muebles, cliente)
+            else:
+                venta = tienda.realizar_venta(muebles[0], cliente)
+            if "error" in venta:
+                raise ErrorPeticion(HTTPStatus.CONFLICT, venta["error"])
+            return HTTPStatus.CREATED, venta
+        if ruta == "/descuentos":
+            categoria = datos.get("categoria")
+            if not isinstance(categoria, str) or not categoria.strip():
+                raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "Falta la categoría")
+            mensaje = tienda.aplicar_descuento(
+                categoria, _real(datos.get("porcentaje"), "porcentaje")
+            )
+            if mensaje.startswith("Error"):
+                raise ErrorPeticion(HTTPStatus.BAD_REQUEST, mensaje)
+            return HTTPStatus.OK, {"mensaje": mensaje}
+        raise ErrorPeticion(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {ruta}")
+
+    def _leer_json(self) -> Dict:
+        """Lee el cuerpo de la petición como un objeto JSON. Método privado auxiliar."""
+        cabecera = self.headers.get("Content-Length")
+        # Si el cuerpo no se lee, lo que quede en el socket no es otra petición
+        cerrar = self.close_connection
+        self.close_connection = True
+        if cabecera is None:
+            raise ErrorPeticion(HTTPStatus.LENGTH_REQUIRED, "Falta la cabecera Content-Length")
+        longitud = _entero(cabecera, "Content-Length")
+        if longitud < 0:
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "Content-Length no puede ser negativo")
+        if longitud > CUERPO_MAXIMO:
+            raise ErrorPeticion(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"El cuerpo no puede superar {CUERPO_MAXIMO} bytes",
+            )
+        cuerpo = self.rfile.read(longitud)
+        self.close_connection = cerrar
+        try:
+            datos = json.loads(cuerpo or b"{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "El cuerpo no es JSON válido")
+        if not isinstance(datos, dict):
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto JSON")
+        return datos
+
+
+def mueble_a_dict(mueble: Mueble, tienda: TiendaMuebles) -> Dict:
+    """
+    Representación JSON de un mueble del inventario.
+
+    Args:
+        mueble: Mueble a convertir
+        tienda: Tienda donde está el mueble (para su SKU)
+
+    Returns:
+        Dict: SKU, tipo, datos básicos y precio (None si no se puede calcular)
+    """
+    try:
+        precio = mueble.calcular_precio()
+    except Exception:
+        precio = None
+    return {
+        "sku": tienda.obtener_sku(mueble),
+        "tipo": type(mueble).__name__,
+        "nombre": mueble.nombre,
+        "material": mueble.material,
+        "color": mueble.color,
+        "precio_base": mueble.precio_base,
+        "precio": precio,
+    }
+
+
+def _parametro(parametros: Dict, nombre: str, defecto: Optional[str] = None):
+    """Primer valor de un parámetro de la query. Función privada auxiliar."""
+    valores = parametros.get(nombre)
+    return valores[0] if valores else defecto
+
+
+def _entero(valor, nombre: str) -> int:
+    """Convierte un valor a entero o responde 400. Función privada auxiliar."""
+    if isinstance(valor, bool):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un entero")
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un entero")
+
+
+def _real(valor, nombre: str) -> float:
+    """Convierte un valor a número o responde 400. Función privada auxiliar."""
+    if isinstance(valor, bool):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un número")
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un número")
+    if math.isnan(numero):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un número")
+    return numero
+
+
+def servir(
+    tienda: TiendaMuebles, host: str = "127.0.0.1", puerto: int = 8000
+) -> None:
+    """
+    Atiende peticiones hasta que se interrumpa el proceso.
+
+    Args:
+        tienda: Tienda creada con concurrente=True
+        host: Dirección donde escuchar
+        puerto: Puerto donde escuchar
+    """
+    with ServidorTienda((host, puerto), tienda, registrar_peticiones=True) as servidor:
+        print(f"Sirviendo {tienda.nombre} en http://{host}:{servidor.server_port}")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -25,4 +25,31 @@ class TestSilla:
     def test_obtener_descripcion(self, silla_basica):
         descripcion = silla_basica.obtener_descripcion()
         assert "Silla Básica" in descripcion
-        assert "Madera" in descripcion
\ No newline at end of file
+        assert "Madera" in descripcion
+
+    def test_setters_notifican_observadores(self, silla_basica):
+        cambios = []
+        observador = lambda mueble, atributo: cambios.append((mueble, atributo))
+        silla_basica.suscribir(observador)
+
+        silla_basica.precio_base = 80.0
+        silla_basica.tiene_ruedas = True
+        assert cambios == [(silla_basica, "precio_base"), (silla_basica, "tiene_ruedas")]
+
+        silla_basica.desuscribir(observador)
+        silla_basica.color = "Negro"
+        assert len(cambios) == 2
+
+    def test_precio_memoizado_se_invalida_con_setters(self, silla_basica):
+        Silla.reiniciar_estadisticas_cache()
+        precio = silla_basica.calcular_precio()
+        assert silla_basica.calcular_precio() == precio
+        assert Silla.estadisticas_cache()["aciertos"] == 1
+        assert Silla.estadisticas_cache()["fallos"] == 1
+
+        silla_basica.altura_regulable = True
+        assert silla_basica.calcular_precio() == round(precio + 30, 2)
+        assert Silla.estadisticas_cache()["fallos"] == 2
+
+        silla_basica.precio_base = 100.0
+        assert silla_basica.calcular_precio() == round(100.0 * 1.1 + 30, 2)
@@ -38,4 +38,10 @@ class TestSofaCama:
         precio = sofa_cama.calcular_precio()
         # Precio base * 1.3 (tamaño matrimonial) * 1.3 (mecanismo eléctrico) * 1.15 (colchón)
         precio_esperado = 600.0 * 1.3 * 1.3 * 1.15
-        assert abs(precio - precio_esperado) < 0.01  # Aproximadamente 1166.1
\ No newline at end of file
+        assert abs(precio - precio_esperado) < 0.01  # Aproximadamente 1166.1
+
+    def test_precio_memoizado_se_invalida_con_setters(self):
+        sofa_cama = SofaCama("Sofá Cama Caché", "Tela", "Gris", 1000.0)
+        precio = sofa_cama.calcular_precio()
+        sofa_cama.precio_base = 2000.0
+        assert sofa_cama.calcular_precio() == round(precio * 2, 2)
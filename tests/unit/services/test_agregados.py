@@ -0,0 +1,87 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.agregados import SerieVentas, SumaExacta
+from src.services.tienda import TiendaMuebles
+
+
+def test_suma_exacta_coincide_con_fsum():
+    valores = [0.1, 1e16, 0.2, -1e16, 0.3, 1234.56, 1e-3]
+    suma = SumaExacta()
+    for valor in valores:
+        suma.agregar(valor)
+
+    assert suma.valor() == math.fsum(valores)
+
+
+def test_suma_exacta_quitar_anula_el_valor():
+    suma = SumaExacta()
+    for valor in (0.1, 0.2, 0.3):
+        suma.agregar(valor)
+    suma.quitar(0.2)
+
+    assert suma.valor() == math.fsum([0.1, 0.3])
+    suma.quitar(0.1)
+    suma.quitar(0.3)
+    assert suma.valor() == 0.0
+
+
+def test_suma_exacta_agregar_lote_equivale_a_agregar_uno_a_uno():
+    valores = [0.1, 1e16, -1e16, 0.2, 3.3] * 10
+    suma = SumaExacta()
+    suma.agregar_lote(valores)
+
+    assert suma.valor() == math.fsum(valores)
+
+
+def test_serie_ventas_reutiliza_cubetas_antiguas():
+    serie = SerieVentas(resolucion=60, cubetas=3)
+    serie.agregar(0, 100.0, 10.0, "Silla")
+    serie.agregar(59, 50.0, 0.0, "Mesa")
+    serie.agregar(61, 20.0, 0.0, "Silla")
+    assert serie.ventana(3, 179) == {
+        "ventas": 3,
+        "bruto": 170.0,
+        "descuento": 10.0,
+        "tipos": {"Silla": 2, "Mesa": 1},
+    }
+    assert serie.ventana(1, 179)["ventas"] == 0
+
+    # La cubeta del minuto 3 ocupa la posición del minuto 0
+    serie.agregar(180, 5.0, 1.0, "Mesa")
+    assert serie.ventana(3, 180)["ventas"] == 2
+    assert [c["ventas"] for c in serie.serie(3, 180)] == [1, 0, 1]
+    # Ventas más viejas que la ventana conservada se ignoran
+    serie.agregar(0, 100.0, 0.0, "Silla")
+    assert serie.ventana(10, 180)["ventas"] == 2
+    with pytest.raises(ValueError):
+        serie.ventana(0, 180)
+
+
+def test_tienda_resume_ventas_por_hora_y_dia():
+    tienda = TiendaMuebles()
+    silla = Silla("Silla", "Madera", "Café", 100.0)
+    mesa = Mesa("Mesa", "Madera", "Café", 200.0)
+    tienda.agregar_muebles_lote([silla, mesa])
+    tienda.aplicar_descuento("sillas", 10)
+    fecha = datetime.fromisoformat(tienda.realizar_ventas_lote([silla, mesa])["fecha"])
+    precio_silla = silla.calcular_precio()
+
+    resumen = tienda.resumen_ventas("hora", 1, hasta=fecha)
+    assert resumen["ventas"] == 2
+    assert resumen["tipos"] == {"Silla": 1, "Mesa": 1}
+    assert resumen["bruto"] == pytest.approx(precio_silla + mesa.calcular_precio())
+    assert resumen["descuento"] == pytest.approx(precio_silla * 0.1, abs=0.01)
+
+    manana = fecha + timedelta(days=1)
+    assert tienda.resumen_ventas("dia", 1, hasta=manana)["ventas"] == 0
+    assert tienda.resumen_ventas("dia", 2, hasta=manana)["ventas"] == 2
+    serie = tienda.serie_ventas("minuto", 5, hasta=fecha)
+    assert len(serie) == 5 and serie[-1]["ventas"] == 2
+    assert isinstance(serie[0]["inicio"], datetime)
+    with pytest.raises(ValueError):
+        tienda.resumen_ventas("semana")
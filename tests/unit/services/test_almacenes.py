@@ -0,0 +1,224 @@
+import threading
+
+import pytest
+
+from src.models.composicion.comedor import Comedor
+from src.models.concretos.cajonera import Cajonera
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofacama import SofaCama
+from src.services.almacenes import AlmacenMemoria, AlmacenSQLite
+from src.services.tienda import TiendaMuebles
+
+
+def _muebles():
+    return [
+        Silla("Silla Roble", "Madera", "Café", 100.0, tiene_ruedas=True),
+        Mesa("Mesa [Roble]*", "Madera", "Natural", 300.0, capacidad_personas=6),
+        SofaCama("Sofá Cama Gris", "Tela", "Gris", 800.0, tamaño_cama="queen"),
+        Cajonera("Cajonera Metal", "Metal", "Negro", 150.0, 90.0, 50.0, 40.0),
+    ]
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def tienda(request):
+    almacen = AlmacenMemoria() if request.param == "memoria" else AlmacenSQLite()
+    tienda = TiendaMuebles(almacen=almacen)
+    tienda.agregar_muebles_lote(_muebles())
+    yield tienda
+    almacen.cerrar()
+
+
+def test_almacenes_resuelven_los_mismos_filtros(tienda):
+    assert [m.nombre for m in tienda.buscar_muebles_por_nombre("ROBLE")] == [
+        "Silla Roble",
+        "Mesa [Roble]*",
+    ]
+    assert [m.nombre for m in tienda.buscar_muebles_por_nombre("]*")] == ["Mesa [Roble]*"]
+    assert [m.nombre for m in tienda.buscar_muebles_por_nombre("jo")] == ["Cajonera Metal"]
+    precios = [m.calcular_precio() for m in tienda.filtrar_por_precio(0, 1e9)]
+    assert precios == sorted(precios) and len(precios) == 4
+    assert [m.nombre for m in tienda.filtrar_por_material(" MADERA ")] == [
+        "Silla Roble",
+        "Mesa [Roble]*",
+    ]
+    assert tienda.obtener_estadisticas()["materiales"] == {"madera": 2, "tela": 1, "metal": 1}
+
+
+def test_almacenes_siguen_los_cambios_de_los_muebles(tienda):
+    silla = tienda.buscar_muebles_por_nombre("silla")[0]
+    silla.material = "Metal"
+    silla.nombre = "Silla Metálica"
+
+    assert silla in tienda.filtrar_por_material("metal")
+    assert tienda.buscar_muebles_por_nombre("roble")[0].nombre == "Mesa [Roble]*"
+    assert tienda.buscar_muebles_por_nombre("metálica") == [silla]
+    precio = silla.calcular_precio()
+    assert tienda.filtrar_por_precio(precio, precio) == [silla]
+
+    tienda.realizar_venta(silla)
+    assert tienda.buscar_muebles_por_nombre("silla") == []
+    assert silla not in tienda.filtrar_por_material("metal")
+
+
+def test_almacenes_aceptan_comedores(tienda):
+    comedor = Comedor(
+        "Comedor Roble",
+        Mesa("Mesa Comedor", "Madera", "Natural", 300.0),
+        [Silla("Silla Comedor", "Madera", "Café", 80.0)],
+    )
+    tienda.agregar_producto(comedor)
+
+    assert tienda.buscar_muebles_por_nombre("comedor roble") == [comedor]
+    assert comedor in tienda.inventario
+    tienda.realizar_venta(comedor)
+    assert tienda.buscar_muebles_por_nombre("comedor roble") == []
+
+
+def test_sqlite_restaura_el_inventario_al_reiniciar(tmp_path):
+    ruta = str(tmp_path / "inventario.db")
+    almacen = AlmacenSQLite(ruta)
+    tienda = TiendaMuebles(almacen=almacen)
+    tienda.agregar_muebles_lote(_muebles())
+    tienda.agregar_producto(
+        Comedor(
+            "Comedor Pino",
+            Mesa("Mesa Pino", "Pino", "Natural", 250.0),
+            [Silla("Silla Pino", "Pino", "Natural", 60.0, tiene_ruedas=True)],
+        )
+    )
+    silla = tienda.buscar_muebles_por_nombre("silla roble")[0]
+    tienda.realizar_venta(silla)
+    valor = tienda.calcular_valor_inventario()
+    skus = [tienda.obtener_sku(m) for m in tienda.inventario]
+    almacen.cerrar()
+
+    almacen = AlmacenSQLite(ruta)
+    reiniciada = TiendaMuebles(almacen=almacen, verificar_agregados=True)
+
+    assert [reiniciada.obtener_sku(m) for m in reiniciada.inventario] == skus
+    assert reiniciada.calcular_valor_inventario() == valor
+    reiniciada.obtener_estadisticas()
+    sofacama = reiniciada.buscar_muebles_por_nombre("sofá")[0]
+    assert isinstance(sofacama, SofaCama)
+    assert sofacama.tamaño == "queen" and sofacama.incluye_colchon is True
+    assert reiniciada.contar_muebles_por_tipo(SofaCama) == 1
+    comedor = reiniciada.buscar_muebles_por_nombre("comedor pino")[0]
+    assert comedor.mesa.nombre == "Mesa Pino" and comedor.mesa.calcular_precio() > 0
+    assert [s.tiene_ruedas for s in comedor.sillas] == [True]
+    nueva = Silla("Silla Nueva", "Pino", "Blanco", 90.0)
+    reiniciada.agregar_mueble(nueva)
+    assert reiniciada.obtener_sku(nueva) == max(skus) + 1
+    almacen.cerrar()
+
+
+def test_sqlite_agrupa_las_modificaciones_de_un_lote(tmp_path):
+    ruta = str(tmp_path / "inventario.db")
+    almacen = AlmacenSQLite(ruta)
+    tienda = TiendaMuebles(almacen=almacen)
+    tienda.agregar_muebles_lote(_muebles())
+    silla = tienda.buscar_muebles_por_nombre("silla")[0]
+    escrituras = almacen._conexion.total_changes
+
+    with tienda.modificaciones_en_lote():
+        for precio in (110.0, 120.0, 130.0):
+            silla.precio_base = precio
+        silla.nombre = "Silla Fresno"
+        assert almacen._conexion.total_changes == escrituras
+        assert almacen.precio(tienda.obtener_sku(silla)) == silla.calcular_precio()
+    escrituras_lote = almacen._conexion.total_changes - escrituras
+
+    assert tienda.buscar_muebles_por_nombre("fresno") == [silla]
+    assert tienda.filtrar_por_precio(silla.calcular_precio(), silla.calcular_precio()) == [silla]
+    # Las consultas no escriben; un setter fuera de un lote sí escribe al momento
+    assert almacen._conexion.total_changes - escrituras == escrituras_lote
+    silla.color = "Negro"
+    assert almacen._conexion.total_changes - escrituras == 2 * escrituras_lote
+    almacen.cerrar()
+
+    reiniciada = TiendaMuebles(almacen=AlmacenSQLite(ruta))
+    restaurada = reiniciada.buscar_muebles_por_nombre("fresno")[0]
+    assert restaurada.precio_base == 130.0 and restaurada.color == "Negro"
+    reiniciada._almacen.cerrar()
+
+
+def test_sqlite_consultas_concurrentes_con_setters():
+    almacen = AlmacenSQLite()
+    tienda = TiendaMuebles(almacen=almacen, concurrente=True, cache_consultas=0)
+    sillas = [Silla(f"Silla {i}", "Madera", "Café", 100.0) for i in range(2000)]
+    tienda.agregar_muebles_lote(sillas)
+    precio = sillas[0].calcular_precio()
+    errores = []
+    terminado = threading.Event()
+
+    def modificar():
+        try:
+            for silla in sillas:
+                # Mismo precio y nombre: los lectores siempre deben verlas todas
+                silla.precio_base = 100.0
+                silla.nombre = silla.nombre
+        finally:
+            terminado.set()
+
+    def leer():
+        while not terminado.is_set():
+            for cantidad in (
+                len(tienda.filtrar_por_precio(precio, precio)),
+                len(tienda.buscar_muebles_por_nombre("silla")),
+            ):
+                if cantidad != len(sillas):
+                    errores.append(cantidad)
+
+    hilos = [threading.Thread(target=modificar)] + [threading.Thread(target=leer) for _ in range(6)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert errores == []
+    almacen.cerrar()
+
+
+@pytest.mark.parametrize("tipo_almacen", ["memoria", "sqlite"])
+def test_top_k_coincide_con_ordenar_todo(tipo_almacen):
+    almacen = AlmacenMemoria() if tipo_almacen == "memoria" else AlmacenSQLite()
+    tienda = TiendaMuebles(almacen=almacen)
+    muebles = [
+        Silla(f"Silla {i}", ("Madera", "Metal")[i % 2], "Café", float(40 + i % 7))
+        for i in range(60)
+    ]
+    muebles += [Mesa(f"Mesa {i}", "Madera", "Natural", float(200 + i % 3)) for i in range(6)]
+    muebles.append(SofaCama("Sofá Cama", "Tela", "Gris", 800.0))
+    tienda.agregar_muebles_lote(muebles)
+
+    def esperado(descendente, tipo, material):
+        pares = [
+            (m.calcular_precio(), tienda.obtener_sku(m), m)
+            for m in tienda.inventario
+            if (tipo is None or isinstance(m, tipo))
+            and (material is None or m.material.lower() == material)
+        ]
+        pares.sort(key=lambda par: par[:2], reverse=descendente)
+        return [m for _, _, m in pares]
+
+    for k in (1, 5, 100):
+        for tipo in (None, Silla, Mesa, SofaCama):
+            for material in (None, "madera"):
+                todos = esperado(False, tipo, material)
+                assert tienda.mas_baratos(k, tipo, material) == todos[:k]
+                assert tienda.mas_caros(k, tipo, material) == esperado(True, tipo, material)[:k]
+    assert tienda.mas_baratos(0) == []
+    assert tienda.mas_caros(3, material=" ") == []
+    almacen.cerrar()
+
+
+def test_almacen_memoria_no_reubica_el_material_si_no_cambia():
+    almacen = AlmacenMemoria()
+    sillas = [Silla(f"Silla {i}", "Madera", "Café", 10.0) for i in range(3)]
+    almacen.agregar_lote((i + 1, silla, "madera", 10.0) for i, silla in enumerate(sillas))
+    grupo = almacen._materiales._grupos["madera"]
+    almacen.actualizar(1, sillas[0], "madera", 99.0)
+    assert almacen._materiales._grupos["madera"] is grupo
+    assert almacen.por_material("madera") == [1, 2, 3]
+    almacen.actualizar(1, sillas[0], "metal", 99.0)
+    almacen.actualizar(1, sillas[0], "madera", 99.0)
+    assert almacen.por_material("madera") == [1, 2, 3]
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.asincrono import AsyncTiendaMuebles
+from src.services.tienda import TiendaMuebles
+
+
+def _tienda():
+    tienda = TiendaMuebles(concurrente=True)
+    tienda.agregar_muebles_lote(
+        [
+            Silla("Silla Roble", "Madera", "Café", 100.0),
+            Silla("Silla Metal", "Metal", "Negro", 80.0),
+            Mesa("Mesa Roble", "Madera", "Natural", 300.0),
+        ]
+    )
+    return tienda
+
+
+def test_fachada_expone_consultas_como_corrutinas():
+    async def principal():
+        async with AsyncTiendaMuebles(_tienda()) as fachada:
+            buscados, filtrados, estadisticas, reporte = await asyncio.gather(
+                fachada.buscar("roble"),
+                fachada.filtrar(50, 200, material="madera"),
+                fachada.estadisticas(),
+                fachada.generar_reporte_inventario(),
+            )
+        assert [m.nombre for m in buscados] == ["Silla Roble", "Mesa Roble"]
+        assert [m.nombre for m in filtrados] == ["Silla Roble"]
+        assert estadisticas["total_muebles"] == 3
+        assert "Total de muebles: 3" in reporte
+
+    asyncio.run(principal())
+
+
+def test_ventas_concurrentes_del_mismo_mueble():
+    tienda = _tienda()
+    silla = tienda.buscar_muebles_por_nombre("Silla Roble")[0]
+
+    async def principal():
+        async with AsyncTiendaMuebles(tienda) as fachada:
+            return await asyncio.gather(
+                *(fachada.realizar_venta(silla, f"Cliente {i}") for i in range(50))
+            )
+
+    ventas = asyncio.run(principal())
+    assert sum("error" not in venta for venta in ventas) == 1
+    assert tienda.obtener_estadisticas()["ventas_realizadas"] == 1
+
+
+def test_fachada_requiere_tienda_concurrente():
+    with pytest.raises(ValueError):
+        AsyncTiendaMuebles(TiendaMuebles())
@@ -0,0 +1,73 @@
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.cache_consultas import CacheConsultas
+from src.services.tienda import TiendaMuebles
+
+
+def test_cache_desaloja_el_usado_hace_mas_tiempo():
+    cache = CacheConsultas(2)
+    cache.guardar(("a",), 1, (1,))
+    cache.guardar(("b",), 1, (2,))
+    assert cache.obtener(("a",), 1) == (1,)
+    cache.guardar(("c",), 1, (3,))
+    assert cache.obtener(("b",), 1) is None
+    assert cache.obtener(("c",), 1) == (3,)
+
+    estadisticas = cache.estadisticas()
+    assert estadisticas["entradas"] == 2
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (2, 1)
+    assert estadisticas["tasa_aciertos"] == pytest.approx(2 / 3)
+    assert estadisticas["memoria_bytes"] > 0
+    cache.limpiar()
+    assert cache.estadisticas()["memoria_bytes"] == 0
+
+    with pytest.raises(ValueError):
+        CacheConsultas(-1)
+
+
+def test_cache_descarta_las_versiones_anteriores():
+    cache = CacheConsultas(10)
+    for i in range(5):
+        cache.guardar(("consulta", i), 1, (i,))
+    assert cache.estadisticas()["entradas"] == 5
+
+    assert cache.obtener(("consulta", 0), 2) is None
+    estadisticas = cache.estadisticas()
+    assert (estadisticas["entradas"], estadisticas["memoria_bytes"]) == (0, 0)
+    # Un resultado calculado con una versión ya superada no se guarda
+    cache.guardar(("consulta", 0), 1, (0,))
+    assert cache.estadisticas()["entradas"] == 0
+    cache.guardar(("consulta", 0), 2, (0,))
+    assert cache.obtener(("consulta", 0), 2) == (0,)
+
+
+def test_tienda_reutiliza_resultados_hasta_que_cambia_el_inventario():
+    tienda = TiendaMuebles()
+    silla = Silla("Silla Roble", "Madera", "Café", 100.0)
+    tienda.agregar_muebles_lote([silla, Mesa("Mesa Roble", "Madera", "Natural", 300.0)])
+
+    primera = tienda.buscar_muebles_por_nombre("roble")
+    assert tienda.buscar_muebles_por_nombre(" ROBLE ") == primera
+    assert tienda.filtrar_por_material("madera") == tienda.filtrar_por_material("Madera")
+    assert tienda.filtrar_por_precio(-5, 200) == tienda.filtrar_por_precio(0, 200) == [silla]
+    estadisticas = tienda.estadisticas_cache_consultas()
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (3, 3)
+
+    version = tienda.version
+    silla.precio_base = 500.0
+    assert tienda.version > version
+    assert tienda.filtrar_por_precio(0, 200) == []
+    tienda.realizar_venta(silla)
+    assert [m.nombre for m in tienda.buscar_muebles_por_nombre("roble")] == ["Mesa Roble"]
+    # Sólo quedan en caché resultados de la versión actual, sin la silla vendida
+    assert tienda.estadisticas_cache_consultas()["entradas"] == 1
+
+
+def test_tienda_sin_cache():
+    tienda = TiendaMuebles(cache_consultas=0)
+    tienda.agregar_mueble(Silla("Silla Roble", "Madera", "Café", 100.0))
+    assert len(tienda.buscar_muebles_por_nombre("roble")) == 1
+    assert len(tienda.buscar_muebles_por_nombre("roble")) == 1
+    assert tienda.estadisticas_cache_consultas()["entradas"] == 0
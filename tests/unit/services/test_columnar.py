@@ -0,0 +1,45 @@
+import math
+
+from src.services.columnar import InstantaneaColumnar
+
+
+def test_columnar_agregados_por_tipo_e_histograma():
+    columnar = InstantaneaColumnar()
+    columnar.agregar(1, "Silla", "madera", "Café", 100.0, 110.0)
+    columnar.agregar(2, "Mesa", "metal", "Gris", 200.0, 250.0)
+    columnar.agregar(3, "Silla", "metal", "Negro", 300.0, 330.0)
+    columnar.agregar(4, "Sofa", "tela", "Gris", 50.0, None)
+
+    assert len(columnar) == 4
+    assert columnar.valor_total() == math.fsum([110.0, 250.0, 330.0])
+    assert columnar.suma_por_tipo() == {"Silla": 440.0, "Mesa": 250.0}
+    assert columnar.histograma_precios([200, 300]) == [1, 1, 1]
+    assert columnar.decodificar("color", columnar.colores[1]) == "Gris"
+
+
+def test_columnar_eliminar_mueve_ultima_fila():
+    columnar = InstantaneaColumnar()
+    for sku in (1, 2, 3):
+        columnar.agregar(sku, "Silla", "madera", "Café", 10.0 * sku, 10.0 * sku)
+
+    columnar.eliminar(1)
+    assert list(columnar.skus) == [3, 2]
+    assert list(columnar.precios) == [30.0, 20.0]
+
+    columnar.actualizar(3, "Mesa", "metal", "Gris", 5.0, 7.0)
+    assert columnar.suma_por_tipo() == {"Mesa": 7.0, "Silla": 20.0}
+    columnar.eliminar(99)
+    assert len(columnar) == 2
+
+
+def test_columnar_suma_exacta_y_copia_independiente():
+    columnar = InstantaneaColumnar()
+    for sku in range(1, 11):
+        columnar.agregar(sku, "Silla", "madera", "Café", 0.1, 0.1)
+    copia = columnar.copia()
+    columnar.agregar(11, "Mesa", "metal", "Gris", 5.0, 5.0)
+    columnar.eliminar(1)
+
+    assert copia.suma_por_tipo() == {"Silla": math.fsum([0.1] * 10)} == {"Silla": 1.0}
+    assert len(copia) == 10 and list(copia.skus) == list(range(1, 11))
+    assert columnar.suma_por_tipo() == {"Silla": math.fsum([0.1] * 9), "Mesa": 5.0}
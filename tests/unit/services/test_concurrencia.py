@@ -0,0 +1,176 @@
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.concurrencia import CandadoLectoresEscritor, CandadosPorClave
+from src.services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def cambios_frecuentes():
+    # Cambiar de hilo muy seguido para provocar intercalados
+    anterior = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(anterior)
+
+
+def test_ventas_concurrentes_no_venden_dos_veces(cambios_frecuentes):
+    tienda = TiendaMuebles(verificar_agregados=True, concurrente=True)
+    muebles = [
+        Silla(f"Silla {i}", "Madera", "Café", 10.0 + i) if i % 2
+        else Mesa(f"Mesa {i}", "Vidrio", "Negro", 100.0 + i)
+        for i in range(300)
+    ]
+    tienda.agregar_muebles_lote(muebles)
+    tienda.aplicar_descuento("Sillas", 10)
+
+    vendidos = []
+    errores = []
+    barrera = threading.Barrier(8)
+    terminado = threading.Event()
+
+    def vendedor(semilla):
+        orden = muebles[:]
+        random.Random(semilla).shuffle(orden)
+        barrera.wait()
+        for i in range(0, len(orden), 3):
+            if semilla % 2:
+                ventas = [tienda.realizar_venta(m, f"Cliente {semilla}") for m in orden[i : i + 3]]
+            else:
+                resultado = tienda.realizar_ventas_lote(orden[i : i + 3], f"Cliente {semilla}")
+                ventas = resultado.get("ventas", [resultado])
+            vendidos.extend(v["mueble"] for v in ventas if "error" not in v)
+
+    def lector():
+        barrera.wait()
+        while not terminado.is_set():
+            try:
+                tienda.buscar_muebles_por_nombre("Silla 1")
+                tienda.filtrar_por_precio(0, 50)
+                tienda.obtener_estadisticas()
+            except Exception as e:
+                errores.append(e)
+
+    lectores = [threading.Thread(target=lector) for _ in range(2)]
+    vendedores = [threading.Thread(target=vendedor, args=(s,)) for s in range(6)]
+    for hilo in lectores + vendedores:
+        hilo.start()
+    for hilo in vendedores:
+        hilo.join()
+    terminado.set()
+    for hilo in lectores:
+        hilo.join()
+
+    assert errores == []
+    assert sorted(vendidos) == sorted(m.nombre for m in muebles)
+    assert tienda.inventario == []
+    estadisticas = tienda.obtener_estadisticas()
+    assert estadisticas["ventas_realizadas"] == len(muebles)
+    assert estadisticas["valor_inventario"] == 0
+    assert tienda._valor_total_ventas == sum(v["precio_final"] for v in tienda._ventas_realizadas)
+
+
+def test_vender_producto_concurrente_por_nombre(cambios_frecuentes):
+    tienda = TiendaMuebles(concurrente=True)
+    tienda.agregar_muebles_lote([Silla("Silla Igual", "Madera", "Café", 20.0) for _ in range(50)])
+    resultados = []
+
+    def vendedor():
+        for _ in range(20):
+            resultados.append(tienda.vender_producto("Silla Igual"))
+
+    hilos = [threading.Thread(target=vendedor) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert resultados.count(True) == 50
+    assert resultados.count(False) == 30
+    assert tienda._total_muebles_vendidos == 50
+
+
+def test_candado_lectores_escritor_reentrante_y_sin_ascenso():
+    candado = CandadoLectoresEscritor()
+    with candado.escritura():
+        with candado.lectura():
+            with candado.escritura():
+                pass
+    with candado.lectura():
+        with candado.lectura():
+            with pytest.raises(RuntimeError):
+                with candado.escritura():
+                    pass
+    with candado.escritura():
+        pass
+
+
+def test_candados_por_clave():
+    candados = CandadosPorClave(4)
+    assert candados.clave(1) is candados.clave(1)
+    assert candados.clave(1) is candados.clave(5)
+    with candados.claves([3, 7, 1]):
+        assert candados.clave(3).locked() and candados.clave(1).locked()
+    assert not candados.clave(3).locked()
+    with pytest.raises(ValueError):
+        CandadosPorClave(0)
+
+
+def test_vender_producto_reintenta_sin_retener_el_candado_del_sku():
+    tienda = TiendaMuebles(concurrente=True)
+    # Los SKUs 1 y 65 comparten franja en CandadosPorClave(64)
+    muebles = [Silla(f"Silla {i}", "Madera", "Café", 20.0) for i in range(65)]
+    muebles[0].nombre = muebles[64].nombre = "Silla Igual"
+    tienda.agregar_muebles_lote(muebles)
+    resultados = []
+    franja = tienda._candados_sku.clave(1)
+
+    with franja:
+        hilo = threading.Thread(
+            target=lambda: resultados.append(tienda.vender_producto("Silla Igual")), daemon=True
+        )
+        hilo.start()
+        time.sleep(0.2)
+        # Mientras el hilo espera la franja, el SKU 1 sale del inventario
+        with tienda._candado.escritura():
+            tienda._desregistrar(muebles[0])
+    hilo.join(2)
+
+    assert not hilo.is_alive()
+    assert resultados == [True]
+    assert tienda.obtener_sku(muebles[64]) is None
+
+
+def test_venta_respeta_el_candado_del_sku_nuevo_si_el_mueble_volvio():
+    tienda = TiendaMuebles(concurrente=True)
+    silla = Silla("Silla Vuelta", "Madera", "Café", 20.0)
+    tienda.agregar_mueble(silla)
+    resultados = []
+
+    with tienda._candados_sku.clave(1):
+        hilo = threading.Thread(
+            target=lambda: resultados.append(tienda.realizar_venta(silla)), daemon=True
+        )
+        hilo.start()
+        time.sleep(0.2)
+        # Mientras el hilo espera con el SKU 1, el mueble sale y vuelve como SKU 2
+        with tienda._candado.escritura():
+            tienda._desregistrar(silla)
+        tienda.agregar_mueble(silla)
+        franja_nueva = tienda._candados_sku.clave(tienda.obtener_sku(silla))
+        franja_nueva.acquire()
+    # Otro vendedor tiene la franja del SKU 2: el hilo no puede venderlo todavía
+    time.sleep(0.2)
+    assert tienda.obtener_sku(silla) == 2
+    franja_nueva.release()
+    hilo.join(2)
+
+    assert not hilo.is_alive()
+    assert "error" not in resultados[0]
+    assert tienda.obtener_sku(silla) is None
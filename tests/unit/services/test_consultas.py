@@ -0,0 +1,61 @@
+import pytest
+
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofa import Sofa
+from src.services.almacenes import AlmacenMemoria, AlmacenSQLite
+from src.services.tienda import TiendaMuebles
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def tienda(request):
+    almacen = AlmacenMemoria() if request.param == "memoria" else AlmacenSQLite()
+    tienda = TiendaMuebles(almacen=almacen)
+    materiales = ["Madera", "Metal", "Plástico"]
+    muebles = []
+    for i in range(60):
+        material = materiales[i % 3]
+        muebles.append(Silla(f"Silla {material} {i}", material, "Café", 50.0 + i))
+        muebles.append(Mesa(f"Mesa {material} {i}", material, "Natural", 200.0 + i))
+    muebles.append(Sofa("Sofá Roble", "Madera", "Gris", 900.0))
+    tienda.agregar_muebles_lote(muebles)
+    yield tienda
+    almacen.cerrar()
+
+
+def test_consultar_coincide_con_filtrar_por_separado(tienda):
+    resultado = list(
+        tienda.consultar(nombre="1", material=" MADERA ", precio_min=60, precio_max=250, tipo_clase=Asiento)
+    )
+    esperado = [
+        m
+        for m in tienda.obtener_muebles_por_tipo(Asiento)
+        if "1" in m.nombre and m.material == "Madera" and 60 <= m.calcular_precio() <= 250
+    ]
+    assert resultado == esperado and resultado
+    assert [tienda.obtener_sku(m) for m in resultado] == sorted(tienda.obtener_sku(m) for m in resultado)
+
+    assert len(list(tienda.consultar())) == 121
+    assert list(tienda.consultar(material=" ")) == []
+    assert list(tienda.consultar(tipo_clase=Sofa, precio_max=100)) == []
+
+
+def test_explicar_parte_del_indice_mas_selectivo(tienda):
+    plan = tienda.explicar_consulta(material="madera", precio_min=800, tipo_clase=Asiento)
+    lineas = plan.splitlines()
+    assert lineas[0] == "1. Inicio: índice de precios (800 <= precio) ~ 1 muebles (exacto)"
+    assert lineas[1].startswith("2. Filtro: índice de materiales") and "~ 41 muebles" in lineas[1]
+    assert lineas[2].startswith("3. Filtro: índice de tipos")
+    assert tienda.explicar_consulta().startswith("1. Inicio: recorrido completo")
+
+
+def test_consultar_es_perezosa_y_omite_vendidos(tienda):
+    tienda.agregar_muebles_lote([Silla(f"Silla Extra {i}", "Metal", "Negro", 70.0) for i in range(300)])
+    sillas = tienda.obtener_muebles_por_tipo(Silla)
+    consulta = tienda.consultar(tipo_clase=Silla)
+    assert next(consulta) is sillas[0]
+    # El primer bloque ya se comprobó; los vendidos después de él no aparecen
+    for mueble in sillas[200:]:
+        tienda.realizar_venta(mueble)
+    assert list(consulta) == sillas[1:256]
@@ -0,0 +1,36 @@
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.silla import Silla
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sofacama import SofaCama
+from src.services.descuentos import MotorDescuentos, normalizar_categoria
+
+
+def test_normalizar_categoria_quita_tildes_y_separadores():
+    assert normalizar_categoria("Sofá-Cama") == "sofacama"
+    assert normalizar_categoria(" Sillón ") == "sillon"
+
+
+def test_resolver_categoria_singular_y_plural():
+    clases = [Asiento, Silla, Sillon, Sofa, SofaCama]
+
+    assert MotorDescuentos.resolver_categoria("sillones", clases) is Sillon
+    assert MotorDescuentos.resolver_categoria("sofás", clases) is Sofa
+    assert MotorDescuentos.resolver_categoria("Sillas", clases) is Silla
+    assert MotorDescuentos.resolver_categoria("sofá cama", clases) is SofaCama
+    assert MotorDescuentos.resolver_categoria("lámparas", clases) is None
+
+
+def test_tasa_efectiva_usa_la_clase_mas_especifica_del_mro():
+    motor = MotorDescuentos()
+    assert not motor
+    motor.registrar("Asiento", 0.1)
+    motor.registrar("Sofa", 0.25)
+
+    assert motor.tasa(Silla) == 0.1
+    assert motor.tasa(Sofa) == 0.25
+    assert motor.tasa(SofaCama) == 0.25
+    assert motor.tasa(int) == 0.0
+
+    motor.registrar("Sofa", 0.05)
+    assert motor.tasa(SofaCama) == 0.05
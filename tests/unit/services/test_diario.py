@@ -0,0 +1,142 @@
+import pytest
+
+from src.services.diario import DiarioVentas
+from src.services.tienda import TiendaMuebles
+from src.models.concretos.silla import Silla
+
+
+def _venta(i):
+    return {"mueble": f"Silla {i}", "cliente": "Ana", "precio_final": 10.0 + i}
+
+
+def test_diario_reproduce_en_orden(tmp_path):
+    ruta = str(tmp_path / "ventas.diario")
+    with DiarioVentas(ruta, lote_fsync=2) as diario:
+        for i in range(5):
+            diario.registrar(_venta(i))
+
+    assert list(DiarioVentas(ruta).reproducir()) == [_venta(i) for i in range(5)]
+
+
+def test_diario_descarta_cola_incompleta_y_sigue_escribiendo(tmp_path):
+    ruta = tmp_path / "ventas.diario"
+    with DiarioVentas(str(ruta)) as diario:
+        diario.registrar(_venta(0))
+        diario.registrar(_venta(1))
+    # Simular una caída a mitad de escritura del último registro
+    ruta.write_bytes(ruta.read_bytes()[:-3])
+
+    diario = DiarioVentas(str(ruta))
+    assert list(diario.reproducir()) == [_venta(0)]
+    diario.registrar(_venta(2))
+    diario.cerrar()
+    assert list(DiarioVentas(str(ruta)).reproducir()) == [_venta(0), _venta(2)]
+
+
+def test_diario_se_detiene_ante_checksum_invalido(tmp_path):
+    ruta = tmp_path / "ventas.diario"
+    with DiarioVentas(str(ruta)) as diario:
+        diario.registrar(_venta(0))
+        diario.registrar(_venta(1))
+    datos = bytearray(ruta.read_bytes())
+    datos[-2] ^= 0xFF
+    ruta.write_bytes(bytes(datos))
+
+    assert list(DiarioVentas(str(ruta)).reproducir()) == [_venta(0)]
+
+
+def test_diario_rechaza_archivo_ajeno(tmp_path):
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"no es un diario")
+    with pytest.raises(ValueError):
+        list(DiarioVentas(str(ruta)).reproducir())
+
+
+def test_tienda_recupera_ventas_desde_el_diario(tmp_path):
+    ruta = str(tmp_path / "ventas.diario")
+    diario = DiarioVentas(ruta, lote_fsync=10)
+    tienda = TiendaMuebles(diario=diario)
+    sillas = [Silla(f"Silla Diario {i}", "Madera", "Café", 100.0 + i) for i in range(4)]
+    for silla in sillas:
+        tienda.agregar_mueble(silla)
+    tienda.realizar_venta(sillas[0], "Ana")
+    tienda.vender_producto("Silla Diario 1")
+    tienda.realizar_ventas_lote(sillas[2:], "Luis")
+    diario.cerrar()
+    stats = tienda.obtener_estadisticas()
+
+    recuperada = TiendaMuebles(diario=DiarioVentas(ruta))
+    stats_recuperadas = recuperada.obtener_estadisticas()
+
+    assert recuperada._ventas_realizadas == tienda._ventas_realizadas
+    for campo in ("ventas_realizadas", "total_muebles_vendidos", "valor_total_ventas"):
+        assert stats_recuperadas[campo] == stats[campo]
+
+
+def test_venta_en_lote_es_un_solo_registro(tmp_path):
+    ruta = tmp_path / "ventas.diario"
+    with DiarioVentas(str(ruta)) as diario:
+        diario.registrar(_venta(0))
+        diario.registrar_lote([_venta(1), _venta(2)])
+    assert list(DiarioVentas(str(ruta)).reproducir()) == [_venta(i) for i in range(3)]
+
+    # Una caída a mitad del lote no deja ventas sueltas del pedido
+    ruta.write_bytes(ruta.read_bytes()[:-3])
+    assert list(DiarioVentas(str(ruta)).reproducir()) == [_venta(0)]
+
+
+def test_lote_no_modifica_la_tienda_si_falla_el_diario(tmp_path):
+    diario = DiarioVentas(str(tmp_path / "ventas.diario"))
+    tienda = TiendaMuebles(diario=diario)
+    sillas = [Silla(f"Silla Lote {i}", "Madera", "Café", 50.0) for i in range(2)]
+    tienda.agregar_muebles_lote(sillas)
+
+    def fallar(ventas):
+        raise OSError("disco lleno")
+
+    diario.registrar_lote = fallar
+    assert "disco lleno" in tienda.realizar_ventas_lote(sillas)["error"]
+    assert tienda._ventas_realizadas == []
+    assert len(tienda.inventario) == 2
+
+
+def test_diario_descarta_el_ultimo_registro(tmp_path):
+    ruta = tmp_path / "ventas.diario"
+    # Una cola incompleta previa también se descarta al reabrir
+    with DiarioVentas(str(ruta)) as diario:
+        diario.registrar(_venta(0))
+        diario.registrar(_venta(1))
+    ruta.write_bytes(ruta.read_bytes()[:-3])
+
+    diario = DiarioVentas(str(ruta), lote_fsync=5)
+    with pytest.raises(ValueError):
+        diario.descartar_ultimo()
+    diario.registrar(_venta(2))
+    diario.descartar_ultimo()
+    diario.registrar_lote([_venta(3), _venta(4)])
+    diario.cerrar()
+    assert list(DiarioVentas(str(ruta)).reproducir()) == [_venta(0), _venta(3), _venta(4)]
+
+
+@pytest.mark.parametrize("en_lote", [False, True])
+def test_venta_se_descarta_del_diario_si_no_se_retira_el_mueble(tmp_path, en_lote):
+    ruta = str(tmp_path / "ventas.diario")
+    diario = DiarioVentas(ruta)
+    tienda = TiendaMuebles(diario=diario)
+    sillas = [Silla(f"Silla Baja {i}", "Madera", "Café", 50.0) for i in range(2)]
+    tienda.agregar_muebles_lote(sillas)
+    tienda.realizar_venta(sillas[0])
+
+    def fallar(skus):
+        raise OSError("almacén no disponible")
+
+    tienda._almacen.eliminar_lote = fallar
+    if en_lote:
+        venta = tienda.realizar_ventas_lote(sillas[1:])
+    else:
+        venta = tienda.realizar_venta(sillas[1])
+    assert "almacén no disponible" in venta["error"]
+    assert len(tienda._ventas_realizadas) == 1
+    assert tienda.inventario == [sillas[1]]
+    diario.cerrar()
+    assert [v["sku"] for v in DiarioVentas(ruta).reproducir()] == [1]
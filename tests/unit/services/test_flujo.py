@@ -0,0 +1,81 @@
+import io
+import socket
+
+import pytest
+
+from src.models.composicion.comedor import Comedor
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.flujo import escribir_fragmentos
+from src.services.tienda import TiendaMuebles
+
+
+def _tienda():
+    tienda = TiendaMuebles()
+    tienda.agregar_muebles_lote(
+        [Silla(f"Silla {i}", "Madera", "Café", 100.0 + i) for i in range(5)]
+        + [Mesa("Mesa Ñandú", "Vidrio", "Negro", 300.0)]
+    )
+    sillas = [Silla(f"Silla Comedor {i}", "Madera", "Café", 80.0) for i in range(4)]
+    tienda.agregar_comedor(Comedor("Familiar", Mesa("Mesa Comedor", "Madera", "Café", 400.0), sillas))
+    return tienda
+
+
+def test_reporte_por_lineas_coincide_con_el_reporte_completo():
+    tienda = _tienda()
+    lineas = list(tienda.iterar_reporte_inventario())
+    assert all(linea.endswith("\n") for linea in lineas)
+    assert "".join(lineas) == tienda.generar_reporte_inventario()
+
+
+def test_reporte_con_detalle_describe_cada_mueble():
+    tienda = _tienda()
+    destino = io.StringIO()
+    escritos = tienda.escribir_reporte_inventario(destino, detalle=True)
+    texto = destino.getvalue()
+    assert escritos == len(texto)
+    assert texto.startswith(tienda.generar_reporte_inventario())
+    assert texto.count("[SKU ") == 6
+    assert "[SKU 6] Mesa" in texto
+    assert "=== COMEDOR FAMILIAR ===" in texto
+
+
+def test_escribir_fragmentos_a_archivo_binario_ruta_y_socket(tmp_path):
+    fragmentos = [f"línea {i}\n" for i in range(1000)]
+    esperado = "".join(fragmentos)
+
+    binario = io.BytesIO()
+    escribir_fragmentos(fragmentos, binario, tamano_bloque=100)
+    assert binario.getvalue().decode("utf-8") == esperado
+
+    ruta = tmp_path / "reporte.txt"
+    escribir_fragmentos(iter(fragmentos), str(ruta))
+    assert ruta.read_text(encoding="utf-8") == esperado
+
+    emisor, receptor = socket.socketpair()
+    with emisor, receptor:
+        escribir_fragmentos(fragmentos, emisor, tamano_bloque=512)
+        emisor.shutdown(socket.SHUT_WR)
+        recibido = b"".join(iter(lambda: receptor.recv(4096), b""))
+    assert recibido.decode("utf-8") == esperado
+
+    with pytest.raises(ValueError):
+        escribir_fragmentos(fragmentos, io.StringIO(), tamano_bloque=0)
+
+
+def test_descripcion_del_comedor_por_partes():
+    sillas = [Silla(f"Silla {i}", "Madera", "Café", 80.0) for i in range(2)]
+    comedor = Comedor("Diario", Mesa("Mesa", "Madera", "Café", 400.0), sillas)
+    assert "".join(comedor.iterar_descripcion_completa()) == comedor.obtener_descripcion_completa()
+    assert comedor.obtener_descripcion_completa().startswith("=== COMEDOR DIARIO ===\n\nMESA:\n")
+
+
+def test_reporte_con_detalle_incluye_comedores_del_inventario():
+    tienda = _tienda()
+    sillas = [Silla(f"Silla Terraza {i}", "Metal", "Gris", 60.0) for i in range(2)]
+    tienda.agregar_producto(Comedor("Terraza", Mesa("Mesa Terraza", "Metal", "Gris", 200.0), sillas))
+    lineas = list(tienda.iterar_reporte_inventario(detalle=True))
+    texto = "".join(lineas)
+    assert all(linea.endswith("\n") for linea in lineas)
+    assert "[SKU 7] === COMEDOR TERRAZA ===" in texto
+    assert texto.count("[SKU ") == 7
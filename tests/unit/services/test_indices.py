@@ -0,0 +1,123 @@
+from src.services.indices import IndiceAgrupado, IndiceNGramas, IndicePrecios
+
+
+def test_ngramas_busqueda_parcial_case_insensitive():
+    indice = IndiceNGramas()
+    indice.agregar(1, "Silla Clásica")
+    indice.agregar(2, "Sillón Reclinable")
+    indice.agregar(3, "Mesa de Centro")
+
+    assert indice.buscar("SILL") == {1, 2}
+    assert indice.buscar("clásica") == {1}
+    assert indice.buscar("centro") == {3}
+    assert indice.buscar("armario") == set()
+
+
+def test_ngramas_consulta_corta_y_eliminacion():
+    indice = IndiceNGramas()
+    indice.agregar(1, "Mesa")
+    indice.agregar(2, "Cama")
+
+    assert indice.buscar("a") == {1, 2}
+    indice.eliminar(1)
+    assert indice.buscar("mes") == set()
+    assert indice.buscar("a") == {2}
+    assert len(indice) == 1
+
+
+def test_ngramas_verifica_subcadena_completa():
+    indice = IndiceNGramas()
+    # Contiene los trigramas "abc" y "bcd" pero no la subcadena "abcd"
+    indice.agregar(1, "abc-bcd")
+    indice.agregar(2, "xabcdx")
+
+    assert indice.buscar("abcd") == {2}
+
+
+def test_precios_rango_ordenado_y_actualizacion():
+    indice = IndicePrecios()
+    indice.agregar(1, 300.0)
+    indice.agregar(2, 100.0)
+    indice.agregar(3, 200.0)
+    indice.agregar(4, 100.0)
+
+    assert indice.rango(100, 200) == [2, 4, 3]
+    assert indice.rango(150) == [3, 1]
+    assert indice.rango(400, 500) == []
+
+    indice.agregar(1, 50.0)
+    assert indice.rango() == [1, 2, 4, 3]
+    indice.eliminar(2)
+    assert indice.rango(0, 100) == [1, 4]
+    assert indice.precio(2) is None
+
+
+def test_agrupado_conteos_y_orden_tras_reubicar():
+    indice = IndiceAgrupado()
+    indice.agregar(1, ("madera",))
+    indice.agregar(2, ("metal",))
+    indice.agregar(3, ("madera",))
+
+    assert indice.claves("madera") == [1, 3]
+    assert indice.conteos() == {"madera": 2, "metal": 1}
+
+    # La clave 2 cambia de grupo y debe quedar en orden de inventario
+    indice.agregar(2, ("madera",))
+    assert indice.claves("madera") == [1, 2, 3]
+    assert indice.conteo("metal") == 0
+    assert indice.claves("metal") == []
+
+    indice.eliminar(1)
+    assert indice.claves("madera") == [2, 3]
+
+
+def test_precios_agregar_lote_mezcla_con_existentes():
+    indice = IndicePrecios()
+    indice.agregar(1, 150.0)
+    indice.agregar(2, 50.0)
+    indice.agregar_lote([(3, 100.0), (4, 200.0), (1, 10.0)])
+
+    assert indice.rango() == [1, 2, 3, 4]
+    assert len(indice) == 4
+
+
+def test_ngramas_agregar_lote():
+    indice = IndiceNGramas()
+    indice.agregar_lote([(1, "Mesa Roble"), (2, "Silla Roble"), (3, None)])
+
+    assert indice.buscar("roble") == {1, 2}
+    assert len(indice) == 3
+
+
+def test_ngramas_lote_pendiente_se_puede_eliminar_y_reindexar():
+    indice = IndiceNGramas()
+    indice.agregar_lote([(1, "Mesa Roble"), (2, "Silla Roble")])
+    indice.eliminar(1)
+    indice.agregar(2, "Silla Pino")
+
+    assert indice.buscar("roble") == set()
+    assert indice.buscar("pino") == {2}
+    assert len(indice) == 1
+
+
+def test_agrupado_agregar_lote_conserva_orden_ascendente():
+    indice = IndiceAgrupado()
+    indice.agregar(5, ["silla", "asiento"])
+    indice.agregar_lote([(3, ["sofa", "asiento"]), (7, ["silla", "asiento"]), (1, ["silla"])])
+
+    assert indice.claves("asiento") == [3, 5, 7]
+    assert indice.claves("silla") == [1, 5, 7]
+    assert indice.conteos() == {"silla": 3, "asiento": 3, "sofa": 1}
+
+
+def test_agrupado_ordena_al_escribir_y_las_lecturas_no_modifican():
+    indice = IndiceAgrupado()
+    indice.agregar_lote([(5, ("a",)), (9, ("a",)), (2, ("a",))])
+    indice.agregar(7, ("a",))
+    indice.agregar_lote([(1, ("a",)), (8, ("a",))])
+    grupo = indice._grupos["a"]
+    assert list(grupo) == [1, 2, 5, 7, 8, 9]
+    assert indice.claves("a") == [1, 2, 5, 7, 8, 9]
+    assert indice.primeras("a", 2) == [1, 2]
+    assert indice._grupos["a"] is grupo
+
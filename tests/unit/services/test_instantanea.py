@@ -0,0 +1,107 @@
+import pytest
+
+from src.models.composicion.comedor import Comedor
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofacama import SofaCama
+from src.services.diario import DiarioVentas
+from src.services.instantanea import escribir_instantanea, leer_instantanea
+from src.services.tienda import TiendaMuebles
+
+
+def _tienda():
+    tienda = TiendaMuebles("Mueblería Instantánea")
+    silla = Silla("Silla Roble", "Madera", "Café", 100.0, tiene_ruedas=True)
+    mesa = Mesa("Mesa Roble", "Madera", "Natural", 300, capacidad_personas=6)
+    sofacama = SofaCama("Sofá Cama Gris", "Tela", "Gris", 800.0)
+    tienda.agregar_muebles_lote([silla, mesa, sofacama])
+    silla_extra = Silla("Silla Comedor", "Madera", "Natural", 80.0)
+    tienda.agregar_comedor(Comedor("Comedor Roble", mesa, [silla_extra]))
+    tienda.aplicar_descuento("sillas", 10)
+    tienda.realizar_venta(sofacama, "Ana")
+    return tienda
+
+
+def test_instantanea_restaura_el_estado_de_la_tienda(tmp_path):
+    ruta = str(tmp_path / "tienda.instantanea")
+    original = _tienda()
+    original.guardar_instantanea(ruta)
+
+    tienda = TiendaMuebles.cargar_instantanea(ruta)
+
+    assert tienda.nombre == "Mueblería Instantánea"
+    assert [m.nombre for m in tienda.inventario] == ["Silla Roble", "Mesa Roble"]
+    assert tienda.obtener_estadisticas() == original.obtener_estadisticas()
+    assert tienda.calcular_valor_inventario() == original.calcular_valor_inventario()
+    assert tienda.cotizar_catalogo() == original.cotizar_catalogo()
+    silla, mesa = tienda.inventario
+    assert silla.tiene_ruedas is True
+    assert mesa.precio_base == 300 and isinstance(mesa.precio_base, int)
+    comedor = tienda._comedores[0]
+    assert comedor.mesa is mesa
+    assert [s.nombre for s in comedor.sillas] == ["Silla Comedor"]
+
+
+def test_instantanea_restaurada_mantiene_indices_al_dia(tmp_path):
+    ruta = str(tmp_path / "tienda.instantanea")
+    _tienda().guardar_instantanea(ruta)
+    tienda = TiendaMuebles.cargar_instantanea(ruta, verificar_agregados=True)
+
+    silla = tienda.buscar_muebles_por_nombre("silla")[0]
+    silla.precio_base = 150.0
+    precio = silla.calcular_precio()
+    assert silla in tienda.filtrar_por_precio(precio, precio)
+    tienda.obtener_estadisticas()
+    tienda.realizar_venta(silla)
+    assert tienda.buscar_muebles_por_nombre("silla") == []
+
+
+def test_instantanea_guarda_objetos_arbitrarios_por_posicion(tmp_path):
+    ruta = str(tmp_path / "objetos.instantanea")
+    sillas = [Silla(f"Silla {i}", "Metal", "Negro", 50.0 + i) for i in range(3)]
+    sillas[1].extra = {"etiquetas": ["oferta"]}
+
+    escribir_instantanea(ruta, sillas, {"clave": 1})
+    objetos, estado = leer_instantanea(ruta)
+
+    assert estado == {"clave": 1}
+    assert [o.nombre for o in objetos] == ["Silla 0", "Silla 1", "Silla 2"]
+    assert objetos[1].extra == {"etiquetas": ["oferta"]}
+    assert objetos[0]._observadores == [] and objetos[0]._precio_cache is None
+
+
+def test_instantanea_rechaza_archivo_ajeno(tmp_path):
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"no es una instantanea de la tienda")
+    with pytest.raises(ValueError):
+        leer_instantanea(str(ruta))
+
+
+def test_reinicio_con_instantanea_y_diario_no_revive_lo_vendido(tmp_path):
+    ruta = str(tmp_path / "catalogo.instantanea")
+    ruta_diario = str(tmp_path / "ventas.diario")
+    tienda = TiendaMuebles(diario=DiarioVentas(ruta_diario))
+    sillas = [Silla(f"Silla {i}", "Madera", "Café", 50.0 + i) for i in range(4)]
+    tienda.agregar_muebles_lote(sillas)
+    tienda.guardar_instantanea(ruta)
+    tienda.realizar_venta(sillas[0])
+    tienda.realizar_ventas_lote(sillas[1:3])
+    tienda._diario.cerrar()
+
+    # Caída sin volver a guardar la instantánea: el diario retira lo vendido
+    reiniciada = TiendaMuebles.cargar_instantanea(ruta, diario=DiarioVentas(ruta_diario))
+    assert [m.nombre for m in reiniciada.inventario] == ["Silla 3"]
+    assert reiniciada.obtener_estadisticas()["total_muebles_vendidos"] == 3
+    assert reiniciada.vender_producto("Silla 0") is False
+
+    # Salida normal: se guarda la instantánea y un mueble nuevo no reutiliza SKUs vendidos
+    nueva = Silla("Silla Nueva", "Pino", "Blanco", 30.0)
+    reiniciada.agregar_mueble(nueva)
+    assert reiniciada.obtener_sku(nueva) == 5
+    reiniciada.guardar_instantanea(ruta)
+    reiniciada._diario.cerrar()
+
+    otra_vez = TiendaMuebles.cargar_instantanea(ruta, diario=DiarioVentas(ruta_diario))
+    assert [m.nombre for m in otra_vez.inventario] == ["Silla 3", "Silla Nueva"]
+    assert otra_vez.obtener_sku(otra_vez.inventario[1]) == 5
+    assert otra_vez.obtener_estadisticas()["total_muebles_vendidos"] == 3
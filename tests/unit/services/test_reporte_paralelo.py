@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofa import Sofa
+from src.services.reporte_paralelo import agregados_columnares, agregados_paralelos
+from src.services.tienda import TiendaMuebles
+
+
+def _tienda():
+    tienda = TiendaMuebles()
+    muebles = []
+    for i in range(40):
+        muebles.append(Silla(f"Silla {i}", "Madera" if i % 3 else "Metal", "Café", 50.0 + i * 7.1))
+        muebles.append(Mesa(f"Mesa {i}", "Vidrio", "Negro", 200.0 + i * 33.3))
+    muebles.append(Sofa("Sofá", "Tela", "Gris", 900.0))
+    tienda.agregar_muebles_lote(muebles)
+    tienda.realizar_venta(muebles[1])
+    return tienda
+
+
+def test_reporte_paralelo_coincide_con_el_secuencial():
+    tienda = _tienda()
+    secuencial = tienda.generar_reporte_inventario()
+    assert "DISTRIBUCIÓN POR MATERIALES" in secuencial
+    assert tienda.generar_reporte_inventario(procesos=3) == secuencial
+
+
+@pytest.mark.parametrize("procesos", [1, 2, 7])
+def test_agregados_no_dependen_del_numero_de_procesos(procesos):
+    tienda = _tienda()
+    columnar = tienda.instantanea_columnar()
+    limites = TiendaMuebles.LIMITES_PRECIO_REPORTE
+    agregados = agregados_paralelos(columnar, limites, procesos)
+    precios = [m.calcular_precio() for m in tienda.inventario]
+
+    assert agregados.valor_total == math.fsum(precios)
+    assert agregados.conteo_tipos == {"Silla": 40, "Mesa": 39, "Sofa": 1}
+    assert agregados.conteo_materiales == {"madera": 26, "metal": 14, "vidrio": 39, "tela": 1}
+    assert agregados.histograma == columnar.histograma_precios(limites)
+    assert sum(agregados.valor_tipos.values()) == pytest.approx(agregados.valor_total)
+
+
+def test_agregados_columnares_coinciden_con_los_bloques():
+    tienda = _tienda()
+    columnar = tienda.instantanea_columnar()
+    limites = TiendaMuebles.LIMITES_PRECIO_REPORTE
+    columnares = agregados_columnares(columnar, limites)
+    assert agregados_paralelos(columnar, limites, 1) == columnares
+    assert agregados_paralelos(columnar, limites, 3) == columnares
+    assert list(columnares.conteo_tipos) == ["Silla", "Mesa", "Sofa"]
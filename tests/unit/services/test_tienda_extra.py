@@ -1,4 +1,7 @@
+import pytest
+
 from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
 
 
 def test_tienda_agregar_y_buscar_por_inventario(tienda_vacia):
@@ -35,3 +38,235 @@ def test_tienda_vender_producto_por_nombre(tienda_vacia):
     vendido = tienda.vender_producto("Mesa a Eliminar")
     assert vendido is True
     assert len(tienda.inventario) == 0
+
+
+def test_tienda_buscar_por_nombre_respeta_orden_y_ventas(tienda_vacia, mesa_basica, sofa_basico):
+    tienda = tienda_vacia
+    tienda.agregar_mueble(sofa_basico)
+    tienda.agregar_mueble(mesa_basica)
+
+    assert tienda.buscar_muebles_por_nombre("TEST") == [sofa_basico, mesa_basica]
+    assert tienda.buscar_muebles_por_nombre("  mesa ") == [mesa_basica]
+    assert tienda.buscar_muebles_por_nombre("   ") == []
+
+    tienda.realizar_venta(mesa_basica)
+    assert tienda.buscar_muebles_por_nombre("test") == [sofa_basico]
+
+
+def test_tienda_no_agrega_dos_veces_el_mismo_mueble(tienda_vacia, mesa_basica):
+    tienda = tienda_vacia
+    tienda.agregar_mueble(mesa_basica)
+    resultado = tienda.agregar_mueble(mesa_basica)
+
+    assert resultado.startswith("Error")
+    assert len(tienda.inventario) == 1
+
+
+def test_tienda_filtrar_por_precio_ordenado_y_reprecio(tienda_vacia, mesa_basica, sofa_basico):
+    tienda = tienda_vacia
+    tienda.agregar_mueble(sofa_basico)
+    tienda.agregar_mueble(mesa_basica)
+
+    precio_mesa = mesa_basica.calcular_precio()
+    precio_sofa = sofa_basico.calcular_precio()
+    assert precio_mesa < precio_sofa
+    assert tienda.filtrar_por_precio() == [mesa_basica, sofa_basico]
+    assert tienda.filtrar_por_precio(precio_sofa, precio_sofa) == [sofa_basico]
+
+    # Cambiar el precio base reubica el mueble en el índice
+    mesa_basica.precio_base = 10000.0
+    assert tienda.filtrar_por_precio() == [sofa_basico, mesa_basica]
+    assert tienda.filtrar_por_precio(0, precio_sofa) == [sofa_basico]
+
+    tienda.realizar_venta(sofa_basico)
+    assert tienda.filtrar_por_precio() == [mesa_basica]
+
+
+def test_tienda_filtrar_por_material_sigue_al_setter(tienda_vacia, mesa_basica, sofa_basico, armario_basico):
+    tienda = tienda_vacia
+    for mueble in (mesa_basica, sofa_basico, armario_basico):
+        tienda.agregar_mueble(mueble)
+
+    assert tienda.filtrar_por_material(" MADERA ") == [mesa_basica, armario_basico]
+    assert tienda.obtener_estadisticas()["materiales"] == {"madera": 2, "tela": 1}
+
+    mesa_basica.material = "Vidrio"
+    assert tienda.filtrar_por_material("madera") == [armario_basico]
+    assert tienda.filtrar_por_material("vidrio") == [mesa_basica]
+
+    sofa_basico.material = "Madera"
+    assert tienda.filtrar_por_material("madera") == [sofa_basico, armario_basico]
+
+    tienda.realizar_venta(armario_basico)
+    assert tienda.obtener_estadisticas()["materiales"] == {"vidrio": 1, "madera": 1}
+
+
+def test_tienda_obtener_muebles_por_tipo_con_jerarquia(
+    tienda_vacia, mesa_basica, sofa_basico, armario_basico
+):
+    from src.models.categorias.almacenamiento import Almacenamiento
+    from src.models.categorias.asientos import Asiento
+    from src.models.categorias.superficies import Superficie
+    from src.models.concretos.cajonera import Cajonera
+    from src.models.concretos.cama import Cama
+    from src.models.concretos.sillon import Sillon
+    from src.models.concretos.sofa import Sofa
+    from src.models.concretos.sofacama import SofaCama
+
+    tienda = tienda_vacia
+    sofacama = SofaCama("SofaCama Test", "Tela", "Beige", 500.0)
+    sillon = Sillon("Sillón Test", "Cuero", "Negro", 300.0)
+    cajonera = Cajonera("Cajonera Test", "Madera", "Blanco", 150.0, 90.0, 50.0, 40.0)
+    for mueble in (sofa_basico, mesa_basica, sofacama, sillon, armario_basico, cajonera):
+        tienda.agregar_mueble(mueble)
+
+    assert tienda.obtener_muebles_por_tipo(Asiento) == [sofa_basico, sofacama, sillon]
+    assert tienda.obtener_muebles_por_tipo(Sofa) == [sofa_basico, sofacama]
+    assert tienda.obtener_muebles_por_tipo(Cama) == [sofacama]
+    assert tienda.obtener_muebles_por_tipo(Superficie) == [mesa_basica]
+    assert tienda.obtener_muebles_por_tipo(Almacenamiento) == [armario_basico, cajonera]
+    assert tienda.contar_muebles_por_tipo(Asiento) == 3
+    assert tienda._contar_tipos_muebles() == {
+        "Sofa": 1, "Mesa": 1, "SofaCama": 1, "Sillon": 1, "Armario": 1, "Cajonera": 1
+    }
+
+    tienda.realizar_venta(sofa_basico)
+    assert tienda.obtener_muebles_por_tipo(Sofa) == [sofacama]
+    assert tienda.contar_muebles_por_tipo(Asiento) == 2
+    assert tienda.obtener_muebles_por_tipo(Almacenamiento) == [armario_basico, cajonera]
+
+
+def test_tienda_obtener_muebles_por_tipo_con_las_rutas_de_main():
+    # main.py importa los modelos como "models.": todas las clases concretas
+    # deben heredar de esas mismas categorías
+    from models.categorias.almacenamiento import Almacenamiento
+    from models.categorias.asientos import Asiento
+    from models.categorias.superficies import Superficie
+    from models.concretos.armario import Armario
+    from models.concretos.cajonera import Cajonera
+    from models.concretos.escritorio import Escritorio
+    from models.concretos.silla import Silla as SillaMain
+    from models.concretos.sillon import Sillon
+    from services.tienda import TiendaMuebles
+
+    tienda = TiendaMuebles()
+    silla = SillaMain("Silla", "Madera", "Café", 50.0)
+    sillon = Sillon("Sillón", "Cuero", "Negro", 300.0)
+    armario = Armario("Armario", "Madera", "Blanco", 400.0, 200.0, 100.0, 60.0)
+    cajonera = Cajonera("Cajonera", "Madera", "Blanco", 150.0, 90.0, 50.0, 40.0)
+    escritorio = Escritorio("Escritorio", "Madera", "Negro", 250.0, 120.0, 60.0, 75.0)
+    tienda.agregar_muebles_lote([silla, sillon, armario, cajonera, escritorio])
+
+    assert tienda.obtener_muebles_por_tipo(Asiento) == [silla, sillon]
+    assert tienda.obtener_muebles_por_tipo(Almacenamiento) == [armario, cajonera]
+    assert tienda.obtener_muebles_por_tipo(Superficie) == [escritorio]
+
+
+def test_tienda_skus_estables_y_venta_en_orden(tienda_vacia, mesa_basica, sofa_basico, armario_basico):
+    tienda = tienda_vacia
+    for mueble in (mesa_basica, sofa_basico, armario_basico):
+        tienda.agregar_mueble(mueble)
+
+    sku_sofa = tienda.obtener_sku(sofa_basico)
+    sku_armario = tienda.obtener_sku(armario_basico)
+    assert tienda.obtener_sku(mesa_basica) < sku_sofa < sku_armario
+    assert tienda.obtener_por_sku(sku_sofa) is sofa_basico
+
+    venta = tienda.realizar_venta(sofa_basico)
+    assert "error" not in venta
+    assert tienda.inventario == [mesa_basica, armario_basico]
+    assert tienda.obtener_sku(sofa_basico) is None
+    assert tienda.obtener_por_sku(sku_sofa) is None
+    assert tienda.obtener_sku(armario_basico) == sku_armario
+
+    assert "error" in tienda.realizar_venta(sofa_basico)
+
+
+def test_tienda_instantanea_columnar_incremental(tienda_vacia, mesa_basica, sofa_basico, armario_basico):
+    tienda = tienda_vacia
+    tienda.agregar_mueble(mesa_basica)
+    tienda.agregar_mueble(sofa_basico)
+    columnar = tienda.instantanea_columnar()
+    assert len(columnar) == 2
+
+    tienda.agregar_mueble(armario_basico)
+    mesa_basica.precio_base = 500.0
+    tienda.realizar_venta(sofa_basico)
+
+    assert tienda.instantanea_columnar() is columnar
+    assert sorted(columnar.skus) == sorted(tienda.obtener_sku(m) for m in tienda.inventario)
+    assert columnar.valor_total() == tienda.obtener_estadisticas()["valor_inventario"]
+    assert columnar.suma_por_tipo() == {
+        "Mesa": mesa_basica.calcular_precio(),
+        "Armario": armario_basico.calcular_precio(),
+    }
+
+    reporte = tienda.generar_reporte_inventario()
+    assert "VALOR POR TIPOS" in reporte
+    assert "DISTRIBUCIÓN POR PRECIOS" in reporte
+
+
+def test_paginacion_con_cursor_es_estable_ante_ventas(tienda_vacia):
+    tienda = tienda_vacia
+    muebles = [Silla(f"Silla {i}", "Madera", "Café", 10.0 + i) for i in range(10)]
+    tienda.agregar_muebles_lote(muebles)
+
+    pagina = tienda.pagina_inventario(4)
+    assert pagina.muebles == muebles[:4] and pagina.total == 10
+    # Ventas dentro y fuera de la página siguiente, y un alta al final
+    for vendido in (muebles[3], muebles[4], muebles[6]):
+        tienda.realizar_venta(vendido)
+    nueva = Silla("Silla Nueva", "Pino", "Blanco", 5.0)
+    tienda.agregar_mueble(nueva)
+
+    pagina = tienda.pagina_inventario(4, pagina.siguiente)
+    assert pagina.muebles == [muebles[5], muebles[7], muebles[8], muebles[9]]
+    pagina = tienda.pagina_inventario(4, pagina.siguiente)
+    assert pagina.muebles == [nueva] and pagina.siguiente is None
+
+
+def test_paginacion_compacta_las_bajas_y_valida_el_cursor(tienda_vacia):
+    tienda = tienda_vacia
+    muebles = [Silla(f"Silla {i}", "Madera", "Café", 10.0) for i in range(9)]
+    tienda.agregar_muebles_lote(muebles)
+    for vendido in muebles[1:8]:
+        tienda.realizar_venta(vendido)
+
+    pagina = tienda.pagina_inventario(1)
+    assert pagina.muebles == [muebles[0]]
+    pagina = tienda.pagina_inventario(1, pagina.siguiente)
+    assert pagina.muebles == [muebles[8]] and pagina.siguiente is None
+    assert len(tienda._orden_skus) < 9
+    with pytest.raises(ValueError):
+        tienda.pagina_inventario(1, "no-es-un-cursor")
+    with pytest.raises(ValueError):
+        tienda.pagina_inventario(0)
+
+
+def test_vender_por_nombre_sigue_los_cambios_de_nombre(tienda_vacia, capsys):
+    tienda = tienda_vacia
+    sillas = [Silla("Silla Roble", "Madera", "Café", 50.0) for _ in range(3)]
+    tienda.agregar_muebles_lote(sillas)
+    sillas[0].nombre = "Silla Renombrada"
+
+    assert tienda.vender_producto("Silla Roble") is True
+    assert sillas[1] not in tienda.inventario and sillas[0] in tienda.inventario
+    assert tienda.vender_producto("Silla Roble") is True
+    assert tienda.vender_producto("Silla Roble") is False
+    assert tienda.vender_producto("Silla Renombrada") is True
+    assert tienda.inventario == []
+
+
+def test_vender_unidades_es_todo_o_nada(tienda_vacia):
+    tienda = tienda_vacia
+    sillas = [Silla("Silla Pino", "Pino", "Blanco", 40.0) for _ in range(5)]
+    tienda.agregar_muebles_lote(sillas + [Mesa("Mesa Pino", "Pino", "Blanco", 90.0)])
+
+    assert "error" in tienda.vender_unidades("Silla Pino", 6)
+    assert "error" in tienda.vender_unidades("Silla Pino", 0)
+    assert len(tienda.inventario) == 6
+
+    comprobante = tienda.vender_unidades("Silla Pino", 3, cliente="Ana")
+    assert comprobante["cantidad"] == 3 and comprobante["cliente"] == "Ana"
+    assert tienda.inventario == [sillas[3], sillas[4], tienda.inventario[2]]
+    assert tienda._total_muebles_vendidos == 3
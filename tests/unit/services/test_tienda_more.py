@@ -1,3 +1,6 @@
+import math
+
+import pytest
 from unittest.mock import Mock
 
 from src.services.tienda import TiendaMuebles
@@ -36,3 +39,112 @@ def test_vender_producto_y_acumulativos():
     # acumulativos deben reflejar la venta
     assert stats.get("total_muebles_vendidos", 0) >= 1
     assert stats.get("valor_total_ventas", 0.0) >= 0.0
+
+
+def test_estadisticas_incrementales_con_verificacion():
+    tienda = TiendaMuebles(verificar_agregados=True)
+    sillas = [Silla(f"Silla {i}", "Madera", "Café", 100.0 + i / 10) for i in range(20)]
+    for silla in sillas:
+        tienda.agregar_mueble(silla)
+
+    sillas[3].precio_base = 999.99
+    tienda.realizar_venta(sillas[0])
+    tienda.vender_producto("Silla 5")
+
+    stats = tienda.obtener_estadisticas()
+    assert stats["total_muebles"] == 18
+    assert stats["tipos_muebles"] == {"Silla": 18}
+    assert stats["valor_inventario"] == math.fsum(s.calcular_precio() for s in tienda.inventario)
+    assert tienda.estadisticas() == stats
+
+
+def test_verificacion_detecta_agregados_desfasados():
+    tienda = TiendaMuebles(verificar_agregados=True)
+    silla = Silla("Silla Desfasada", "Madera", "Café", 100.0)
+    tienda.agregar_mueble(silla)
+
+    # Modificar el atributo interno se salta el setter y la notificación
+    silla._precio_base = 200.0
+    with pytest.raises(RuntimeError):
+        tienda.obtener_estadisticas()
+
+
+def test_realizar_ventas_lote_comprobante_combinado():
+    tienda = TiendaMuebles()
+    sillas = [Silla(f"Silla Lote {i}", "Madera", "Café", 100.0) for i in range(5)]
+    for silla in sillas:
+        tienda.agregar_mueble(silla)
+    tienda.aplicar_descuento("sillas", 10)
+
+    comprobante = tienda.realizar_ventas_lote(sillas[:3], "Ana")
+
+    assert comprobante["cantidad"] == 3
+    assert comprobante["cliente"] == "Ana"
+    assert {venta["fecha"] for venta in comprobante["ventas"]} == {comprobante["fecha"]}
+    assert comprobante["precio_final"] == round(3 * 110.0 * 0.9, 2)
+    assert comprobante["descuento_total"] == round(3 * 110.0 * 0.1, 2)
+    assert tienda.inventario == sillas[3:]
+    stats = tienda.obtener_estadisticas()
+    assert stats["ventas_realizadas"] == 3
+    assert stats["valor_total_ventas"] == comprobante["precio_final"]
+
+
+def test_realizar_ventas_lote_es_todo_o_nada():
+    tienda = TiendaMuebles()
+    silla = Silla("Silla Disponible", "Madera", "Café", 100.0)
+    ajena = Silla("Silla Ajena", "Madera", "Café", 100.0)
+    tienda.agregar_mueble(silla)
+
+    assert "error" in tienda.realizar_ventas_lote([silla, ajena])
+    assert "error" in tienda.realizar_ventas_lote([silla, silla])
+    assert "error" in tienda.realizar_ventas_lote([])
+    assert tienda.inventario == [silla]
+    assert tienda.obtener_estadisticas()["ventas_realizadas"] == 0
+
+
+def test_agregar_muebles_lote_reporta_rechazados():
+    tienda = TiendaMuebles(verificar_agregados=True)
+    silla_a = Silla("Silla Lote A", "Madera", "Café", 100.0)
+    silla_b = Silla("Silla Lote B", "Metal", "Negro", 80.0)
+    gratis = Silla("Silla Gratis", "Madera", "Café", 0.0)
+    rota = Mock()
+    rota.calcular_precio.side_effect = Exception("Falla precio")
+
+    resultado = tienda.agregar_muebles_lote([silla_a, None, silla_a, rota, gratis, silla_b])
+
+    assert resultado.agregados == 2
+    assert [(pos, motivo) for pos, _, motivo in resultado.rechazados] == [
+        (1, "nulo"),
+        (2, "duplicado"),
+        (3, "error_precio"),
+        (4, "precio_invalido"),
+    ]
+    assert tienda.inventario == [silla_a, silla_b]
+    assert tienda.filtrar_por_precio() == [silla_b, silla_a]
+    assert tienda.buscar_muebles_por_nombre("lote") == [silla_a, silla_b]
+    assert tienda.filtrar_por_material("metal") == [silla_b]
+    assert tienda.obtener_estadisticas()["tipos_muebles"] == {"Silla": 2}
+
+
+def test_aplicar_descuento_resuelve_plurales_y_categorias_abstractas():
+    from src.models.concretos.sillon import Sillon
+    from src.models.concretos.sofa import Sofa
+
+    tienda = TiendaMuebles()
+    sillon = Sillon("Sillón Descuento", "Madera", "Gris", 100.0)
+    sofa = Sofa("Sofá Descuento", "Madera", "Gris", 100.0)
+    silla = Silla("Silla Descuento", "Madera", "Gris", 100.0)
+    for mueble in (sillon, sofa, silla):
+        tienda.agregar_mueble(mueble)
+
+    assert "'Sillon'" in tienda.aplicar_descuento("sillones", 10)
+    assert "'Sofa'" in tienda.aplicar_descuento("sofás", 20)
+    assert "'Asiento'" in tienda.aplicar_descuento("asientos", 5)
+
+    cotizacion = tienda.cotizar_catalogo()
+    assert cotizacion[tienda.obtener_sku(silla)] == round(silla.calcular_precio() * 0.95, 2)
+    assert cotizacion[tienda.obtener_sku(sofa)] == round(sofa.calcular_precio() * 0.8, 2)
+
+    venta = tienda.realizar_venta(sillon)
+    assert venta["descuento"] == 10.0
+    assert venta["precio_final"] == round(sillon.calcular_precio() * 0.9, 2)
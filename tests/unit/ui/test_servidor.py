@@ -0,0 +1,139 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.tienda import TiendaMuebles
+from src.ui.servidor import ServidorTienda
+
+
+@pytest.fixture
+def conexion():
+    tienda = TiendaMuebles(concurrente=True)
+    tienda.agregar_muebles_lote(
+        [
+            Silla("Silla Roble", "Madera", "Café", 100.0),
+            Silla("Silla Metal", "Metal", "Negro", 80.0),
+            Mesa("Mesa Roble", "Madera", "Natural", 300.0),
+        ]
+    )
+    servidor = ServidorTienda(("127.0.0.1", 0), tienda)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    conexion = http.client.HTTPConnection("127.0.0.1", servidor.server_port, timeout=5)
+    yield conexion
+    conexion.close()
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def _pedir(conexion, metodo, ruta, cuerpo=None, cabeceras=None):
+    datos = None if cuerpo is None else json.dumps(cuerpo)
+    conexion.request(metodo, ruta, body=datos, headers=cabeceras or {})
+    respuesta = conexion.getresponse()
+    contenido = respuesta.read()
+    return respuesta, json.loads(contenido) if contenido else None
+
+
+def test_catalogo_filtrado_y_paginado(conexion):
+    respuesta, datos = _pedir(conexion, "GET", "/muebles?nombre=roble&material=madera&por_pagina=1&pagina=2")
+    assert respuesta.status == 200
+    assert datos["total"] == 2
+    assert [m["nombre"] for m in datos["muebles"]] == ["Mesa Roble"]
+
+    respuesta, datos = _pedir(conexion, "GET", "/muebles?precio_max=90")
+    assert [m["nombre"] for m in datos["muebles"]] == ["Silla Metal"]
+
+
+def test_etag_y_conexion_persistente(conexion):
+    respuesta, _ = _pedir(conexion, "GET", "/muebles")
+    etag = respuesta.getheader("ETag")
+    respuesta, datos = _pedir(conexion, "GET", "/muebles", cabeceras={"If-None-Match": etag})
+    assert respuesta.status == 304 and datos is None
+
+    respuesta, venta = _pedir(conexion, "POST", "/ventas", {"sku": 1, "cliente": "Ana"})
+    assert respuesta.status == 201
+    assert venta["mueble"] == "Silla Roble"
+
+    respuesta, datos = _pedir(conexion, "GET", "/muebles", cabeceras={"If-None-Match": etag})
+    assert respuesta.status == 200
+    assert respuesta.getheader("ETag") != etag
+    assert datos["total"] == 2
+
+
+def test_errores_y_descuentos(conexion):
+    assert _pedir(conexion, "GET", "/muebles/99")[0].status == 404
+    assert _pedir(conexion, "GET", "/muebles?pagina=x")[0].status == 400
+    assert _pedir(conexion, "POST", "/ventas", {"skus": [1, 1]})[0].status == 409
+    assert _pedir(conexion, "POST", "/descuentos", {"categoria": "sillas", "porcentaje": 0})[0].status == 400
+
+    respuesta, datos = _pedir(conexion, "POST", "/descuentos", {"categoria": "sillas", "porcentaje": 10})
+    assert respuesta.status == 200 and "Silla" in datos["mensaje"]
+    _, venta = _pedir(conexion, "POST", "/ventas", {"skus": [2]})
+    assert venta["ventas"][0]["descuento"] == pytest.approx(10)
+    _, estadisticas = _pedir(conexion, "GET", "/estadisticas")
+    assert estadisticas["ventas_realizadas"] == 1
+
+
+def test_catalogo_con_cursor(conexion):
+    _, datos = _pedir(conexion, "GET", "/muebles?cursor=&por_pagina=2")
+    assert [m["sku"] for m in datos["muebles"]] == [1, 2]
+    _pedir(conexion, "POST", "/ventas", {"sku": 3})
+    _, datos = _pedir(conexion, "GET", f"/muebles?cursor={datos['siguiente']}&por_pagina=2")
+    assert datos["muebles"] == [] and datos["siguiente"] is None
+    assert _pedir(conexion, "GET", "/muebles?cursor=x")[0].status == 400
+    assert _pedir(conexion, "GET", "/muebles?cursor=&nombre=silla")[0].status == 400
+
+
+def test_catalogo_sin_filtros_pagina_con_cursor(conexion):
+    _, datos = _pedir(conexion, "GET", "/muebles?por_pagina=2")
+    assert [m["sku"] for m in datos["muebles"]] == [1, 2]
+    assert datos["total"] == 3 and datos["siguiente"] == "2"
+    _, datos = _pedir(conexion, "GET", f"/muebles?por_pagina=2&cursor={datos['siguiente']}")
+    assert [m["sku"] for m in datos["muebles"]] == [3] and datos["siguiente"] is None
+    assert _pedir(conexion, "GET", "/muebles?pagina=2")[0].status == 400
+
+
+@pytest.mark.parametrize(
+    "cabeceras, estado",
+    [
+        ({}, 411),
+        ({"Content-Length": "-1"}, 400),
+        ({"Content-Length": "x"}, 400),
+        ({"Content-Length": str(10**9)}, 413),
+    ],
+)
+def test_valida_content_length_sin_leer_el_cuerpo(conexion, cabeceras, estado):
+    conexion.putrequest("POST", "/ventas")
+    for nombre, valor in cabeceras.items():
+        conexion.putheader(nombre, valor)
+    conexion.endheaders()
+    respuesta = conexion.getresponse()
+    assert respuesta.status == estado
+    assert "error" in json.loads(respuesta.read())
+    assert respuesta.getheader("Connection") == "close"
+
+
+def test_error_inesperado_responde_500_y_conserva_la_conexion(monkeypatch):
+    tienda = TiendaMuebles(concurrente=True)
+    tienda.agregar_mueble(Silla("Silla Roble", "Madera", "Café", 100.0))
+
+    def fallar():
+        raise RuntimeError("almacén no disponible")
+
+    monkeypatch.setattr(tienda, "obtener_estadisticas", fallar)
+    servidor = ServidorTienda(("127.0.0.1", 0), tienda)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    conexion = http.client.HTTPConnection("127.0.0.1", servidor.server_port, timeout=5)
+    try:
+        respuesta, datos = _pedir(conexion, "GET", "/estadisticas")
+        assert respuesta.status == 500
+        assert datos == {"error": "Error interno del servidor"}
+        assert _pedir(conexion, "GET", "/muebles/1")[0].status == 200
+    finally:
+        conexion.close()
+        servidor.shutdown()
+        servidor.server_close()